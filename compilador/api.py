@@ -0,0 +1,121 @@
+# api.py
+
+"""
+API del compilador para usarlo como biblioteca.
+
+    from api import compile_source
+
+    result = compile_source(texto)
+    if result.ok:
+        codigo = result.code
+    else:
+        for d in result.diagnostics:
+            print(d)
+
+compile_source() ejecuta las fases del driver sobre un texto en memoria.
+No escribe en la consola ni en archivos, no llama a sys.exit y no dibuja
+nada; lo que las fases imprimirían (errores léxicos, sintácticos y
+semánticos, avisos del traductor) se devuelve como Diagnostic.
+
+Es reentrante y se puede llamar desde varios hilos a la vez: cada llamada
+crea su propio lexer, parser y traductor, y el resto del estado del
+compilador (tabla LL(1), walkers, patrones del lexer) es de sólo lectura.
+La instrumentación (tracing, profiling, trace_events) vive en variables
+de contexto; compile_source() compila en un contexto nuevo, así que nunca
+ve ni modifica las trazas o el perfilado que haya activado quien la llama.
+"""
+
+import contextvars
+from typing import List, NamedTuple, Optional
+
+from ast_semantic import Program, ast_actions
+from lexer2 import make_lexer
+from parser2 import TableDrivenParser
+from source import SourceFile
+from symbols import SymbolTable
+from translator import Translator
+
+# Fases, en el orden en que se ejecutan
+PHASES = ('léxico', 'sintáctico', 'semántico', 'traducción')
+
+
+class Diagnostic(NamedTuple):
+    phase: str      # uno de PHASES
+    severity: str   # 'error' o 'warning'
+    message: str
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class CompileResult(NamedTuple):
+    code: Optional[str]             # Python generado (None si hubo errores)
+    ast: Optional[Program]          # AST (None si el parse falló)
+    tokens: Optional[list]          # tokens del lexer, incluido EOF
+    diagnostics: List[Diagnostic]
+    lexer_runs: int                 # veces que se tokenizó el fuente (1: las fases comparten los tokens)
+
+    @property
+    def ok(self) -> bool:
+        return self.code is not None
+
+    @property
+    def errors(self) -> List[Diagnostic]:
+        return [d for d in self.diagnostics if d.severity == 'error']
+
+    @property
+    def warnings(self) -> List[Diagnostic]:
+        return [d for d in self.diagnostics if d.severity == 'warning']
+
+
+def compile_source(text: str, name: str = '<texto>', lexer_engine: str = 'char',
+                   trace_render: Optional[str] = None) -> CompileResult:
+    """
+    Compila `text` (código fuente .vid) y devuelve tokens, AST, código y
+    diagnósticos. Las fases se detienen en la primera que falla, como en
+    el driver. `name` sólo identifica el fuente.
+    """
+    # Contexto vacío: instrumentación desactivada sea cual sea la del llamador
+    return contextvars.Context().run(_compile, text, name, lexer_engine, trace_render)
+
+
+def _compile(text: str, name: str, lexer_engine: str, trace_render: Optional[str]) -> CompileResult:
+    diagnostics: List[Diagnostic] = []
+
+    lexer = make_lexer(SourceFile.from_text(text, name), lexer_engine)
+    lexers = [lexer]
+
+    def result(code: Optional[str], ast: Optional[Program]) -> CompileResult:
+        return CompileResult(code, ast, tokens, diagnostics, sum(l.runs for l in lexers))
+
+    tokens = lexer.tokenize()
+    if lexer.errors:
+        diagnostics.extend(Diagnostic('léxico', 'error', e) for e in lexer.errors)
+        return result(None, None)
+
+    parser = TableDrivenParser(tokens=tokens)
+    if parser.lexer is not None:
+        lexers.append(parser.lexer)
+    try:
+        ast = parser.parse_actions(ast_actions(parser.token_access))
+    except Exception as e:
+        # El parser se recupera de los errores y los informa todos, uno por línea
+        diagnostics.extend(Diagnostic('sintáctico', 'error', err) for err in str(e).split("\n"))
+        return result(None, None)
+
+    try:
+        ast.check_semantic(SymbolTable())
+    except Exception as e:
+        diagnostics.extend(Diagnostic('semántico', 'error', err) for err in str(e).split("\n"))
+        return result(None, ast)
+
+    translator = Translator(trace_render)
+    code = failure = None
+    try:
+        code = translator.translate(ast)
+    except Exception as e:
+        failure = f"Error durante la traducción: {e}"
+    diagnostics.extend(Diagnostic('traducción', 'warning', w) for w in translator.warnings)
+    if failure is not None:
+        diagnostics.append(Diagnostic('traducción', 'error', failure))
+    return result(code, ast)
@@ -5,147 +5,272 @@ Versión **sin soporte para @extraer_audio**
 
 • Eliminado `TokenType.VIDEO_EXTRAER_AUDIO` del conjunto `VIDEO_FUNC_TOKENS`.
 • VideoFuncCall.infer_type devuelve siempre "video".
+• El dibujo del AST (ast.png) es opcional (--emit-ast): graphviz sólo se
+  importa al pedirlo.
 """
 
+import argparse
 import sys
 
-from graphviz import Digraph
-from parser2 import TableDrivenParser
+from parser2 import TableDrivenParser, BufferLeaf
 
 from enums import TokenType
+from source import SourceFile
+from symbols import AUDIO, LOGICAL, NUMERIC, STRING, UNKNOWN, VIDEO, SymbolTable, type_tag
+from tokenbuf import TOKEN_FIELDS
+from visitor import TreeWalker, preorder
+import profiling
+import trace_events
+import tracing
 
 
 class ASTNode:
     # ─────────────────── Nodos AST ───────────────────
-    """Nodo base abstracto"""
+    """
+    Nodo base abstracto. El análisis semántico (_SemanticPass) recorre cada
+    nodo una sola vez y lo anota: las expresiones con su etiqueta de tipo
+    (`type`, de symbols) y las referencias a variables con el id del
+    símbolo resuelto (`symbol`). El traductor usa esas anotaciones.
+    """
 
-    pass
+    __slots__ = ()
+
+    def operands(self):
+        """Subexpresiones, que se analizan antes que el propio nodo."""
+        return ()
+
+    def blocks(self):
+        """Bloques de sentencias anidados, cada uno con su propio ámbito."""
+        return ()
+
+    def resolve(self, st):
+        """Chequeos previos a los operandos (p.ej. que la variable esté declarada)."""
+
+    def analyze(self, types, st):
+        """Chequeo del nodo con los tipos de sus operandos; devuelve su tipo (None en sentencias)."""
+        return None
+
+    def check_semantic(self, st=None):
+        st = SymbolTable.of(st)
+        depth = st.depth
+        try:
+            _SemanticPass(st).walk(self)
+        finally:
+            # Si el chequeo aborta dentro de un bloque, sus ámbitos siguen abiertos
+            st.pop_to(depth)
+
+
+class Expr(ASTNode):
+    """
+    Expresión: `type` es su etiqueta de tipo una vez analizada (None antes).
+    Cada subclase define analyze(), que devuelve su tipo y lo anota en `type`.
+    """
+
+    __slots__ = ("type",)
+
+    def infer_type(self, st):
+        if self.type is not None:
+            return self.type
+        return TYPE_INFERENCE.walk(self, st)
 
 
 class Program(ASTNode):
+    __slots__ = ("statements",)
+
     def __init__(self, statements):
         self.statements = statements
 
-    def check_semantic(self, st):
+    def check_semantic(self, st=None):
+        st = SymbolTable.of(st)
+        analysis = _SemanticPass(st)
         errors = []
         for stmt in self.statements:
+            depth = st.depth
             try:
-                if hasattr(stmt, "check_semantic"):
-                    stmt.check_semantic(st)
+                with trace_events.statement_span(stmt, "semantic"):
+                    analysis.walk(stmt)
             except Exception as exc:
+                st.pop_to(depth)
                 errors.append(str(exc))
                 if isinstance(stmt, VarDecl):
-                    st[stmt.name] = stmt.var_type  # evitar cascada
+                    stmt.symbol = st.declare(stmt.name, stmt.var_type)  # evitar cascada
         if errors:
             raise Exception("\n".join(errors))
 
 
 class VarDecl(ASTNode):
+    __slots__ = ("var_type", "name", "init", "line", "col", "symbol")
+
     def __init__(self, var_type, name, init, line, col):
-        self.var_type = var_type
+        self.var_type = type_tag(var_type)
         self.name = name
         self.init = init
         self.line = line
         self.col = col
+        self.symbol = None
+
+    def operands(self):
+        return (self.init,) if self.init else ()
 
-    def check_semantic(self, st):
-        if self.init:
-            et = self.init.infer_type(st)
+    def analyze(self, types, st):
+        if types:
+            (et,) = types
             if (
-                not (self.var_type in ("video", "audio") and et == "string")
-                and et != self.var_type
+                not (self.var_type in (VIDEO, AUDIO) and et is STRING)
+                and et is not self.var_type
             ):
                 raise TypeError(
                     f"Error semántico en línea {self.line}, columna {self.col}: "
                     f"no se puede asignar '{et}' a variable '{self.name}' de tipo '{self.var_type}'"
                 )
-        st[self.name] = self.var_type
+        self.symbol = st.declare(self.name, self.var_type)
 
 
 class Assignment(ASTNode):
+    __slots__ = ("name", "expr", "line", "col", "symbol")
+
     def __init__(self, name, expr, line, col):
         self.name = name
         self.expr = expr
         self.line = line
         self.col = col
+        self.symbol = None
 
-    def check_semantic(self, st):
-        if self.name not in st:
+    def operands(self):
+        return (self.expr,)
+
+    def resolve(self, st):
+        self.symbol, _ = st.resolve(self.name)
+        if self.symbol is None:
             raise NameError(
                 f"Error semántico en línea {self.line}, columna {self.col}: variable no declarada '{self.name}'"
             )
-        et = self.expr.infer_type(st)
-        if et != st[self.name]:
+
+    def analyze(self, types, st):
+        (et,) = types
+        var_type = st.lookup_id(self.symbol)
+        if et is not var_type:
             raise TypeError(
                 f"Error semántico en línea {self.line}, columna {self.col}: "
-                f"no se puede asignar '{et}' a variable '{self.name}' de tipo '{st[self.name]}'"
+                f"no se puede asignar '{et}' a variable '{self.name}' de tipo '{var_type}'"
             )
 
 
 class ExportStmt(ASTNode):
+    # `type`: tipo de la variable exportada (video o audio)
+    __slots__ = ("name", "out_file", "line", "col", "symbol", "type")
+
     def __init__(self, name, out_file, line, col):
         self.name = name
         self.out_file = out_file
         self.line = line
         self.col = col
+        self.symbol = None
+        self.type = None
 
-    def check_semantic(self, st):
-        if self.name not in st:
+    def resolve(self, st):
+        self.symbol, self.type = st.resolve(self.name)
+        if self.symbol is None:
             raise NameError(
                 f"Error semántico en línea {self.line}, columna {self.col}: variable no declarada '{self.name}'"
             )
 
 
-class BinaryOp(ASTNode):
+class BinaryOp(Expr):
+    __slots__ = ("op", "left", "right", "line", "col")
+
     def __init__(self, op, left, right, line, col):
         self.op = op
         self.left = left
         self.right = right
         self.line = line
         self.col = col
+        self.type = None
 
-    def infer_type(self, st):
-        lt = self.left.infer_type(st)
-        rt = self.right.infer_type(st)
-        if lt != rt or lt not in {"int", "float"}:
+    def operands(self):
+        return (self.left, self.right)
+
+    def analyze(self, types, st):
+        lt, rt = types
+        if lt is not rt or lt not in NUMERIC:
             raise TypeError(
                 f"Error semántico en línea {self.line}, columna {self.col}: "
                 f"operación '{self.op}' no válida entre '{lt}' y '{rt}'"
             )
+        self.type = lt
         return lt
 
 
-class Literal(ASTNode):
+class UnaryOp(Expr):
+    __slots__ = ("op", "operand", "line", "col")
+
+    def __init__(self, op, operand, line, col):
+        self.op = op
+        self.operand = operand
+        self.line = line
+        self.col = col
+        self.type = None
+
+    def operands(self):
+        return (self.operand,)
+
+    def analyze(self, types, st):
+        (t,) = types
+        allowed = NUMERIC if self.op == "-" else LOGICAL
+        if t not in allowed:
+            raise TypeError(
+                f"Error semántico en línea {self.line}, columna {self.col}: "
+                f"operación '{self.op}' no válida sobre '{t}'"
+            )
+        self.type = t
+        return t
+
+
+class Literal(Expr):
+    __slots__ = ("value", "lit_type")
+
     def __init__(self, value, lit_type):
         self.value = value
         self.lit_type = lit_type
+        self.type = type_tag(lit_type)
+
+    def analyze(self, types, st):
+        return self.type
 
-    def infer_type(self, st):
-        return self.lit_type
 
+class Identifier(Expr):
+    __slots__ = ("name", "symbol")
 
-class Identifier(ASTNode):
     def __init__(self, name):
         self.name = name
+        self.symbol = None
+        self.type = None
 
-    def infer_type(self, st):
-        return st.get(self.name, "unknown")
+    def analyze(self, types, st):
+        self.symbol, var_type = st.resolve(self.name)
+        self.type = UNKNOWN if var_type is None else var_type
+        return self.type
 
 
-class VideoFuncCall(ASTNode):
+class VideoFuncCall(Expr):
     """Nodo para cualquier @función de vídeo (sin @extraer_audio)."""
 
+    __slots__ = ("func", "args", "line", "col")
+
     def __init__(self, func_token, args, line, col):
         self.func = func_token.value
         self.args = args
         self.line = line
         self.col = col
+        self.type = VIDEO
 
-    def infer_type(self, st):
-        return "video"
+    def analyze(self, types, st):
+        return self.type
 
 
 class IfStmt(ASTNode):
+    __slots__ = ("condition", "then_block", "else_block", "line", "col")
+
     def __init__(self, condition, then_block, else_block, line, col):
         self.condition = condition
         self.then_block = then_block
@@ -153,61 +278,134 @@ class IfStmt(ASTNode):
         self.line = line
         self.col = col
 
-    def check_semantic(self, st):
+    def operands(self):
+        return (self.condition,)
+
+    def check_condition(self):
         # Check that condition is boolean
-        cond_type = self.condition.infer_type(st)
-        if cond_type not in {"bool", "int"}:  # Allow int for flexibility
+        cond_type = self.condition.type
+        if cond_type not in LOGICAL:  # Allow int for flexibility
             raise TypeError(
                 f"Error semántico en línea {self.line}, columna {self.col}: "
                 f"la condición debe ser de tipo 'bool' o 'int', no '{cond_type}'"
             )
-        # Check both blocks with their own scope
-        then_st = st.copy()
-        for stmt in self.then_block:
-            if hasattr(stmt, "check_semantic"):
-                stmt.check_semantic(then_st)
+
+    def blocks(self):
+        # Both blocks are checked with their own scope
         if self.else_block:
-            else_st = st.copy()
-            for stmt in self.else_block:
-                if hasattr(stmt, "check_semantic"):
-                    stmt.check_semantic(else_st)
+            return (self.then_block, self.else_block)
+        return (self.then_block,)
 
 
 class WhileStmt(ASTNode):
+    __slots__ = ("condition", "body", "line", "col")
+
     def __init__(self, condition, body, line, col):
         self.condition = condition
         self.body = body
         self.line = line
         self.col = col
 
-    def check_semantic(self, st):
-        # Check that condition is boolean
-        cond_type = self.condition.infer_type(st)
-        if cond_type not in {"bool", "int"}:  # Allow int for flexibility
-            raise TypeError(
-                f"Error semántico en línea {self.line}, columna {self.col}: "
-                f"la condición debe ser de tipo 'bool' o 'int', no '{cond_type}'"
-            )
-        # Check body with its own scope
-        body_st = st.copy()
-        for stmt in self.body:
-            if hasattr(stmt, "check_semantic"):
-                stmt.check_semantic(body_st)
+    def operands(self):
+        return (self.condition,)
+
+    check_condition = IfStmt.check_condition
+
+    def blocks(self):
+        # Body is checked with its own scope
+        return (self.body,)
+
+
+def ast_children(node):
+    """Hijos de un nodo del AST: sentencias, bloques anidados y subexpresiones."""
+    if isinstance(node, Program):
+        return node.statements
+    if isinstance(node, VarDecl):
+        return [node.init] if node.init else []
+    if isinstance(node, Assignment):
+        return [node.expr]
+    if isinstance(node, (IfStmt, WhileStmt)):
+        children = [node.condition]
+        for block in node.blocks():
+            children.extend(block)
+        return children
+    if isinstance(node, VideoFuncCall):
+        return node.args
+    return node.operands()
+
+
+def count_nodes(ast):
+    """Número de nodos del AST."""
+    return sum(1 for _ in preorder(ast, ast_children))
+
+
+# ─────────────────── Chequeo semántico ───────────────────
+class _TypeInference(TreeWalker):
+    """infer_type de abajo arriba: cada nodo combina los tipos de sus operandos."""
+
+    def children(self, node):
+        return node.operands()
+
+    def leave(self, node, st, types):
+        return node.analyze(types, st)
+
+
+class _SemanticPass(TreeWalker):
+    """
+    Análisis semántico de una sentencia en una sola pasada, en el orden de
+    un recorrido recursivo: resolve() al llegar a cada nodo, después sus
+    operandos, analyze() con los tipos de éstos (las expresiones anotan el
+    suyo en `type`) y por último sus bloques. Cada bloque abre un ámbito
+    de la SymbolTable al entrar y lo cierra al salir; antes de abrirlo se
+    comprueba la condición del if/while, que ya tiene su tipo anotado.
+    El contexto de cada nodo es su padre.
+    """
+
+    def __init__(self, st):
+        self.st = st
+
+    def children(self, node):
+        if type(node) is list:
+            return node
+        return node.operands() + node.blocks()
+
+    def enter(self, node, parent):
+        if type(node) is list:
+            parent.check_condition()
+            self.st.push()
+        else:
+            node.resolve(self.st)
+        return node
+
+    def leave(self, node, parent, types):
+        if type(node) is list:
+            self.st.pop()
+            return None
+        return node.analyze(types, self.st)
+
+
+TYPE_INFERENCE = _TypeInference()
 
 
 # ─────────────────── Construcción del AST ───────────────────
 def build_ast(pt_root):
     block = pt_root.children[1]  # MAIN Block EOF
     stmtlist = block.children[1]  # lista de sentencias
-    return Program(_collect_statements(stmtlist))
+    program = Program(_collect_statements(stmtlist))
+    if tracing.AST.info:
+        tracing.AST.write(f"AST construido: {len(program.statements)} sentencias de primer nivel")
+    return program
 
 
 def _collect_statements(node):
-    if not node.children:
-        return []
-    first = _build_statement(node.children[0])
-    rest = _collect_statements(node.children[1])
-    return ([first] if first else []) + rest
+    # StmtList -> Stmt StmtList | ε: se sigue la cadena en un bucle
+    statements = []
+    while node.children:
+        stmt = _build_statement(node.children[0])
+        if stmt:
+            statements.append(stmt)
+        node = node.children[1]
+    return statements
 
 
 def build_block(block_node):
@@ -280,241 +478,371 @@ VIDEO_FUNC_TOKENS = {
 }
 
 
-def build_expr(node):
-    if node.symbol == "FunctionCall":
-        return _build_function_call(node)
-
-    tokens = _flatten_tokens(node)
-    if any(tok.type in VIDEO_FUNC_TOKENS for tok in tokens):
-        fc = _find_function_call(node)
-        if fc:
-            return _build_function_call(fc)
-
-    return _shunting_yard(tokens)
+# Precedencia de los operadores binarios (todos asociativos por la izquierda)
+BINARY_PRECEDENCE = {
+    TokenType.MULT: 3,
+    TokenType.DIV: 3,
+    TokenType.PLUS: 2,
+    TokenType.MINUS: 2,
+    TokenType.LT: 1,
+    TokenType.LE: 1,
+    TokenType.GT: 1,
+    TokenType.GE: 1,
+    TokenType.EQ: 1,
+    TokenType.NEQ: 1,
+    TokenType.AND: 0,
+    TokenType.OR: 0,
+}
+# Los operadores prefijos (not, - unario) ligan más que cualquier binario
+UNARY_PRECEDENCE = 4
+UNARY_OPS = {TokenType.NOT, TokenType.MINUS}
+
+LITERAL_TYPES = {
+    TokenType.INT_LITERAL: "int",
+    TokenType.FLOAT_LITERAL: "float",
+    TokenType.STRING_LITERAL: "string",
+}
 
 
-def _find_function_call(node):
-    if node.symbol == "FunctionCall":
-        return node
-    for ch in node.children:
-        res = _find_function_call(ch)
-        if res:
-            return res
-    return None
+def build_expr(node):
+    return parse_expression(_flatten_tokens(node), _token_access(node))
 
 
 def _flatten_tokens(node):
+    # Las hojas de un TokenBuffer aportan su índice en lugar de un Token
     out = []
-    if hasattr(node, "token") and node.token:
-        out.append(node.token)
-    for ch in node.children:
-        out.extend(_flatten_tokens(ch))
+    for leaf in preorder(node):
+        if isinstance(leaf, BufferLeaf):
+            if leaf.index >= 0:
+                out.append(leaf.index)
+        elif leaf.token:
+            out.append(leaf.token)
     return out
 
 
-def _extract_exprs(node):
-    if node.symbol == "Expr":
-        return [node]
-    acc = []
-    for ch in node.children:
-        acc.extend(_extract_exprs(ch))
-    return acc
-
-
-def _build_function_call(fc_node):
-    children = fc_node.children
-    func_tok = children[0].token
-    args_pt = children[2]
-    arg_asts = []
-    # arg_asts = [build_expr(e) for e in _extract_exprs(args_pt)]
-
-    # children_token_values = [ch.token.value for ch in children]
-    children_token_values = []
-
-    print(f"{func_tok=}", file=sys.stderr)
-    print(f"{children=}", file=sys.stderr)
-    for i in range(len(children)):
-        if getattr(children[i], "token", None) and getattr(
-            children[i].token, "value", None
-        ):
-            children_token_values.append(children[i].token.value)
+def _token_access(node):
+    """Accesores para lo que devuelve _flatten_tokens(node): el TokenBuffer
+    del que salen las hojas, o TOKEN_FIELDS si son objetos Token."""
+    while node.children:
+        node = node.children[0]
+    return node.buffer if isinstance(node, BufferLeaf) else TOKEN_FIELDS
 
-    print(f"{children_token_values=}", file=sys.stderr)
-    children2 = args_pt.children
-    children2_token_values = []
-    for i in range(len(children2)):
-        if getattr(children2[i], "token", None) and getattr(
-            children2[i].token, "value", None
-        ):
-            children2_token_values.append(children2[i].token.value)
 
-    print(f"{args_pt.children=}", file=sys.stderr)
-    print(f"{children2_token_values=}", file=sys.stderr)
-    print(f"{_extract_exprs(args_pt)=}", file=sys.stderr)
+def parse_expression(tokens, access=TOKEN_FIELDS):
+    """
+    Construye el AST de una expresión a partir de su secuencia plana de
+    tokens (objetos Token, o índices de un TokenBuffer pasado como
+    `access`) en una sola pasada.
+    """
+    if not tokens:
+        return None
+    parser = _ExprParser(tokens, access)
+    expr = parser.expression(0)
+    if parser.pos < len(tokens):
+        parser.unexpected()
+    return expr
+
+
+class _ExprParser:
+    """
+    Parser Pratt (precedence climbing): cada operador binario de
+    BINARY_PRECEDENCE continúa la expresión izquierda mientras su
+    precedencia no sea menor que la mínima pedida; not y - unario, los
+    paréntesis y las llamadas @función[...] son prefijos.
+    """
+
+    __slots__ = ("tokens", "access", "pos")
+
+    def __init__(self, tokens, access):
+        self.tokens = tokens
+        self.access = access
+        self.pos = 0
+
+    def expression(self, min_prec):
+        tokens, access = self.tokens, self.access
+        left = self.prefix()
+        while self.pos < len(tokens):
+            op = tokens[self.pos]
+            prec = BINARY_PRECEDENCE.get(access.type(op))
+            if prec is None or prec < min_prec:
+                break
+            self.pos += 1
+            right = self.expression(prec + 1)
+            left = BinaryOp(access.value(op), left, right, *access.position(op))
+        return left
+
+    def prefix(self):
+        access = self.access
+        tok = self.next()
+        tok_type = access.type(tok)
+        if tok_type in LITERAL_TYPES:
+            return Literal(access.value(tok), LITERAL_TYPES[tok_type])
+        if tok_type == TokenType.IDENTIFIER:
+            return Identifier(access.value(tok))
+        if tok_type == TokenType.LPAREN:
+            expr = self.expression(0)
+            self.expect(TokenType.RPAREN)
+            return expr
+        if tok_type in UNARY_OPS:
+            operand = self.expression(UNARY_PRECEDENCE)
+            return UnaryOp(access.value(tok), operand, *access.position(tok))
+        if tok_type in VIDEO_FUNC_TOKENS:
+            self.expect(TokenType.LBRACKET)
+            args = []
+            if self.peek_type() != TokenType.RBRACKET:
+                args.append(self.expression(0))
+                while self.peek_type() == TokenType.COMMA:
+                    self.pos += 1
+                    args.append(self.expression(0))
+            self.expect(TokenType.RBRACKET)
+            if tracing.AST.debug:
+                ln, col = access.position(tok)
+                tracing.AST.write(f"llamada {access.value(tok)} con {len(args)} argumento(s) "
+                                  f"en línea {ln}, columna {col}")
+            return VideoFuncCall(access.token(tok), args, *access.position(tok))
+        self.pos -= 1
+        self.unexpected()
+
+    def next(self):
+        if self.pos >= len(self.tokens):
+            tok = self.tokens[-1]
+            ln, col = self.access.position(tok)
+            raise SyntaxError(
+                f"Error sintáctico en línea {ln}, columna {col}: expresión incompleta"
+            )
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok
 
-    for e in args_pt.children:
-        # for e in _extract_exprs(args_pt):
-        print(f"{e=}", file=sys.stderr)
+    def peek_type(self):
+        if self.pos < len(self.tokens):
+            return self.access.type(self.tokens[self.pos])
+        return None
 
-        if e.symbol != TokenType.COMMA:
-            arg_asts.append(build_expr(e))
-            # print(f"----->COMMA DETECTED", file=sys.stderr)
+    def expect(self, tok_type):
+        tok = self.next()
+        if self.access.type(tok) != tok_type:
+            self.pos -= 1
+            self.unexpected()
+
+    def unexpected(self):
+        tok = self.tokens[self.pos]
+        ln, col = self.access.position(tok)
+        raise SyntaxError(
+            f"Error sintáctico en línea {ln}, columna {col}: "
+            f"token inesperado '{self.access.type(tok).name}' en la expresión"
+        )
 
-        # if node.TokenType != TokenType.COMMA :
-    print(f"", file=sys.stderr)
 
-    return VideoFuncCall(func_tok, arg_asts, func_tok.line, func_tok.column)
+# ─────────────────── AST durante el parse ───────────────────
+def ast_actions(access=TOKEN_FIELDS):
+    """
+    Acciones semánticas para TableDrivenParser.parse_actions: construyen el
+    mismo AST que build_ast sobre el parse tree, pero sin crear el árbol.
+    `access` es parser.token_access (los terminales llegan como Tokens o
+    como índices de un TokenBuffer). Los no-terminales de expresión y
+    StmtList no tienen acción: sus terminales llegan planos a la acción
+    de la sentencia o bloque que los contiene, que construye cada
+    expresión con parse_expression.
+    """
+    position = access.position
+
+    def expr(values):
+        return parse_expression(values, access)
+
+    def program(values):  # MAIN Block EOF
+        if tracing.AST.info:
+            tracing.AST.write(f"AST construido: {len(values[1])} sentencias de primer nivel")
+        return Program(values[1])
+
+    def block(values):  # LBRACE StmtList RBRACE
+        return values[1:-1]
+
+    def stmt(values):
+        # Todas las alternativas de Stmt empiezan por la sentencia; el resto
+        # es el SEMICOLON de VarDecl, Assignment y ExportStmt
+        return values[0]
+
+    def var_decl(values):  # Type COLON IDENTIFIER VarInitOpt
+        type_tok, _, ident, init = values
+        vtype = access.type(type_tok).name.replace("_TYPE", "").lower()
+        return VarDecl(vtype, access.value(ident), init, *position(ident))
+
+    def var_init(values):  # ASSIGN Expr | ε
+        return expr(values[1:]) if values else None
+
+    def assignment(values):  # IDENTIFIER ASSIGN Expr
+        ident = values[0]
+        return Assignment(access.value(ident), expr(values[2:]), *position(ident))
+
+    def export_stmt(values):  # EXPORT IDENTIFIER AS STRING_LITERAL
+        exp_tok, name_tok, _, out_tok = values
+        return ExportStmt(access.value(name_tok), access.value(out_tok), *position(exp_tok))
+
+    def if_stmt(values):  # IF LPAREN Expr RPAREN Block ElseOpt
+        return IfStmt(expr(values[2:-3]), values[-2], values[-1], *position(values[0]))
+
+    def else_opt(values):  # ELSE Block | ε
+        return values[1] if values else None
+
+    def while_stmt(values):  # WHILE LPAREN Expr RPAREN Block
+        return WhileStmt(expr(values[2:-2]), values[-1], *position(values[0]))
+
+    return {
+        "Program": program,
+        "Block": block,
+        "Stmt": stmt,
+        "VarDecl": var_decl,
+        "VarInitOpt": var_init,
+        "Assignment": assignment,
+        "ExportStmt": export_stmt,
+        "IfStmt": if_stmt,
+        "ElseOpt": else_opt,
+        "WhileStmt": while_stmt,
+    }
 
 
-# Algoritmo shunting-yard (operadores normales)
-def _shunting_yard(tokens):
-    if not tokens:
-        return None
+def parse_ast(parser, verbose=False):
+    """Parsea y devuelve directamente el AST (Program), sin parse tree."""
+    return parser.parse_actions(ast_actions(parser.token_access), verbose=verbose)
 
-    output, ops = [], []
-    prec = {
-        TokenType.MULT: 3,
-        TokenType.DIV: 3,
-        TokenType.PLUS: 2,
-        TokenType.MINUS: 2,
-        TokenType.LT: 1,
-        TokenType.LE: 1,
-        TokenType.GT: 1,
-        TokenType.GE: 1,
-        TokenType.EQ: 1,
-        TokenType.NEQ: 1,
-        TokenType.AND: 0,
-        TokenType.OR: 0,
-    }
-    binops = set(prec)
-
-    def pop():
-        op = ops.pop()
-        r, l = output.pop(), output.pop()
-        output.append(BinaryOp(op.value, l, r, op.line, op.column))
-
-    for tok in tokens:
-        if tok.type == TokenType.INT_LITERAL:
-            output.append(Literal(tok.value, "int"))
-        elif tok.type == TokenType.FLOAT_LITERAL:
-            output.append(Literal(tok.value, "float"))
-        elif tok.type == TokenType.STRING_LITERAL:
-            output.append(Literal(tok.value, "string"))
-        elif tok.type == TokenType.IDENTIFIER:
-            output.append(Identifier(tok.value))
-        elif tok.type == TokenType.LPAREN:
-            ops.append(tok)
-        elif tok.type == TokenType.RPAREN:
-            while ops and ops[-1].type != TokenType.LPAREN:
-                pop()
-            if ops:
-                ops.pop()
-        elif tok.type in binops:
-            while (
-                ops and ops[-1].type in binops and prec[ops[-1].type] >= prec[tok.type]
-            ):
-                pop()
-            ops.append(tok)
 
-    while ops:
-        pop()
+# ─────────────────── Visualización ───────────────────
+class _Group:
+    """Nodo auxiliar del dibujo que agrupa un bloque (ThenBlock, ElseBlock, BodyBlock)."""
 
-    return output[-1] if output else None
+    __slots__ = ("uid", "label", "statements")
 
+    def __init__(self, uid, label, statements):
+        self.uid = uid
+        self.label = label
+        self.statements = statements
 
-# ─────────────────── Visualización ───────────────────
-def visualize_ast(ast, fname="ast"):
-    dot = Digraph("AST", format="png")
 
-    def walk(n, parent=None):
-        uid = str(id(n))
-        label = n.__class__.__name__
-        if isinstance(n, VarDecl):
-            label += f"\\n{n.name}:{n.var_type}"
-        elif isinstance(n, Identifier):
-            label += f"\\n{n.name}"
-        elif isinstance(n, Literal):
-            label += f"\\n{n.value}"
-        elif isinstance(n, BinaryOp):
-            label += f"\\n{n.op}"
-        elif isinstance(n, VideoFuncCall):
-            label += f"\\n{n.func}"
-        dot.node(uid, label)
+class _AstGraph(TreeWalker):
+    """Vuelca el AST en un Digraph; el contexto de cada nodo es el uid de su padre."""
+
+    def __init__(self, dot):
+        self.dot = dot
+
+    def enter(self, n, parent):
+        if isinstance(n, _Group):
+            uid, label = n.uid, n.label
+        else:
+            uid = str(id(n))
+            label = n.__class__.__name__
+            if isinstance(n, VarDecl):
+                label += f"\\n{n.name}:{n.var_type}"
+            elif isinstance(n, Identifier):
+                label += f"\\n{n.name}"
+            elif isinstance(n, Literal):
+                label += f"\\n{n.value}"
+            elif isinstance(n, BinaryOp):
+                label += f"\\n{n.op}"
+            elif isinstance(n, UnaryOp):
+                label += f"\\n{n.op}"
+            elif isinstance(n, VideoFuncCall):
+                label += f"\\n{n.func}"
+        self.dot.node(uid, label)
         if parent:
-            dot.edge(parent, uid)
+            self.dot.edge(parent, uid)
+        return uid
 
-        children = []
+    def children(self, n):
+        if isinstance(n, _Group):
+            return n.statements
         if isinstance(n, Program):
-            children = n.statements
-        elif isinstance(n, VarDecl) and n.init:
-            children = [n.init]
-        elif isinstance(n, Assignment):
-            children = [n.expr]
-        elif isinstance(n, BinaryOp):
-            children = [n.left, n.right]
-        elif isinstance(n, VideoFuncCall):
-            children = n.args
-        elif isinstance(n, IfStmt):
-            children = [n.condition]
-            # Create a "ThenBlock" node for better visualization
+            return n.statements
+        if isinstance(n, VarDecl) and n.init:
+            return [n.init]
+        if isinstance(n, Assignment):
+            return [n.expr]
+        if isinstance(n, BinaryOp):
+            return [n.left, n.right]
+        if isinstance(n, UnaryOp):
+            return [n.operand]
+        if isinstance(n, VideoFuncCall):
+            return n.args
+        if isinstance(n, IfStmt):
+            # Los bloques cuelgan de nodos "ThenBlock"/"ElseBlock" y se
+            # dibujan antes que la condición
+            groups = []
             if n.then_block:
-                then_uid = str(id(n)) + "_then"
-                dot.node(then_uid, "ThenBlock")
-                dot.edge(uid, then_uid)
-                for stmt in n.then_block:
-                    walk(stmt, then_uid)
-            # Create an "ElseBlock" node for better visualization
+                groups.append(_Group(str(id(n)) + "_then", "ThenBlock", n.then_block))
             if n.else_block:
-                else_uid = str(id(n)) + "_else"
-                dot.node(else_uid, "ElseBlock")
-                dot.edge(uid, else_uid)
-                for stmt in n.else_block:
-                    walk(stmt, else_uid)
-        elif isinstance(n, WhileStmt):
-            children = [n.condition]
-            # Create a "BodyBlock" node for better visualization
+                groups.append(_Group(str(id(n)) + "_else", "ElseBlock", n.else_block))
+            return groups + [n.condition]
+        if isinstance(n, WhileStmt):
             if n.body:
-                body_uid = str(id(n)) + "_body"
-                dot.node(body_uid, "BodyBlock")
-                dot.edge(uid, body_uid)
-                for stmt in n.body:
-                    walk(stmt, body_uid)
+                return [_Group(str(id(n)) + "_body", "BodyBlock", n.body), n.condition]
+            return [n.condition]
+        return ()
+
 
-        for ch in children:
-            walk(ch, uid)
+def visualize_ast(ast, fname="ast"):
+    # graphviz sólo se importa si se pide el dibujo (--emit-ast)
+    from graphviz import Digraph
 
-    walk(ast)
+    dot = Digraph("AST", format="png")
+    _AstGraph(dot).walk(ast)
     dot.render(fname, cleanup=True)
     print(f"AST visualizado en {fname}.png")
 
 
 # ─────────────────── Main ───────────────────
-def main():
-    if len(sys.argv) != 2:
-        print("Uso: python ast_semantic.py <archivo_fuente>")
-        sys.exit(1)
-
-    source = open(sys.argv[1], encoding="utf-8").read()
-    parser = TableDrivenParser(source)
-
+def run_semantic(pt, visualize=False):
+    """
+    Construye el AST a partir del parse tree, ejecuta el chequeo semántico
+    y, con `visualize`, dibuja el AST. Devuelve (ast, código de salida de la fase).
+    """
+    with profiling.phase('build_ast') as stats:
+        ast = build_ast(pt)
+    if stats is not None:
+        stats.nodes = count_nodes(ast)
+    return check_ast(ast, visualize)
+
+
+def check_ast(ast, visualize=False):
+    """Chequeo semántico (y visualización con `visualize`) de un AST ya construido."""
+    st = SymbolTable()
     try:
-        pt = parser.parse(verbose=False)
-    except Exception as e:
-        print(e)
-        sys.exit(1)
-
-    ast = build_ast(pt)
-    st = {}
-    try:
-        ast.check_semantic(st)
+        with profiling.phase('check_semantic') as stats:
+            ast.check_semantic(st)
     except Exception as e:
         print("\n--- ERRORES SEMÁNTICOS ---")
         for err in str(e).split("\n"):
             print("  -", err)
-        sys.exit(1)
+        return ast, 1
+
+    if stats is not None:
+        stats.nodes = count_nodes(ast)
 
+    if not visualize:
+        print("Análisis semántico OK.")
+        return ast, 0
     print("Análisis semántico OK. Generando AST…")
-    visualize_ast(ast)
+    with profiling.phase('visualize_ast'):
+        visualize_ast(ast)
+    return ast, 0
+
+
+def main():
+    ap = argparse.ArgumentParser(prog='ast_semantic.py', description='Análisis semántico de un archivo fuente.')
+    ap.add_argument('fuente', metavar='archivo_fuente')
+    ap.add_argument('--emit-ast', action='store_true', help="dibujar el AST en ast.png")
+    args = ap.parse_args()
+
+    with SourceFile.open(args.fuente) as source:
+        parser = TableDrivenParser(source)
+
+        try:
+            pt = parser.parse(verbose=False)
+        except Exception as e:
+            print(e)
+            sys.exit(1)
+
+        _, code = run_semantic(pt, visualize=args.emit_ast)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# batch.py
+
+"""
+Compilación por lotes: muchos archivos .vid en paralelo.
+
+Recibe archivos o patrones glob (con ** recursivo) y reparte los fuentes
+entre los procesos de un ProcessPoolExecutor. Cada proceso importa el
+compilador una sola vez, al arrancar, y compila todos los archivos que
+le tocan. Cada fuente se compila igual que con ejecutar_compilador.py
+sin opciones (sin parsetree.png ni ast.png). El código generado se
+escribe junto al fuente, con el mismo nombre y extensión .py.
+
+La salida de las fases se captura. Por cada archivo se muestra su estado
+(ok, caché o ERROR con el mensaje de la fase que falló), y al final el
+total de archivos, bytes/s y archivos/s. Termina con código 1 si algún
+archivo falla.
+
+Uso: python batch.py [-j N] [--lexer char|regex] [--no-cache] [--cache-dir DIR]
+                     [-v] archivo_o_patrón...
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, NamedTuple, Optional
+
+from cache import CompileCache
+from ejecutar_compilador import Compilacion
+from lexer2 import LEXER_ENGINES
+
+# Caché de cada proceso (la crea init_worker)
+_CACHE: Optional[CompileCache] = None
+
+
+class FileResult(NamedTuple):
+    fuente: str
+    salida: str
+    ok: bool
+    cached: bool
+    seconds: float
+    size: int
+    message: str
+    log: str
+
+
+def expand_sources(patterns: List[str]) -> List[str]:
+    """Archivos de los patrones, sin repetir y en orden. Un patrón sin coincidencias se
+    conserva tal cual, para que su compilación informe de que no existe."""
+    seen = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for path in matches or [pattern]:
+            if not os.path.isdir(path):
+                seen.setdefault(path, None)
+    return list(seen)
+
+
+def output_path(fuente: str) -> str:
+    """Ruta del código generado: junto al fuente, con extensión .py."""
+    return os.path.splitext(fuente)[0] + '.py'
+
+
+def init_worker(cache_dir: Optional[str], use_cache: bool) -> None:
+    global _CACHE
+    _CACHE = CompileCache(cache_dir) if use_cache else None
+
+
+def compile_file(fuente: str, lexer_engine: str = 'char') -> FileResult:
+    """Compila `fuente` en este proceso capturando la salida de las fases."""
+    salida = output_path(fuente)
+    compilacion = Compilacion(fuente, salida, lexer_engine, cache=_CACHE)
+    log = io.StringIO()
+    ok, cached, message = True, False, ''
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        try:
+            cached = compilacion.consultar_cache()
+            if not cached:
+                for nombre, fase in compilacion.fases():
+                    if fase() != 0:
+                        ok = False
+                        lines = [l.strip() for l in log.getvalue().splitlines() if l.strip()]
+                        message = f"{nombre}: {lines[-1] if lines else 'error'}"
+                        break
+                else:
+                    compilacion.guardar_cache()
+        except Exception as e:
+            ok, message = False, f"{type(e).__name__}: {e}"
+        finally:
+            compilacion.cerrar()
+    seconds = time.perf_counter() - t0
+    try:
+        size = os.path.getsize(fuente)
+    except OSError:
+        size = 0
+    return FileResult(fuente, salida, ok, cached, seconds, size, message, log.getvalue())
+
+
+def report(result: FileResult, verbose: bool) -> None:
+    if not result.ok:
+        print(f"  ERROR  {result.fuente}: {result.message}")
+    else:
+        estado = 'caché' if result.cached else 'ok'
+        print(f"  {estado:<6} {result.fuente} -> {result.salida} ({result.seconds * 1e3:.1f} ms)")
+    if verbose and result.log.strip():
+        for line in result.log.rstrip().splitlines():
+            print(f"         | {line}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog='batch.py', description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('fuentes', metavar='archivo_o_patrón', nargs='+')
+    ap.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                    help="procesos en paralelo (por defecto: número de CPUs)")
+    ap.add_argument('--lexer', choices=sorted(LEXER_ENGINES), default='char',
+                    help="motor del lexer (por defecto: char)")
+    ap.add_argument('--no-cache', dest='cache', action='store_false',
+                    help="no consultar ni actualizar la caché de compilaciones")
+    ap.add_argument('--cache-dir', metavar='DIR',
+                    help="directorio de la caché (por defecto: $VID_CACHE_DIR o ~/.cache/compilador-vid)")
+    ap.add_argument('-v', '--verbose', action='store_true',
+                    help="mostrar la salida de las fases de cada archivo")
+    args = ap.parse_args()
+    if args.jobs < 1:
+        ap.error("--jobs debe ser al menos 1")
+
+    fuentes = expand_sources(args.fuentes)
+    if not fuentes:
+        ap.error("ningún archivo coincide con los patrones")
+    jobs = min(args.jobs, len(fuentes))
+    print(f"Compilando {len(fuentes)} archivos con {jobs} procesos")
+
+    results = []
+    t0 = time.perf_counter()
+    if jobs == 1:
+        # Sin pool: se ahorra el arranque de un proceso
+        init_worker(args.cache_dir, args.cache)
+        for fuente in fuentes:
+            results.append(compile_file(fuente, args.lexer))
+            report(results[-1], args.verbose)
+    else:
+        with ProcessPoolExecutor(jobs, initializer=init_worker,
+                                 initargs=(args.cache_dir, args.cache)) as pool:
+            futures = [pool.submit(compile_file, fuente, args.lexer) for fuente in fuentes]
+            for future in as_completed(futures):
+                results.append(future.result())
+                report(results[-1], args.verbose)
+    elapsed = time.perf_counter() - t0
+
+    failed = sum(1 for r in results if not r.ok)
+    cached = sum(1 for r in results if r.cached)
+    total_bytes = sum(r.size for r in results)
+    print(f"\n{len(results)} archivos: {len(results) - failed} correctos "
+          f"({cached} de la caché), {failed} con errores")
+    print(f"{elapsed:.2f} s: {len(results) / elapsed:.1f} archivos/s, "
+          f"{total_bytes / elapsed / 1024:.1f} KB/s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
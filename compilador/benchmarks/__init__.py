@@ -0,0 +1,6 @@
+"""
+Benchmarks del compilador.
+
+Se ejecutan desde el directorio compilador/, p.ej.:
+    python -m benchmarks.bench_lexer
+"""
@@ -0,0 +1,65 @@
+"""
+Construcción del AST: parse tree + build_ast frente a acciones semánticas
+durante el parse (parse_ast), sin parse tree.
+
+Para cada camino mide el tiempo y, con tracemalloc, el pico de memoria
+durante la construcción (tokens ya en memoria, no se cuentan).
+
+Uso: python -m benchmarks.bench_ast [--mb N]
+"""
+
+import argparse
+import contextlib
+import os
+import time
+import tracemalloc
+
+from ast_semantic import build_ast, parse_ast
+from benchmarks.bench_lexer import build_source
+from lexer2 import make_lexer
+from parser2 import TableDrivenParser
+
+
+def via_parse_tree(tokens):
+    # _build_function_call escribe trazas de depuración en stderr
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stderr(devnull):
+        return build_ast(TableDrivenParser(tokens=tokens).parse(verbose=False))
+
+
+def via_actions(tokens):
+    return parse_ast(TableDrivenParser(tokens=tokens))
+
+
+def measure(build, tokens):
+    """Devuelve (segundos, MB pico)."""
+    t0 = time.perf_counter()
+    build(tokens)
+    secs = time.perf_counter() - t0
+    tracemalloc.start()
+    build(tokens)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return secs, peak / 1024 / 1024
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--mb', type=float, default=0.5, help='tamaño del fuente en MB (por defecto: 0.5)')
+    args = ap.parse_args()
+
+    tokens = make_lexer(build_source(args.mb), 'regex').tokenize()
+    print(f"Tokens: {len(tokens):,}")
+    print(f"  {'camino':<22} {'tiempo':>9} {'pico':>10}")
+    results = []
+    for label, build in (('parse tree + build_ast', via_parse_tree), ('acciones (parse_ast)', via_actions)):
+        secs, peak = measure(build, tokens)
+        results.append((secs, peak))
+        print(f"  {label:<22} {secs:8.2f}s {peak:9.1f}M")
+
+    (tree_secs, tree_peak), (act_secs, act_peak) = results
+    print(f"Acciones frente a parse tree: {tree_secs / act_secs:.1f}x más rápido, "
+          f"{tree_peak / act_peak:.1f}x menos memoria pico")
+
+
+if __name__ == '__main__':
+    main()
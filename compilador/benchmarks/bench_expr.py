@@ -0,0 +1,98 @@
+"""
+Escalado de la construcción de expresiones (parse_expression, Pratt).
+
+Genera programas con una sola expresión cada vez más grande y mide el
+tiempo de parse + AST (con acciones y con parse tree + build_ast):
+
+  anidada   ((((a + 1) * 2) - 3) ...)      paréntesis anidados
+  derecha   a + (a + (a + ...))            anidamiento por la derecha
+  unaria    - not - not ... a              cadena de operadores prefijos
+  plana     a + b * c - ... (n operandos)  sin anidamiento
+
+Para cada forma ajusta el exponente de crecimiento t ~ n^k (k ≈ 1 es
+lineal). El anidamiento está acotado por la recursión de Python: cada
+nivel de paréntesis son dos llamadas del parser de expresiones.
+
+Uso: python -m benchmarks.bench_expr [--max-depth N] [--max-ops N]
+"""
+
+import argparse
+import math
+import sys
+import time
+
+from ast_semantic import build_ast, parse_ast
+from lexer2 import make_lexer
+from parser2 import TableDrivenParser
+
+OPS = ['+', '*', '-', '/', '<', '==', 'and', 'or']
+
+
+def nested(n: int) -> str:
+    expr = 'a'
+    for i in range(n):
+        expr = f"({expr} {OPS[i % 4]} {i})"
+    return expr
+
+
+def right(n: int) -> str:
+    return '(a + ' * n + 'a' + ')' * n
+
+
+def unary(n: int) -> str:
+    return ' '.join('-' if i % 2 else 'not' for i in range(n)) + ' a'
+
+
+def flat(n: int) -> str:
+    return ' '.join(f"v{i} {OPS[i % len(OPS)]}" for i in range(n)) + ' a'
+
+
+SHAPES = {'anidada': nested, 'derecha': right, 'unaria': unary, 'plana': flat}
+
+
+def best_time(build, tokens, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        build(tokens)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def exponent(points) -> float:
+    """Pendiente de la recta de mínimos cuadrados en escala log-log."""
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    return (sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+            / sum((x - mx) ** 2 for x in xs))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--max-depth', type=int, default=400,
+                    help='anidamiento máximo de las formas anidadas (por defecto: 400)')
+    ap.add_argument('--max-ops', type=int, default=40000,
+                    help='operandos máximos de la forma plana (por defecto: 40000)')
+    args = ap.parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * args.max_depth))
+
+    paths = {
+        'acciones': lambda toks: parse_ast(TableDrivenParser(tokens=toks)),
+        'parse tree': lambda toks: build_ast(TableDrivenParser(tokens=toks).parse(verbose=False)),
+    }
+    for shape, make in SHAPES.items():
+        top = args.max_ops if shape == 'plana' else args.max_depth
+        sizes = [top // 8, top // 4, top // 2, top]
+        print(f"{shape}:")
+        for label, build in paths.items():
+            points = []
+            for n in sizes:
+                tokens = make_lexer(f"main {{ int: x = {make(n)}; }}", 'regex').tokenize()
+                points.append((n, best_time(build, tokens)))
+            cells = '  '.join(f"n={n}: {t * 1e3:7.1f} ms" for n, t in points)
+            print(f"  {label:<10} {cells}  exponente {exponent(points):.2f}")
+
+
+if __name__ == '__main__':
+    main()
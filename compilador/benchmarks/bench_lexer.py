@@ -0,0 +1,58 @@
+"""
+Compara los motores del lexer ('char' y 'regex') sobre un fuente .vid de
+varios megabytes construido repitiendo prueba2.txt.
+
+Uso: python -m benchmarks.bench_lexer [--mb N] [--repeat R]
+"""
+
+import argparse
+import os
+import time
+
+from lexer2 import LEXER_ENGINES, make_lexer
+
+SAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'prueba2.txt')
+
+
+def build_source(megabytes: float) -> str:
+    """Repite el cuerpo de prueba2.txt hasta alcanzar el tamaño pedido."""
+    sample = open(SAMPLE, encoding='utf-8').read()
+    body = sample[sample.index('{') + 1:sample.rindex('}')]
+    copies = max(1, int(megabytes * 1024 * 1024 / len(body.encode('utf-8'))))
+    return 'main {' + body * copies + '}\n'
+
+
+def time_engine(engine: str, src: str, repeat: int):
+    """Devuelve (mejor tiempo, tokens, errores) de `repeat` ejecuciones."""
+    best = float('inf')
+    for _ in range(repeat):
+        lexer = make_lexer(src, engine)
+        t0 = time.perf_counter()
+        tokens = lexer.tokenize()
+        best = min(best, time.perf_counter() - t0)
+    return best, tokens, lexer.errors
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--mb', type=float, default=4.0, help='tamaño del fuente en MB (por defecto: 4)')
+    ap.add_argument('--repeat', type=int, default=3, help='repeticiones por motor (por defecto: 3)')
+    args = ap.parse_args()
+
+    src = build_source(args.mb)
+    print(f"Fuente: {len(src.encode('utf-8')) / 1e6:.1f} MB, {src.count(chr(10))} líneas")
+
+    results = {}
+    for engine in sorted(LEXER_ENGINES):
+        results[engine] = time_engine(engine, src, args.repeat)
+        secs, tokens, _ = results[engine]
+        print(f"  {engine:<6} {secs:8.3f} s  {len(tokens) / secs:12,.0f} tokens/s")
+
+    (_, ref_tokens, ref_errors), (_, tokens, errors) = results['char'], results['regex']
+    if tokens != ref_tokens or errors != ref_errors:
+        raise SystemExit("ERROR: los motores producen tokens o errores distintos")
+    print(f"Tokens idénticos; aceleración regex/char: {results['char'][0] / results['regex'][0]:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
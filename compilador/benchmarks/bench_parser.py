@@ -0,0 +1,54 @@
+"""
+Velocidad del parser LL(1) en pasos por segundo.
+
+Un paso es un símbolo desapilado (MATCH de un terminal o EXPAND de un
+no-terminal), es decir, un nodo del parse tree completo. El fuente se
+tokeniza una sola vez; sólo se cronometra TableDrivenParser.parse, con y
+sin construcción del árbol.
+
+Uso: python -m benchmarks.bench_parser [--mb N] [--repeat R]
+"""
+
+import argparse
+import time
+
+from benchmarks.bench_lexer import build_source
+from lexer2 import make_lexer
+from parser2 import TableDrivenParser
+
+
+def count_steps(root) -> int:
+    steps, pending = 0, [root]
+    while pending:
+        node = pending.pop()
+        steps += 1
+        pending.extend(node.children)
+    return steps
+
+
+def time_parse(tokens, build_tree: bool, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        parser = TableDrivenParser(tokens=tokens)
+        t0 = time.perf_counter()
+        parser.parse(verbose=False, build_tree=build_tree)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--mb', type=float, default=1.0, help='tamaño del fuente en MB (por defecto: 1)')
+    ap.add_argument('--repeat', type=int, default=3, help='repeticiones por modo (por defecto: 3)')
+    args = ap.parse_args()
+
+    tokens = make_lexer(build_source(args.mb), 'regex').tokenize()
+    steps = count_steps(TableDrivenParser(tokens=tokens).parse(verbose=False))
+    print(f"Tokens: {len(tokens):,}  pasos del parser: {steps:,}")
+    for label, build_tree in (('sólo validación', False), ('con parse tree', True)):
+        secs = time_parse(tokens, build_tree, args.repeat)
+        print(f"  {label:<16} {secs:8.3f} s  {steps / secs:12,.0f} pasos/s")
+
+
+if __name__ == '__main__':
+    main()
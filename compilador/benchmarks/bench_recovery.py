@@ -0,0 +1,85 @@
+"""
+Recuperación de errores del parser LL(1) sobre un programa grande.
+
+Genera un programa válido (benchmarks.generate), le introduce `errors`
+errores repartidos por el fuente (un ';' que falta, un operando que
+falta o un ':' que falta en una declaración) y mide:
+
+  - el parse del programa válido con y sin recuperación (debe costar lo
+    mismo: la recuperación sólo se ejecuta cuando hay un error);
+  - un único parse del programa con errores, y cuántos de ellos informa;
+  - el parse sin recuperación, que se detiene en el primero.
+
+Uso: python -m benchmarks.bench_recovery [--statements N] [--errors E]
+         [--repeat R] [--seed S]
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.generate import generate_program
+from lexer2 import make_lexer
+from parser2 import TableDrivenParser
+
+
+def inject_errors(src: str, errors: int, seed: int = 0) -> str:
+    """`src` con `errors` líneas estropeadas, cada una en una sentencia distinta."""
+    lines = src.splitlines()
+    candidates = [i for i, line in enumerate(lines) if line.endswith(';') and ' = ' in line]
+    rnd = random.Random(seed)
+    for i in sorted(rnd.sample(candidates, min(errors, len(candidates)))):
+        line = lines[i]
+        kind = rnd.randrange(3)
+        if kind == 0:
+            lines[i] = line[:-1]
+        elif kind == 1:
+            lines[i] = line.replace(' = ', ' = * ', 1)
+        elif ': ' in line:
+            lines[i] = line.replace(': ', ' ', 1)
+        else:
+            lines[i] = line[:-1]
+    return '\n'.join(lines) + '\n'
+
+
+def time_parse(tokens, recover: bool, repeat: int):
+    """(mejor tiempo, errores recogidos) de parsear `tokens`."""
+    best, errors = float('inf'), 0
+    for _ in range(repeat):
+        parser = TableDrivenParser(tokens=tokens, recover=recover)
+        t0 = time.perf_counter()
+        try:
+            parser.parse(build_tree=False)
+        except SyntaxError:
+            pass
+        best = min(best, time.perf_counter() - t0)
+        errors = len(parser.errors)
+    return best, errors
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--statements', type=int, default=20000, help='sentencias del programa (por defecto: 20000)')
+    ap.add_argument('--errors', type=int, default=100, help='errores a introducir (por defecto: 100)')
+    ap.add_argument('--repeat', type=int, default=3, help='repeticiones (por defecto: 3)')
+    ap.add_argument('--seed', type=int, default=0)
+    args = ap.parse_args()
+
+    src = generate_program(args.statements, seed=args.seed)
+    good = make_lexer(src, 'char').tokenize()
+    bad = make_lexer(inject_errors(src, args.errors, args.seed), 'char').tokenize()
+    print(f"{len(src.splitlines()):,} líneas, {len(good):,} tokens, {args.errors} errores introducidos")
+
+    plain, _ = time_parse(good, False, args.repeat)
+    recovering, _ = time_parse(good, True, args.repeat)
+    print(f"  sin errores, sin recuperación    {plain * 1e3:8.1f} ms")
+    print(f"  sin errores, con recuperación    {recovering * 1e3:8.1f} ms   x{recovering / plain:.3f}")
+
+    first, _ = time_parse(bad, False, args.repeat)
+    everything, found = time_parse(bad, True, args.repeat)
+    print(f"  con errores, hasta el primero    {first * 1e3:8.1f} ms   1 error")
+    print(f"  con errores, recuperándose       {everything * 1e3:8.1f} ms   {found} errores informados")
+
+
+if __name__ == '__main__':
+    main()
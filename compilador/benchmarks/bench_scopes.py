@@ -0,0 +1,101 @@
+"""
+Coste de los ámbitos del chequeo semántico: bloques if/while anidados
+hasta `depth` niveles después de un conjunto grande de declaraciones.
+
+Compara Program.check_semantic con:
+
+  chained  SymbolTable (symbols.py): push/pop O(1) por bloque
+  copy     la tabla anterior, un dict copiado entero en cada bloque,
+           reproducida aquí como subclase de SymbolTable
+
+Con la copia el coste crece con (variables visibles) × (bloques); con
+los ámbitos encadenados sólo con el tamaño del programa. Las expresiones
+de las declaraciones son cortas, para que pese sobre todo el manejo de
+ámbitos, y el recolector de basura se desactiva mientras se mide.
+
+Uso: python -m benchmarks.bench_scopes [--decls 250,1000,4000] [--depths 8,32,128,256]
+         [--repeat R]
+"""
+
+import argparse
+import gc
+
+from ast_semantic import build_ast
+from benchmarks.bench_suite import best_time
+from benchmarks.generate import generate_nested
+from lexer2 import make_lexer
+from parser2 import TableDrivenParser
+from symbols import SymbolTable
+
+
+class CopyingTable(SymbolTable):
+    """Semántica del dict anterior: cada ámbito es una copia completa."""
+
+    __slots__ = ('scope', 'saved')
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.scope = {}
+        self.saved = []
+
+    @property
+    def depth(self) -> int:
+        return len(self.saved)
+
+    def push(self) -> None:
+        self.saved.append(self.scope)
+        self.scope = self.scope.copy()
+
+    def pop(self) -> None:
+        self.scope = self.saved.pop()
+
+    def pop_to(self, depth: int) -> None:
+        while len(self.saved) > depth:
+            self.pop()
+
+    def declare(self, name: str, var_type: str) -> int:
+        sym = self.intern(name)
+        self.scope[sym] = var_type
+        return sym
+
+    def resolve(self, name: str):
+        sym = self.ids.get(name)
+        return (sym, self.scope[sym]) if sym in self.scope else (None, None)
+
+    def lookup_id(self, sym: int):
+        return self.scope.get(sym)
+
+    def lookup(self, name: str, default=None):
+        sym, var_type = self.resolve(name)
+        return default if sym is None else var_type
+
+TABLES = (('chained', SymbolTable), ('copy', CopyingTable))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--decls', default='250,1000,4000',
+                    help='grupos de declaraciones de primer nivel (3 variables cada uno)')
+    ap.add_argument('--depths', default='8,32,128,256', help='niveles de anidamiento')
+    ap.add_argument('--repeat', type=int, default=5, help='repeticiones (por defecto: 5)')
+    args = ap.parse_args()
+
+    print(f"{'decl.':>6} {'niveles':>7} " + ' '.join(f"{name:>11}" for name, _ in TABLES) + "   copy/chained")
+    for decls in (int(d) for d in args.decls.split(',')):
+        for depth in (int(d) for d in args.depths.split(',')):
+            src = generate_nested(depth, expr_terms=2, declarations=decls)
+            ast = build_ast(TableDrivenParser(tokens=make_lexer(src, 'regex').tokenize()).parse())
+            times = {}
+            gc.collect()
+            gc.disable()
+            try:
+                for name, table in TABLES:
+                    times[name], _ = best_time(lambda: ast.check_semantic(table()), args.repeat)
+            finally:
+                gc.enable()
+            print(f"{decls:>6} {depth:>7} " + ' '.join(f"{times[name] * 1e3:8.2f} ms" for name, _ in TABLES)
+                  + f"   x{times['copy'] / times['chained']:6.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Escalado de la construcción del AST con el número de sentencias.
+
+Genera programas de n sentencias (declaraciones, asignaciones e ifs
+alternados, hasta 100k por defecto) y mide:
+
+  build_ast   sólo la conversión parse tree -> AST (el árbol se construye
+              antes, fuera del cronómetro)
+  parse_ast   parse con acciones semánticas, sin parse tree
+
+Para cada camino ajusta el exponente de crecimiento t ~ n^k; con la lista
+de sentencias construida en un bucle debe quedar k ≈ 1.
+
+Uso: python -m benchmarks.bench_statements [--max-stmts N] [--repeat R]
+"""
+
+import argparse
+import time
+
+from ast_semantic import build_ast, parse_ast
+from benchmarks.bench_expr import exponent
+from lexer2 import make_lexer
+from parser2 import TableDrivenParser
+
+STATEMENTS = (
+    "int: x{i} = {i} * 2 + 1;",
+    "x{i} = x{i} - 1;",
+    "if (x{i} < 10) {{ x{i} = 0; }}",
+)
+
+
+def build_program(n: int) -> str:
+    lines = ["main {"]
+    for i in range(n):
+        # Cada variable se declara antes de usarse
+        lines.append("  " + STATEMENTS[i % 3].format(i=i - i % 3))
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def best_time(run, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        best = min(best, run())
+    return best
+
+
+def time_build_ast(tokens) -> float:
+    tree = TableDrivenParser(tokens=tokens).parse(verbose=False)
+    t0 = time.perf_counter()
+    build_ast(tree)
+    return time.perf_counter() - t0
+
+
+def time_parse_ast(tokens) -> float:
+    parser = TableDrivenParser(tokens=tokens)
+    t0 = time.perf_counter()
+    parse_ast(parser)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--max-stmts', type=int, default=100_000,
+                    help='sentencias del programa más grande (por defecto: 100000)')
+    ap.add_argument('--repeat', type=int, default=3, help='repeticiones por tamaño (por defecto: 3)')
+    args = ap.parse_args()
+
+    top = args.max_stmts
+    sizes = [top // 8, top // 4, top // 2, top]
+    programs = {n: make_lexer(build_program(n), 'regex').tokenize() for n in sizes}
+    for label, timer in (('build_ast', time_build_ast), ('parse_ast', time_parse_ast)):
+        points = [(n, best_time(lambda: timer(programs[n]), args.repeat)) for n in sizes]
+        cells = '  '.join(f"n={n}: {t * 1e3:7.1f} ms" for n, t in points)
+        print(f"  {label:<10} {cells}  exponente {exponent(points):.2f}")
+
+
+if __name__ == '__main__':
+    main()
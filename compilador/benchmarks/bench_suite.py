@@ -0,0 +1,159 @@
+"""
+Benchmark por fases del compilador sobre programas sintéticos
+(benchmarks.generate) de varios tamaños.
+
+Fases: Lexer.tokenize, TableDrivenParser.parse (con parse tree),
+build_ast, Program.check_semantic y Translator.translate. Cada fase se
+mide sobre la salida ya construida de la anterior, y se guarda el mejor
+tiempo de `repeat` ejecuciones.
+
+Los resultados se guardan como JSON (--save) con una entrada por
+(tamaño, fase). --compare los contrasta con una línea base anterior:
+la razón es tiempo actual / tiempo base (< 1 es más rápido).
+
+Uso: python -m benchmarks.bench_suite [--sizes 1000,4000,16000] [--depth D]
+         [--repeat R] [--lexer char|regex] [--save out.json] [--compare base.json]
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import time
+
+from ast_semantic import build_ast, count_nodes
+from benchmarks.generate import generate_program
+from lexer2 import LEXER_ENGINES, make_lexer
+from parser2 import TableDrivenParser
+from symbols import SymbolTable
+from translator import Translator
+from visitor import preorder
+
+FORMAT_VERSION = 1
+
+
+def best_time(run, repeat: int, min_time: float = 0.0):
+    """
+    Devuelve (mejor tiempo por ejecución, resultado de la última ejecución).
+    Con `min_time`, cada una de las `repeat` muestras ejecuta `run` las
+    veces necesarias para durar al menos esos segundos (como
+    timeit.autorange); las muestras más cortas sólo sirven para calibrar.
+    """
+    number = 1
+    best, result = float('inf'), None
+    samples = 0
+    while samples < repeat:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            result = run()
+        elapsed = time.perf_counter() - t0
+        if elapsed < min_time:
+            number *= 2
+            continue
+        best = min(best, elapsed / number)
+        samples += 1
+    return best, result
+
+
+def run_phases(src: str, engine: str, repeat: int, min_time: float = 0.0) -> dict:
+    """Mide las fases sobre `src`; devuelve {fase: {seconds, tokens, nodes}}."""
+    results = {}
+
+    def record(phase, secs, nodes=None):
+        results[phase] = {
+            'seconds': secs,
+            'tokens': n_tokens,
+            'tokens_per_s': n_tokens / secs,
+            'nodes': nodes,
+            'nodes_per_s': nodes / secs if nodes else None,
+        }
+
+    secs, tokens = best_time(lambda: make_lexer(src, engine).tokenize(), repeat, min_time)
+    n_tokens = len(tokens)
+    record('Lexer.tokenize', secs)
+
+    secs, tree = best_time(lambda: TableDrivenParser(tokens=tokens).parse(), repeat, min_time)
+    record('TableDrivenParser.parse', secs, sum(1 for _ in preorder(tree)))
+
+    secs, ast = best_time(lambda: build_ast(tree), repeat, min_time)
+    n_nodes = count_nodes(ast)
+    record('build_ast', secs, n_nodes)
+
+    secs, _ = best_time(lambda: ast.check_semantic(SymbolTable()), repeat, min_time)
+    record('Program.check_semantic', secs, n_nodes)
+
+    secs, _ = best_time(lambda: Translator().translate(ast), repeat, min_time)
+    record('Translator.translate', secs, n_nodes)
+    return results
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Muestra la razón tiempo actual / tiempo base por tamaño y fase."""
+    print(f"\nComparación con la línea base ({baseline['meta'].get('date', '?')}):")
+    for size, phases in current['results'].items():
+        base_phases = baseline['results'].get(size)
+        if base_phases is None:
+            print(f"  n={size}: sin datos en la línea base")
+            continue
+        for phase, entry in phases.items():
+            base = base_phases.get(phase)
+            if base is None:
+                continue
+            ratio = entry['seconds'] / base['seconds']
+            mark = '  más lento' if ratio > 1.1 else ('  más rápido' if ratio < 0.9 else '')
+            print(f"  n={size:<7} {phase:<24} {base['seconds'] * 1e3:9.1f} ms -> "
+                  f"{entry['seconds'] * 1e3:9.1f} ms  x{ratio:5.2f}{mark}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--sizes', default='1000,4000,16000',
+                    help='sentencias de cada programa, separadas por comas (por defecto: 1000,4000,16000)')
+    ap.add_argument('--depth', type=int, default=3, help='anidamiento if/while (por defecto: 3)')
+    ap.add_argument('--seed', type=int, default=0, help='semilla del generador (por defecto: 0)')
+    ap.add_argument('--repeat', type=int, default=3, help='repeticiones por fase (por defecto: 3)')
+    ap.add_argument('--lexer', choices=sorted(LEXER_ENGINES), default='regex',
+                    help='motor del lexer (por defecto: regex)')
+    ap.add_argument('--save', metavar='JSON', help='guardar los resultados como línea base')
+    ap.add_argument('--compare', metavar='JSON', help='comparar con una línea base guardada')
+    args = ap.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    report = {
+        'format': FORMAT_VERSION,
+        'meta': {
+            'date': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'lexer': args.lexer,
+            'depth': args.depth,
+            'seed': args.seed,
+            'repeat': args.repeat,
+        },
+        'results': {},
+    }
+    for n in sizes:
+        src = generate_program(n, args.depth, seed=args.seed)
+        phases = run_phases(src, args.lexer, args.repeat)
+        report['results'][str(n)] = phases
+        first = next(iter(phases.values()))
+        print(f"n={n} ({len(src.encode('utf-8')):,} bytes, {first['tokens']:,} tokens)")
+        for phase, entry in phases.items():
+            nodes = f"{entry['nodes_per_s']:12,.0f} nodos/s" if entry['nodes_per_s'] else ''
+            print(f"  {phase:<24} {entry['seconds'] * 1e3:9.1f} ms {entry['tokens_per_s']:12,.0f} tokens/s {nodes}".rstrip())
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\nResultados guardados en {args.save}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('format') != FORMAT_VERSION:
+            raise SystemExit(f"ERROR: {args.compare} no tiene el formato {FORMAT_VERSION}")
+        compare(report, baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Memoria de la lista de Token frente a TokenBuffer (struct-of-arrays).
+
+Para cada representación mide, con tracemalloc, la memoria retenida tras
+tokenizar y el pico durante la tokenización y durante un parse de sólo
+validación (build_tree=False) que consume esos tokens.
+
+Uso: python -m benchmarks.bench_tokens [--mb N] [--lexer char|regex]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.bench_lexer import build_source
+from lexer2 import LEXER_ENGINES, make_lexer
+from parser2 import TableDrivenParser
+from source import SourceFile
+from tokenbuf import TokenBuffer
+
+
+def build_list(source, engine):
+    return make_lexer(source, engine).tokenize()
+
+
+def build_buffer(source, engine):
+    return TokenBuffer.from_lexer(make_lexer(source, engine))
+
+
+def measure(build, source, engine):
+    """Devuelve (tokens, segundos, MB retenidos, MB pico, MB pico del parse)."""
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    tokens = build(source, engine)
+    secs = time.perf_counter() - t0
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    TableDrivenParser(tokens=tokens).parse(verbose=False, build_tree=False)
+    _, parse_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    mb = 1024 * 1024
+    return tokens, secs, retained / mb, peak / mb, parse_peak / mb
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--mb', type=float, default=2.0, help='tamaño del fuente en MB (por defecto: 2)')
+    ap.add_argument('--lexer', choices=sorted(LEXER_ENGINES), default='regex',
+                    help='motor del lexer (por defecto: regex)')
+    args = ap.parse_args()
+
+    with tempfile.NamedTemporaryFile('w', suffix='.vid', encoding='utf-8', delete=False) as f:
+        f.write(build_source(args.mb))
+    try:
+        source = SourceFile.open(f.name)
+        print(f"Fuente: {len(source) / 1e6:.1f} MB (mmap), lexer {args.lexer}")
+        print(f"  {'almacén':<12} {'tokens':>10} {'tiempo':>9} {'retenido':>10} {'pico':>10} {'pico parse':>11}")
+        for name, build in (('List[Token]', build_list), ('TokenBuffer', build_buffer)):
+            tokens, secs, retained, peak, parse_peak = measure(build, source, args.lexer)
+            print(f"  {name:<12} {len(tokens):>10,} {secs:8.2f}s {retained:9.1f}M {peak:9.1f}M {parse_peak:10.1f}M")
+            # Sólo se mantiene viva una representación a la vez
+            del tokens
+
+        buf = build_buffer(source, args.lexer)
+        ref = build_list(source, args.lexer)
+        if len(buf) != len(ref) or any(buf.token(i) != tok for i, tok in enumerate(ref)):
+            raise SystemExit("ERROR: TokenBuffer no reproduce la lista de tokens")
+        print(f"Tokens idénticos; columnas del buffer: {buf.nbytes() / 1024 / 1024:.1f} MB")
+        source.close()
+    finally:
+        os.unlink(f.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Generador de programas .vid sintéticos y válidos (léxica, sintáctica y
+semánticamente) para los benchmarks.
+
+Un programa se construye con unidades, cada una de un tipo:
+
+  declaraciones  int/float/string con expresiones aritméticas largas
+  vídeo          dos clips, una cadena de llamadas @función[...] y exportar
+  control        if/else y while anidados hasta `depth` niveles
+
+generate_nested() produce un solo bloque de control de `depth` niveles,
+opcionalmente precedido de muchas declaraciones de primer nivel.
+
+Las variables tienen nombres únicos y sólo se usan después de declararse.
+Las llamadas @función llevan el número de argumentos que espera el
+traductor, así que no genera avisos. Con la misma semilla el resultado es
+idéntico.
+
+Uso: python -m benchmarks.generate salida.vid [--statements N] [--depth D]
+                                              [--expr-terms T] [--seed S]
+"""
+
+import argparse
+import random
+from typing import List
+
+# Llamadas con el número de argumentos que espera el traductor; {clip} es
+# el clip destino (el traductor lo descarta como primer argumento) y
+# {other} otro clip ya declarado.
+VIDEO_CALLS = (
+    '@resize[{clip}, 1280, 720]',
+    '@flip["horizontal"]',
+    '@flip["vertical"]',
+    '@velocidad[2]',
+    '@fadein[1.5]',
+    '@fadeout[2.0]',
+    '@silencio[]',
+    '@quitar_audio[]',
+    '@agregar_musica["musica.mp3"]',
+    '@concatenar[{other}, {clip}]',
+    '@cortar[0, 10]',
+)
+INT_OPS = ('+', '-', '*', '/')
+
+
+class ProgramGenerator:
+    """Genera el texto de un programa sentencia a sentencia."""
+
+    def __init__(self, depth: int = 3, expr_terms: int = 8, seed: int = 0) -> None:
+        self.depth = depth
+        self.expr_terms = expr_terms
+        self.rng = random.Random(seed)
+        self.lines: List[str] = []
+        self.statements = 0
+        self.counter = 0
+        # Variables int de primer nivel: visibles en todos los bloques
+        self.ints: List[str] = []
+
+    def fresh(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append('    ' * indent + line)
+        self.statements += 1
+
+    def int_expr(self, terms: int, scope: List[str]) -> str:
+        """Expresión int de `terms` operandos con algún paréntesis."""
+        rng = self.rng
+        parts = []
+        for i in range(terms):
+            operand = rng.choice(scope) if scope and rng.random() < 0.5 else str(rng.randint(1, 99))
+            if i:
+                parts.append(rng.choice(INT_OPS))
+            parts.append(operand)
+        expr = ' '.join(parts)
+        if terms > 2 and rng.random() < 0.5:
+            expr = f"({expr}) * 2"
+        return expr
+
+    def declarations(self, indent: int, scope: List[str]) -> None:
+        name = self.fresh('n')
+        self.emit(indent, f"int: {name} = {self.int_expr(self.expr_terms, scope)};")
+        scope.append(name)
+        self.emit(indent, f"float: {self.fresh('f')} = {self.rng.randint(1, 9)}.5 * 2.0 - 0.25;")
+        self.emit(indent, f'string: {self.fresh("s")} = "texto {self.counter}";')
+        self.emit(indent, f"{name} = {name} + {self.int_expr(max(1, self.expr_terms // 2), scope)};")
+
+    def video(self, indent: int, calls: int = 6) -> None:
+        clip, other = self.fresh('clip'), self.fresh('clip')
+        self.emit(indent, f'video: {clip} = "{clip}.mp4";')
+        self.emit(indent, f'video: {other} = "{other}.mp4";')
+        for _ in range(calls):
+            call = self.rng.choice(VIDEO_CALLS).format(clip=clip, other=other)
+            self.emit(indent, f"{clip} = {call};")
+        self.emit(indent, f'exportar {clip} como "{clip}_out.mp4";')
+
+    def control(self, indent: int, level: int, scope: List[str]) -> None:
+        counter = self.fresh('i')
+        self.emit(indent, f"int: {counter} = {self.rng.randint(1, 5)};")
+        scope = scope + [counter]
+        if level % 2:
+            self.emit(indent, f"while ({counter} > 0) {{")
+            self.body(indent + 1, level, scope)
+            self.emit(indent + 1, f"{counter} = {counter} - 1;")
+            self.lines.append('    ' * indent + '}')
+        else:
+            self.emit(indent, f"if ({counter} < 3 and {counter} > 0) {{")
+            self.body(indent + 1, level, scope)
+            self.lines.append('    ' * indent + '} else {')
+            self.emit(indent + 1, f"{counter} = {self.int_expr(3, scope)};")
+            self.lines.append('    ' * indent + '}')
+
+    def body(self, indent: int, level: int, scope: List[str]) -> None:
+        self.declarations(indent, list(scope))
+        if level + 1 < self.depth:
+            self.control(indent, level + 1, scope)
+
+    def program(self, statements: int) -> str:
+        self.lines = ['main {']
+        units = (lambda: self.declarations(1, self.ints),
+                 lambda: self.video(1),
+                 lambda: self.control(1, 0, self.ints))
+        k = 0
+        while self.statements < statements:
+            units[k % len(units)]()
+            k += 1
+        self.lines.append('}')
+        return '\n'.join(self.lines) + '\n'
+
+
+def generate_program(statements: int, depth: int = 3, expr_terms: int = 8, seed: int = 0) -> str:
+    """Programa .vid válido con al menos `statements` sentencias."""
+    return ProgramGenerator(depth, expr_terms, seed).program(statements)
+
+
+def generate_nested(depth: int, expr_terms: int = 8, seed: int = 0, declarations: int = 0) -> str:
+    """Programa con un único bloque de control anidado `depth` niveles, tras
+    `declarations` grupos de declaraciones de primer nivel (4 sentencias cada uno)."""
+    gen = ProgramGenerator(depth, expr_terms, seed)
+    gen.lines = ['main {']
+    for _ in range(declarations):
+        gen.declarations(1, gen.ints)
+    gen.control(1, 0, gen.ints)
+    gen.lines.append('}')
+    return '\n'.join(gen.lines) + '\n'
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('salida', help='archivo .vid a escribir')
+    ap.add_argument('--statements', type=int, default=1000, help='sentencias (por defecto: 1000)')
+    ap.add_argument('--depth', type=int, default=3, help='anidamiento if/while (por defecto: 3)')
+    ap.add_argument('--expr-terms', type=int, default=8,
+                    help='operandos de las expresiones largas (por defecto: 8)')
+    ap.add_argument('--seed', type=int, default=0, help='semilla (por defecto: 0)')
+    args = ap.parse_args()
+
+    text = generate_program(args.statements, args.depth, args.expr_terms, args.seed)
+    with open(args.salida, 'w', encoding='utf-8') as f:
+        f.write(text)
+    print(f"{args.salida}: {text.count(chr(10))} líneas, {len(text.encode('utf-8')):,} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Presupuesto de tiempo de importación del compilador, medido con
+`python -X importtime`.
+
+Importa cada módulo en un intérprete nuevo (mejor de `repeat` veces) y
+comprueba dos cosas:
+
+  - el tiempo acumulado de la importación no supera el presupuesto
+    (--budget, en ms);
+  - no se importa ninguno de los módulos prohibidos (graphviz: sólo hace
+    falta con --emit-parse-tree / --emit-ast).
+
+Muestra además los módulos con más tiempo propio. Termina con código 1
+si algún módulo se sale del presupuesto o importa un módulo prohibido.
+
+Uso: python -m benchmarks.import_time [--modules ejecutar_compilador,...]
+         [--budget MS] [--repeat R] [--top N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+COMPILER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Tiempo acumulado máximo de importación por módulo, en ms
+BUDGET_MS = 150.0
+# Módulos que no deben cargarse en una compilación normal
+FORBIDDEN = ('graphviz',)
+
+
+def import_times(module: str) -> List[Tuple[str, int, int, int]]:
+    """[(nombre, µs propios, µs acumulados, profundidad)] de importar `module` en frío."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=COMPILER_DIR, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit(f"ERROR: no se pudo importar {module}:\n{proc.stderr}")
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative), depth))
+    return entries
+
+
+def best_run(module: str, repeat: int) -> List[Tuple[str, int, int, int]]:
+    """Ejecución con menor tiempo acumulado para `module`."""
+    runs = [import_times(module) for _ in range(repeat)]
+    return min(runs, key=lambda entries: total_us(entries, module))
+
+
+def total_us(entries, module: str) -> int:
+    for name, _, cumulative, depth in entries:
+        if name == module and depth == 0:
+            return cumulative
+    return 0
+
+
+def forbidden_imports(entries) -> List[str]:
+    """Paquetes de FORBIDDEN que aparecen entre los importados."""
+    return sorted({name.split('.')[0] for name, *_ in entries} & set(FORBIDDEN))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--modules', default='ejecutar_compilador',
+                    help='módulos a importar, separados por comas (por defecto: ejecutar_compilador)')
+    ap.add_argument('--budget', type=float, default=BUDGET_MS,
+                    help=f'tiempo acumulado máximo por módulo, en ms (por defecto: {BUDGET_MS:.0f})')
+    ap.add_argument('--repeat', type=int, default=5, help='importaciones por módulo (por defecto: 5)')
+    ap.add_argument('--top', type=int, default=10, help='módulos con más tiempo propio a mostrar')
+    args = ap.parse_args()
+
+    ok = True
+    for module in args.modules.split(','):
+        entries = best_run(module, args.repeat)
+        total_ms = total_us(entries, module) / 1e3
+        forbidden = forbidden_imports(entries)
+        good = total_ms <= args.budget and not forbidden
+        ok = ok and good
+        print(f"{module}: {total_ms:.1f} ms (presupuesto {args.budget:.0f} ms), "
+              f"{len(entries)} módulos  {'ok' if good else 'FUERA DE PRESUPUESTO'}")
+        for name in forbidden:
+            print(f"  importa {name}, que no debería cargarse")
+        for name, self_us, cumulative, _ in sorted(entries, key=lambda e: -e[1])[:args.top]:
+            print(f"  {name:<28} {self_us / 1e3:7.1f} ms propios {cumulative / 1e3:8.1f} ms acumulados")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Comprueba que una compilación tokeniza el fuente una sola vez.
+
+Compila un programa sintético (benchmarks.generate) con todas las fases
+del driver (ejecutar_compilador.Compilacion, sin caché), con cada motor
+de lexer, con y sin --stream, y con api.compile_source. En cada caso
+exige lexer_runs == 1 y muestra el tiempo de la compilación completa.
+
+Uso: python -m benchmarks.lex_once [--statements N] [--depth D]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from api import compile_source
+from benchmarks.generate import generate_program
+from ejecutar_compilador import Compilacion
+from lexer2 import LEXER_ENGINES
+
+
+def compile_driver(fuente: str, salida: str, engine: str, stream: bool) -> int:
+    """Ejecuta las fases del driver sobre `fuente`; devuelve lexer_runs."""
+    compilacion = Compilacion(fuente, salida, engine, stream)
+    with contextlib.redirect_stdout(io.StringIO()) as log:
+        try:
+            for nombre, fase in compilacion.fases():
+                if fase() != 0:
+                    raise SystemExit(f"ERROR: falló el {nombre}:\n{log.getvalue()}")
+        finally:
+            compilacion.cerrar()
+    return compilacion.lexer_runs
+
+
+def compile_api(text: str, name: str, engine: str) -> int:
+    """Compila `text` con api.compile_source; devuelve lexer_runs."""
+    result = compile_source(text, name, engine)
+    if not result.ok:
+        raise SystemExit("ERROR: compile_source falló:\n" + '\n'.join(map(str, result.diagnostics)))
+    return result.lexer_runs
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--statements', type=int, default=10000, help='sentencias (por defecto: 10000)')
+    ap.add_argument('--depth', type=int, default=3, help='anidamiento if/while (por defecto: 3)')
+    args = ap.parse_args()
+
+    text = generate_program(args.statements, args.depth)
+    with tempfile.TemporaryDirectory() as tmp:
+        fuente = os.path.join(tmp, 'programa.vid')
+        with open(fuente, 'w', encoding='utf-8') as f:
+            f.write(text)
+        print(f"Programa: {args.statements:,} sentencias, {len(text.encode('utf-8')):,} bytes")
+
+        cases = [(f"driver --lexer {engine}{' --stream' if stream else ''}",
+                  lambda engine=engine, stream=stream:
+                      compile_driver(fuente, os.path.join(tmp, 'output.py'), engine, stream))
+                 for engine in sorted(LEXER_ENGINES) for stream in (False, True)]
+        cases += [(f"compile_source ({engine})",
+                   lambda engine=engine: compile_api(text, fuente, engine))
+                  for engine in sorted(LEXER_ENGINES)]
+
+        failed = False
+        for label, run in cases:
+            t0 = time.perf_counter()
+            runs = run()
+            secs = time.perf_counter() - t0
+            mark = '' if runs == 1 else '  ERROR: se esperaba 1'
+            failed = failed or runs != 1
+            print(f"  {label:<30} {secs:8.2f} s  lexer_runs={runs}{mark}")
+    if failed:
+        raise SystemExit("ERROR: alguna compilación tokenizó el fuente más de una vez")
+
+
+if __name__ == '__main__':
+    main()
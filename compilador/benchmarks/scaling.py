@@ -0,0 +1,111 @@
+"""
+Control de regresiones de escalado: falla si alguna fase del compilador
+crece peor que n log n.
+
+Compila programas sintéticos (benchmarks.generate) en dos series de
+tamaños que se duplican:
+
+  sentencias  1k, 2k, 4k, 8k, 16k sentencias (anidamiento fijo)
+  anidamiento un bloque if/while de 8, 16, 32, 64, 128 niveles
+
+Para cada serie y fase (Lexer.tokenize, TableDrivenParser.parse,
+build_ast, Program.check_semantic, Translator.translate) ajusta el
+exponente k de t ~ n^k en escala log-log. Lo compara con el exponente
+que tendría una curva n log n sobre los mismos tamaños (algo más de 1),
+más un margen para el ruido. El exponente se ajusta también sobre los
+tres tamaños mayores, porque un término cuadrático pequeño sólo asoma en
+la cola. Si alguna fase supera el límite, termina con código 1 y puede
+usarse en integración continua.
+
+El recolector de basura se desactiva mientras se mide. Su coste crece con
+el número de objetos vivos y falsearía el exponente de fases que son
+lineales.
+
+Cada punto es el mejor de `repeat` muestras, y cada muestra repite la
+fase hasta durar al menos --min-time segundos. En la serie de
+anidamiento algunas fases tardan menos de un milisegundo: medidas una
+sola vez, el ruido del reloj bastaba para dar una REGRESIÓN al azar.
+
+Uso: python -m benchmarks.scaling [--sizes 1000,...] [--depths 8,...]
+         [--repeat R] [--min-time S] [--margin M]
+"""
+
+import argparse
+import gc
+import math
+import sys
+
+from benchmarks.bench_expr import exponent
+from benchmarks.bench_suite import run_phases
+from benchmarks.generate import generate_nested, generate_program
+
+# Puntos finales con los que se ajusta además el exponente de la cola
+TAIL = 3
+
+
+def measure_series(sources, repeat: int, min_time: float):
+    """{fase: [(n, segundos), ...]} para una lista de (n, fuente)."""
+    series = {}
+    for n, src in sources:
+        gc.collect()
+        gc.disable()
+        try:
+            phases = run_phases(src, 'regex', repeat, min_time)
+        finally:
+            gc.enable()
+        for phase, entry in phases.items():
+            series.setdefault(phase, []).append((n, entry['seconds']))
+    return series
+
+
+def nlogn_exponent(sizes) -> float:
+    return exponent([(n, n * math.log(n)) for n in sizes])
+
+
+def check_series(label: str, series: dict, margin: float) -> bool:
+    """Muestra los exponentes de una serie; devuelve False si alguno excede el límite."""
+    sizes = [n for n, _ in next(iter(series.values()))]
+    limit = nlogn_exponent(sizes) + margin
+    tail_limit = nlogn_exponent(sizes[-TAIL:]) + margin
+    print(f"{label} (n = {', '.join(map(str, sizes))}); límite n log n + margen: "
+          f"{limit:.2f} (cola: {tail_limit:.2f})")
+    ok = True
+    for phase, points in series.items():
+        k = exponent(points)
+        k_tail = exponent(points[-TAIL:])
+        good = k <= limit and k_tail <= tail_limit
+        ok = ok and good
+        times = '  '.join(f"{t * 1e3:8.1f}" for _, t in points)
+        print(f"  {phase:<24} {times} ms  exponente {k:5.2f} (cola {k_tail:5.2f})  "
+              f"{'ok' if good else 'REGRESIÓN'}")
+    return ok
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--sizes', default='1000,2000,4000,8000,16000',
+                    help='sentencias de la serie por tamaño (por defecto: 1000,...,16000)')
+    ap.add_argument('--depths', default='8,16,32,64,128',
+                    help='niveles de la serie por anidamiento (por defecto: 8,...,128)')
+    ap.add_argument('--repeat', type=int, default=3, help='muestras por fase (por defecto: 3)')
+    ap.add_argument('--min-time', type=float, default=0.05,
+                    help='duración mínima de cada muestra, en segundos (por defecto: 0.05)')
+    ap.add_argument('--margin', type=float, default=0.2,
+                    help='margen sobre el exponente de n log n (por defecto: 0.2)')
+    args = ap.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    depths = [int(d) for d in args.depths.split(',')]
+    ok = check_series('Sentencias', measure_series(
+        [(n, generate_program(n)) for n in sizes], args.repeat, args.min_time), args.margin)
+    ok = check_series('Anidamiento', measure_series(
+        [(d, generate_nested(d)) for d in depths], args.repeat, args.min_time), args.margin) and ok
+
+    if not ok:
+        print("ERROR: alguna fase crece peor que n log n")
+        sys.exit(1)
+    print("Todas las fases escalan como n log n o mejor")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+# cache.py
+
+"""
+Caché en disco de compilaciones, direccionada por contenido.
+
+La clave de una entrada es el SHA-256 de:
+  - el texto fuente (bytes tal como están en el archivo),
+  - la versión del compilador: CACHE_FORMAT más un hash del código de los
+    módulos que intervienen en la salida (lexer, parser, AST, traductor…),
+    de modo que cualquier cambio en ellos invalida la caché,
+  - el hash de la tabla LL(1) (ll1_tables.TABLE_HASH, generada desde grammar.bnf),
+  - las opciones que cambian el código generado (trace_render).
+
+Cada entrada es un pickle con el AST ya chequeado, el código Python que
+produjo Translator.translate y sus avisos (para repetirlos al recuperar la
+entrada: el mismo fuente da los mismos diagnósticos con o sin caché); un
+fuente sin cambios se resuelve sin ejecutar ninguna fase. Sólo se guardan
+compilaciones sin errores.
+
+El tamaño total está acotado (max_bytes). Al leer una entrada se actualiza
+su mtime, y al superar el límite se borran las de mtime más antiguo (LRU).
+Las escrituras son atómicas (archivo temporal + os.replace), así que varios
+procesos pueden compartir el directorio.
+
+Directorio por defecto: $VID_CACHE_DIR, o ~/.cache/compilador-vid.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+import ll1_tables
+
+# Subir al cambiar el formato de las entradas
+CACHE_FORMAT = 2
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+SUFFIX = '.pickle'
+
+# Módulos cuyo código determina el AST o el Python generado: todos los
+# que importan las fases salvo la instrumentación (profiling, tracing)
+COMPILER_MODULES = ('enums.py', 'source.py', 'll1_tables.py', 'll1_table.py', 'lexer2.py',
+                    'tokenbuf.py', 'visitor.py', 'parser2.py', 'symbols.py', 'ast_semantic.py',
+                    'translator.py', 'trace_events.py')
+
+_compiler_version: Optional[str] = None
+
+
+class CacheEntry(NamedTuple):
+    ast: object
+    code: str
+    warnings: Tuple[str, ...] = ()   # Translator.warnings
+
+
+def default_directory() -> str:
+    return os.environ.get('VID_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'compilador-vid')
+
+
+def compiler_version() -> str:
+    """Hash del formato de caché y del código de COMPILER_MODULES (se calcula una vez)."""
+    global _compiler_version
+    if _compiler_version is None:
+        h = hashlib.sha256(f"format {CACHE_FORMAT}\n".encode())
+        base = os.path.dirname(os.path.abspath(__file__))
+        for name in COMPILER_MODULES:
+            with open(os.path.join(base, name), 'rb') as f:
+                h.update(name.encode() + b'\0' + f.read() + b'\0')
+        _compiler_version = h.hexdigest()
+    return _compiler_version
+
+
+def grammar_hash() -> str:
+    """Hash de la tabla LL(1); grammar_compiler.py lo calcula al generar ll1_tables."""
+    return ll1_tables.TABLE_HASH
+
+
+class CompileCache:
+    """Directorio de entradas <clave>.pickle con tamaño total acotado."""
+
+    def __init__(self, directory: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory or default_directory()
+        self.max_bytes = max_bytes
+
+    def key(self, source, trace_render: Optional[str] = None) -> str:
+        """Clave de un fuente (bytes, mmap o str) con las opciones dadas."""
+        if isinstance(source, str):
+            source = source.encode('utf-8')
+        h = hashlib.sha256()
+        h.update(compiler_version().encode())
+        h.update(grammar_hash().encode())
+        h.update(repr(trace_render).encode() + b'\0')
+        h.update(source)
+        return h.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Entrada de `key`, o None si no existe o no se puede leer."""
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Entrada corrupta o de un formato anterior: se descarta
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, ast, code: str, warnings: Iterable[str] = ()) -> None:
+        """Guarda (ast, code, warnings) bajo `key` y aplica el límite de tamaño."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(CacheEntry(ast, code, tuple(warnings)), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            self._remove(tmp)
+            raise
+        self.evict()
+
+    def evict(self) -> int:
+        """Borra las entradas usadas hace más tiempo hasta caber en max_bytes; devuelve cuántas."""
+        entries = []
+        total = 0
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return 0
+        for name in names:
+            if not name.endswith(SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Borra todas las entradas."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith(SUFFIX):
+                self._remove(os.path.join(self.directory, name))
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# client.py
+
+"""
+Cliente del servidor de compilación (server.py).
+
+Envía el fuente al servidor, muestra los diagnósticos y escribe el código
+generado. Sólo usa la biblioteca estándar y no importa el compilador, así
+que arranca en lo que tarda el intérprete.
+
+Uso: python client.py archivo_fuente [-o salida.py] [--socket RUTA | --port N]
+     python client.py --ping | --shutdown [--socket RUTA | --port N]
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+HOST = '127.0.0.1'
+
+
+def default_socket() -> str:
+    # Igual que server.default_socket(), sin importar el servidor
+    return os.environ.get('VID_SERVER_SOCKET') or f"/tmp/compilador-vid-{os.getuid()}.sock"
+
+
+def connect(socket_path=None, port=None) -> socket.socket:
+    if port is not None:
+        return socket.create_connection((HOST, port))
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(socket_path or default_socket())
+    return sock
+
+
+def request(sock: socket.socket, message: dict) -> dict:
+    """Envía una petición y devuelve la respuesta (una línea JSON cada una)."""
+    sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+    with sock.makefile('rb') as f:
+        line = f.readline()
+    if not line:
+        raise ConnectionError("el servidor cerró la conexión")
+    return json.loads(line)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog='client.py', description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('fuente', metavar='archivo_fuente', nargs='?')
+    ap.add_argument('-o', '--output', default='output.py',
+                    help="archivo de salida (por defecto: output.py)")
+    where = ap.add_mutually_exclusive_group()
+    where.add_argument('--socket', metavar='RUTA',
+                       help="socket Unix (por defecto: $VID_SERVER_SOCKET o /tmp/compilador-vid-<uid>.sock)")
+    where.add_argument('--port', type=int, help=f"puerto TCP en {HOST}")
+    op = ap.add_mutually_exclusive_group()
+    op.add_argument('--ping', action='store_true', help="comprobar que el servidor responde")
+    op.add_argument('--shutdown', action='store_true', help="detener el servidor")
+    args = ap.parse_args()
+
+    if args.ping or args.shutdown:
+        message = {'op': 'ping' if args.ping else 'shutdown'}
+    elif args.fuente is None:
+        ap.error("falta el archivo fuente")
+    else:
+        try:
+            with open(args.fuente, encoding='utf-8', newline='') as f:
+                message = {'op': 'compile', 'source': f.read(), 'name': args.fuente}
+        except FileNotFoundError:
+            print(f"Error: no existe '{args.fuente}'")
+            sys.exit(1)
+
+    try:
+        with connect(args.socket, args.port) as sock:
+            response = request(sock, message)
+    except (OSError, ConnectionError) as e:
+        print(f"Error: no se pudo contactar con el servidor de compilación: {e}")
+        sys.exit(2)
+
+    if message['op'] != 'compile':
+        print("ok" if response.get('ok') else response.get('error', 'error'))
+        sys.exit(0 if response.get('ok') else 1)
+
+    for diagnostic in response.get('diagnostics', []):
+        print(diagnostic['message'])
+    if not response.get('ok'):
+        if 'error' in response:
+            print(f"Error: {response['error']}")
+        print("\n*** La compilación ha fallado ***")
+        sys.exit(1)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(response['code'])
+    origen = " (caché)" if response.get('cached') else ""
+    print(f"Código Python generado en: {args.output}{origen} [{response['seconds'] * 1e3:.1f} ms]")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,48 +8,274 @@ Pipeline completo del compilador:
   3) Análisis semántico  → ast_semantic.py
   4) Traducción a Python → translator.py
 
-Si alguna fase falla (returncode != 0), se detiene y no sigue a la siguiente.
+Todas las fases se ejecutan en el mismo proceso: el fuente se lee y se
+tokeniza una sola vez, y la lista de tokens, el parse tree y el AST se
+pasan de una fase a la siguiente en memoria.
+
+Si alguna fase falla (código != 0), se detiene y no sigue a la siguiente.
 El código Python generado se guarda en 'output.py' por defecto.
+
+Los dibujos del parse tree y del AST (parsetree.png, ast.png) son
+opcionales: --emit-parse-tree y --emit-ast. Sin ellos el AST se construye
+durante el parse y graphviz ni siquiera se importa.
+
+Las compilaciones correctas se guardan en una caché en disco (cache.py);
+si el fuente, el compilador y la gramática no han cambiado, el código se
+recupera de ella sin ejecutar ninguna fase. --no-cache la desactiva.
 """
 
+import argparse
+import pickle
 import sys
-import subprocess
 import os
+from typing import Optional
+
+from lexer2 import LEXER_ENGINES, make_lexer, report_errors, report_tokens
+from source import SourceFile
+from parser2 import TableDrivenParser, run_parser
+from ast_semantic import ast_actions, check_ast, run_semantic
+from translator import translate_to_file
+from cache import CompileCache
+import profiling
+import trace_events
+import tracing
+
+
+class Compilacion:
+    """Estado compartido entre las fases de una compilación."""
+
+    def __init__(self, fuente: str, output_file: str, lexer_engine: str = 'char',
+                 stream: bool = False, emit_parse_tree: bool = False,
+                 trace_render: Optional[str] = None,
+                 cache: Optional[CompileCache] = None, emit_ast: bool = False) -> None:
+        self.fuente = fuente
+        self.output_file = output_file
+        self.lexer_engine = lexer_engine
+        # En modo stream los tokens se generan a medida que el parser los pide
+        self.stream = stream
+        # El parse tree sólo se construye para dibujarlo; si no, el AST se
+        # construye con acciones durante el parse
+        self.build_parse_tree = emit_parse_tree
+        # Traza Chrome a la que el script generado añade sus spans
+        self.trace_render = trace_render
+        self.cache = cache
+        self.cache_key = None
+        self.emit_ast = emit_ast
+        # Fuente mapeado en memoria; se libera con cerrar()
+        self.source = None
+        self.lexer = None
+        # Lexers que han recorrido el fuente en esta compilación (ver lexer_runs)
+        self.lexers = []
+        self.tokens = None
+        self.parse_tree = None
+        self.ast = None
+        # Avisos del traductor, que se guardan en la caché con el código
+        self.warnings = []
+
+    @property
+    def lexer_runs(self) -> int:
+        """
+        Veces que se ha tokenizado el fuente en esta compilación: 1 si las
+        fases comparten los tokens, 0 si se recuperó de la caché.
+        """
+        return sum(lexer.runs for lexer in self.lexers)
+
+    def consultar_cache(self) -> bool:
+        """
+        Si la caché tiene este fuente, escribe su código, repite los avisos
+        que dio el traductor y devuelve True.
+        """
+        if self.cache is None:
+            return False
+        try:
+            with SourceFile.open(self.fuente) as src:
+                self.cache_key = self.cache.key(src.data, self.trace_render)
+        except FileNotFoundError:
+            # El análisis léxico informa del error
+            return False
+        if self.build_parse_tree or self.emit_ast:
+            # Para dibujar hay que ejecutar las fases; el resultado se guarda igualmente
+            return False
+        entry = self.cache.get(self.cache_key)
+        if entry is None:
+            return False
+        self.ast = entry.ast
+        self.warnings = list(entry.warnings)
+        for warning in self.warnings:
+            print(warning)
+        with open(self.output_file, "w", encoding="utf-8") as f:
+            f.write(entry.code)
+        return True
+
+    def guardar_cache(self) -> None:
+        """Guarda el AST y el código generado de una compilación correcta."""
+        if self.cache_key is None:
+            return
+        try:
+            with open(self.output_file, encoding="utf-8") as f:
+                code = f.read()
+            self.cache.put(self.cache_key, self.ast, code, self.warnings)
+        except (OSError, pickle.PicklingError, RecursionError) as e:
+            # Sin caché la compilación sigue siendo válida
+            print(f"Aviso: no se pudo guardar en la caché: {e}")
+
+    def analisis_lexico(self) -> int:
+        try:
+            self.source = SourceFile.open(self.fuente)
+        except FileNotFoundError:
+            print(f"Error: no existe '{self.fuente}'")
+            return 1
+        self.lexer = make_lexer(self.source, self.lexer_engine)
+        self.lexers.append(self.lexer)
+        if self.stream:
+            self.tokens = self.lexer.iter_tokens()
+            print("Modo stream: los tokens se analizan junto con el parser")
+            return 0
+        self.tokens = self.lexer.tokenize()
+        # La lista de tokens sólo se vuelca con --debug lexer:debug
+        return report_tokens(self.tokens, self.lexer.errors, listing=False)
+
+    def analisis_sintactico(self) -> int:
+        parser = TableDrivenParser(tokens=self.tokens)
+        if parser.lexer is not None:
+            self.lexers.append(parser.lexer)
+        if self.build_parse_tree:
+            self.parse_tree, code = run_parser(parser, visualize=True)
+        else:
+            self.ast, code = run_parser(parser, ast_actions(parser.token_access))
+        # En modo stream los errores léxicos aparecen durante el parse
+        if self.stream and report_errors(self.lexer.errors):
+            return 1
+        return code
+
+    def analisis_semantico(self) -> int:
+        if self.build_parse_tree:
+            self.ast, code = run_semantic(self.parse_tree, self.emit_ast)
+        else:
+            _, code = check_ast(self.ast, self.emit_ast)
+        return code
+
+    def traduccion(self) -> int:
+        self.warnings = []
+        return translate_to_file(self.ast, self.output_file, self.trace_render, self.warnings)
+
+    def cerrar(self) -> None:
+        """
+        Libera el fuente mapeado en memoria. Se llama al terminar la
+        compilación: hasta construir el AST los tokens lo usan para
+        resolver su posición.
+        """
+        if self.source is not None:
+            self.source.close()
+            self.source = None
+
+    def fases(self):
+        """(nombre, método) de cada fase, en orden."""
+        return [
+            ("análisis léxico",      self.analisis_lexico),
+            ("análisis sintáctico",  self.analisis_sintactico),
+            ("análisis semántico",   self.analisis_semantico),
+            ("traducción a Python",  self.traduccion),
+        ]
+
 
 def main():
-    if len(sys.argv) != 2:
-        print("Uso: python ejecutar_compilador.py <archivo_fuente>")
-        sys.exit(1)
+    ap = argparse.ArgumentParser(prog='ejecutar_compilador.py',
+                                 description='Compila un archivo fuente a Python (moviepy).')
+    ap.add_argument('fuente', metavar='archivo_fuente')
+    ap.add_argument('--lexer', choices=sorted(LEXER_ENGINES), default='char',
+                    help="motor del lexer (por defecto: char); char decodifica el fuente completo "
+                         "a str, regex lo recorre sobre el mmap sin copiarlo")
+    ap.add_argument('--stream', action='store_true',
+                    help="no materializar la lista de tokens: el parser los pide al lexer")
+    ap.add_argument('--emit-parse-tree', action='store_true',
+                    help="construir el parse tree y dibujarlo en parsetree.png")
+    ap.add_argument('--emit-ast', action='store_true', help="dibujar el AST en ast.png")
+    ap.add_argument('--debug', metavar='CATEGORÍAS',
+                    help="trazas de depuración en stderr: 'cat[:nivel],...' con categorías "
+                         f"{', '.join(tracing.CATEGORIES)} o all y niveles {', '.join(tracing.LEVELS)} "
+                         "(sin nivel: trace); p.ej. --debug all")
+    ap.add_argument('--profile', action='store_true',
+                    help="medir cada fase (tiempo de pared y CPU, pico de memoria, tokens/s y "
+                         "nodos/s); muestra una tabla y guarda el informe en JSON")
+    ap.add_argument('--profile-json', metavar='JSON',
+                    help="archivo del informe de --profile (por defecto: profile.json); "
+                         "implica --profile")
+    ap.add_argument('--trace', metavar='JSON',
+                    help="guardar eventos de traza Chrome/Perfetto (spans por fase y por sentencia)")
+    ap.add_argument('--trace-render', action='store_true',
+                    help="con --trace, el script generado añade a la misma traza spans de carga "
+                         "de clips, efectos y escritura")
+    ap.add_argument('--no-cache', dest='cache', action='store_false',
+                    help="no consultar ni actualizar la caché de compilaciones")
+    ap.add_argument('--cache-dir', metavar='DIR',
+                    help="directorio de la caché (por defecto: $VID_CACHE_DIR o ~/.cache/compilador-vid)")
+    args = ap.parse_args()
+    if args.trace_render and not args.trace:
+        ap.error("--trace-render requiere --trace")
+    if args.debug:
+        try:
+            tracing.configure(args.debug)
+        except ValueError as e:
+            ap.error(str(e))
 
-    fuente = sys.argv[1]
+    fuente = args.fuente
     output_file = "output.py"  # Archivo de salida por defecto
-    
-    fases = [
-        ("análisis léxico",      [sys.executable, "lexer2.py",       fuente]),
-        ("análisis sintáctico",  [sys.executable, "parser2.py",      fuente]),
-        ("análisis semántico",   [sys.executable, "ast_semantic.py", fuente]),
-        ("traducción a Python",  [sys.executable, "translator.py",    fuente, output_file]),
-    ]
+    trace_render = os.path.abspath(args.trace) if args.trace_render else None
+    cache = CompileCache(args.cache_dir) if args.cache else None
+    compilacion = Compilacion(fuente, output_file, args.lexer, args.stream, args.emit_parse_tree,
+                              trace_render, cache, args.emit_ast)
 
     # Asegurarse de que el archivo de salida no exista antes de empezar
     if os.path.exists(output_file):
         os.remove(output_file)
 
-    for nombre, cmd in fases:
-        print(f"\n=== Iniciando {nombre} ===")
-        resultado = subprocess.run(cmd)
-        if resultado.returncode != 0:
-            print(f"\n*** El {nombre} ha fallado (código {resultado.returncode}). Abortando. ***")
-            sys.exit(resultado.returncode)
-        else:
-            print(f"--- {nombre.capitalize()} completado sin errores. ---")
+    profile_json = args.profile_json or 'profile.json'
+    perfil = profiling.start(fuente) if args.profile or args.profile_json else None
+    traza = trace_events.start() if args.trace else None
+    try:
+        with trace_events.span("caché", 'driver'):
+            en_cache = compilacion.consultar_cache()
+        if en_cache:
+            print(f"\n=== Compilación recuperada de la caché ({fuente} sin cambios) ===")
+            print(f"Código Python generado en: {output_file}")
+            return
 
-    if os.path.exists(output_file):
-        print(f"\n=== ¡Compilación completada con éxito! ===")
-        print(f"Código Python generado en: {output_file}")
-    else:
-        print("\n*** Error: No se generó el archivo de salida ***")
-        sys.exit(1)
+        for nombre, fase in compilacion.fases():
+            print(f"\n=== Iniciando {nombre} ===")
+            try:
+                with trace_events.span(nombre, 'driver'):
+                    codigo = fase()
+            except Exception as e:
+                # Un fallo inesperado equivale al proceso hijo terminando con error
+                print(f"{type(e).__name__}: {e}")
+                codigo = 1
+            if codigo != 0:
+                print(f"\n*** El {nombre} ha fallado (código {codigo}). Abortando. ***")
+                sys.exit(codigo)
+            else:
+                print(f"--- {nombre.capitalize()} completado sin errores. ---")
+
+        if os.path.exists(output_file):
+            print(f"\n=== ¡Compilación completada con éxito! ===")
+            print(f"Código Python generado en: {output_file}")
+            compilacion.guardar_cache()
+        else:
+            print("\n*** Error: No se generó el archivo de salida ***")
+            sys.exit(1)
+    finally:
+        compilacion.cerrar()
+        # El informe y la traza se emiten también si alguna fase falla
+        if traza is not None:
+            trace_events.stop()
+            traza.write(args.trace)
+            print(f"Traza guardada en {args.trace}")
+        if perfil is not None:
+            profiling.stop()
+            print()
+            print(perfil.table())
+            perfil.write_json(profile_json)
+            print(f"Informe de perfil guardado en {profile_json}")
 
 if __name__ == "__main__":
     main()
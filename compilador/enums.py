@@ -1,5 +1,4 @@
 import enum
-from dataclasses import dataclass
 
 """
 Definición de tokens del lenguaje de edición de video.
@@ -135,12 +134,59 @@ LEXEME_TO_TOKEN: dict[str, TokenType] = {
 
 
 # Representación de un token
-@dataclass(frozen=True)
 class Token:
-    type: TokenType
-    value: str
-    line: int
-    column: int
+    """
+    Token del lenguaje: tipo, lexema y posición.
+
+    La posición puede darse directamente (línea, columna) o como
+    desplazamiento `offset` dentro de un fuente (`source`, p.ej. un
+    SourceFile); en ese caso línea y columna se calculan sólo la primera
+    vez que se consultan.
+    """
+
+    __slots__ = ("type", "value", "offset", "source", "_line", "_column")
+
+    def __init__(self, type, value, line=None, column=None, offset=-1, source=None):
+        self.type = type
+        self.value = value
+        self.offset = offset
+        self.source = source
+        self._line = line
+        self._column = column
+
+    def _resolve(self):
+        self._line, self._column = self.source.position(self.offset)
+
+    @property
+    def line(self) -> int:
+        if self._line is None:
+            self._resolve()
+        return self._line
+
+    @property
+    def column(self) -> int:
+        if self._column is None:
+            self._resolve()
+        return self._column
+
+    def _key(self):
+        return (self.type, self.value, self.line, self.column)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __reduce__(self):
+        # Al serializar se fija la posición y se suelta la referencia al fuente
+        return (Token, (self.type, self.value, self.line, self.column))
+
+    def __repr__(self):
+        return (f"Token(type={self.type!r}, value={self.value!r}, "
+                f"line={self.line!r}, column={self.column!r})")
 
     def __str__(self):
         return f"{self.type.name:20} [ {self.value} ] -> {self.line}:{self.column}"
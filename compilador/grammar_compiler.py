@@ -0,0 +1,309 @@
+# grammar_compiler.py
+
+"""
+Generador de la tabla LL(1) del parser a partir de grammar.bnf.
+
+    python grammar_compiler.py [grammar.bnf] [-o ll1_tables.py]
+                               [--check] [--first-follow]
+
+Lee la gramática (formato descrito en la cabecera de grammar.bnf), calcula
+NULLABLE, FIRST y FOLLOW (ll1_table.first_follow) y construye la tabla:
+cada alternativa A -> α entra en la fila de A con los lookaheads de
+FIRST(α), más FOLLOW(A) si α puede derivar ε.
+
+Si dos alternativas comparten un lookahead la gramática no es LL(1): se
+informan todos los conflictos (no-terminal, lookahead y las dos reglas) y
+no se escribe nada. Tampoco se admiten terminales que no sean TokenType
+ni no-terminales sin regla; los no-terminales inalcanzables se avisan.
+
+La tabla se compila con ll1_table.CompiledTable y sus campos se vuelcan a
+ll1_tables.py como tuplas de enteros y cadenas. Al ser todo constantes, el
+compilador de Python las guarda tal cual en el .pyc (marshal) y el parser
+las adopta con CompiledTable.load() sin construir ningún dict al importar.
+
+--check no escribe: termina con código 1 si ll1_tables.py no coincide con
+lo que se generaría (gramática o enums.py editados sin regenerar).
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from enums import TokenType
+from ll1_table import CompiledTable, Symbol, first_follow
+
+EPSILON = "ε"
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_GRAMMAR = os.path.join(BASE_DIR, 'grammar.bnf')
+DEFAULT_OUTPUT = os.path.join(BASE_DIR, 'll1_tables.py')
+
+_RULE = re.compile(r"([A-Za-z_][A-Za-z0-9_']*)\s*->(.*)")
+_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_']*")
+
+
+class GrammarError(ValueError):
+    """Error en el texto de la gramática (con archivo y línea)."""
+
+
+class Grammar(NamedTuple):
+    start: str
+    # (lhs, rhs) en el orden del archivo; rhs sin ε, terminales como TokenType
+    productions: List[Tuple[str, Tuple[Symbol, ...]]]
+
+    @property
+    def nonterminals(self) -> List[str]:
+        return list(dict.fromkeys(lhs for lhs, _ in self.productions))
+
+
+class Conflict(NamedTuple):
+    nonterminal: str
+    lookahead: TokenType
+    kept: str       # regla que ya ocupaba la entrada
+    rejected: str   # regla que también la reclama
+
+    def __str__(self) -> str:
+        return (f"Conflicto LL(1) en {self.nonterminal} con {self.lookahead.name}: "
+                f"'{self.kept}' / '{self.rejected}'")
+
+
+def rule_text(lhs: str, rhs: Sequence[Symbol]) -> str:
+    return f"{lhs} -> " + (' '.join(s.name if isinstance(s, TokenType) else s for s in rhs) or EPSILON)
+
+
+# ──────────────────────────────────────────────────────────────
+#  Lectura de la gramática
+# ──────────────────────────────────────────────────────────────
+def parse_bnf(text: str, filename: str = 'grammar.bnf') -> Grammar:
+    """Gramática de un texto BNF; GrammarError si está mal formado."""
+    productions: List[Tuple[str, Tuple[Symbol, ...]]] = []
+    defined: Dict[str, int] = {}
+    used: Dict[str, int] = {}
+    lhs: Optional[str] = None
+
+    for lineno, line in enumerate(text.splitlines(), 1):
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith('|'):
+            if lhs is None:
+                raise GrammarError(f"{filename}:{lineno}: alternativa sin regla")
+            body = line[1:]
+        else:
+            m = _RULE.fullmatch(line)
+            if m is None:
+                raise GrammarError(f"{filename}:{lineno}: se esperaba 'Nombre -> alternativas'")
+            lhs, body = m.groups()
+            if lhs.isupper():
+                raise GrammarError(f"{filename}:{lineno}: {lhs} es un terminal y no puede tener regla")
+            if lhs in defined:
+                raise GrammarError(f"{filename}:{lineno}: {lhs} ya tiene regla en la línea {defined[lhs]}")
+            defined[lhs] = lineno
+
+        for alt in body.split('|'):
+            rhs: List[Symbol] = []
+            words = alt.split()
+            for word in words:
+                if word == EPSILON:
+                    if len(words) > 1:
+                        raise GrammarError(f"{filename}:{lineno}: {EPSILON} tiene que ir sola en su alternativa")
+                    continue
+                if not _NAME.fullmatch(word):
+                    raise GrammarError(f"{filename}:{lineno}: símbolo no válido '{word}'")
+                if word.isupper():
+                    if word not in TokenType.__members__:
+                        raise GrammarError(f"{filename}:{lineno}: {word} no es un TokenType")
+                    rhs.append(TokenType[word])
+                else:
+                    used.setdefault(word, lineno)
+                    rhs.append(word)
+            if not words:
+                raise GrammarError(f"{filename}:{lineno}: alternativa vacía (usar {EPSILON})")
+            productions.append((lhs, tuple(rhs)))
+
+    if not productions:
+        raise GrammarError(f"{filename}: la gramática no tiene reglas")
+    for name, lineno in used.items():
+        if name not in defined:
+            raise GrammarError(f"{filename}:{lineno}: el no-terminal {name} no tiene regla")
+    return Grammar(productions[0][0], productions)
+
+
+def unreachable(grammar: Grammar) -> List[str]:
+    """No-terminales a los que no se llega desde el símbolo inicial."""
+    reached = {grammar.start}
+    pending = [grammar.start]
+    while pending:
+        nt = pending.pop()
+        for lhs, rhs in grammar.productions:
+            if lhs == nt:
+                for sym in rhs:
+                    if isinstance(sym, str) and sym not in reached:
+                        reached.add(sym)
+                        pending.append(sym)
+    return [nt for nt in grammar.nonterminals if nt not in reached]
+
+
+# ──────────────────────────────────────────────────────────────
+#  Construcción de la tabla
+# ──────────────────────────────────────────────────────────────
+def build_table(grammar: Grammar, sets=None
+                ) -> Tuple[Dict[str, Dict[TokenType, list]], List[Conflict]]:
+    """
+    Tabla {no-terminal: {TokenType: [símbolos]}} (ε como [EPSILON]) y los
+    conflictos encontrados. En un conflicto se queda la alternativa que
+    aparece antes en la gramática. `sets` es el resultado de first_follow
+    si ya se calculó.
+    """
+    nullable, first, follow = sets or first_follow(grammar.productions, grammar.start)
+    table: Dict[str, Dict[TokenType, list]] = {nt: {} for nt in grammar.nonterminals}
+    conflicts: List[Conflict] = []
+
+    for lhs, rhs in grammar.productions:
+        # FIRST(α), y FOLLOW(lhs) si α puede derivar ε
+        lookaheads: Dict[TokenType, None] = {}
+        for sym in rhs:
+            if isinstance(sym, TokenType):
+                lookaheads[sym] = None
+                break
+            lookaheads |= first[sym]
+            if sym not in nullable:
+                break
+        else:
+            lookaheads |= follow[lhs]
+
+        row = table[lhs]
+        for lookahead in lookaheads:
+            kept = row.get(lookahead)
+            if kept is None:
+                row[lookahead] = list(rhs) or [EPSILON]
+            else:
+                conflicts.append(Conflict(lhs, lookahead, rule_text(lhs, [s for s in kept if s != EPSILON]),
+                                          rule_text(lhs, rhs)))
+    return table, conflicts
+
+
+# ──────────────────────────────────────────────────────────────
+#  Módulo generado
+# ──────────────────────────────────────────────────────────────
+def _rows(name: str, values: Iterable, comments: Optional[Sequence[str]] = None) -> str:
+    """`name = (...)` con un elemento por línea."""
+    lines = [f"{name} = ("]
+    for k, value in enumerate(values):
+        lines.append(f"    {value!r},{'  # ' + comments[k] if comments else ''}")
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def render_module(table: CompiledTable, start_symbol: str, grammar_name: str) -> str:
+    """Texto de ll1_tables.py para `table` (sólo literales: tuplas, ints y str)."""
+    first, follow = table.first_follow()
+    names = list(table.nonterminals)
+    body = "\n\n".join([
+        f"TOKENS = {tuple(t.name for t in TokenType)!r}",
+        f"START_SYMBOL = {start_symbol!r}\nNT_BASE = {table.nt_base!r}\nSTART = {table.start!r}",
+        _rows("NONTERMINALS", table.nonterminals),
+        "# Por no-terminal: producción para cada código de lookahead (-1: error)\n"
+        + _rows("ROWS", (tuple(row) if row is not None else None for row in table.rows), names),
+        "# Por no-terminal: lookaheads válidos, para \"Se esperaba uno de: ...\"\n"
+        + _rows("EXPECTED", table.expected_text),
+        "# Por no-terminal: FIRST y FOLLOW en códigos de token (recuperación de errores)\n"
+        + _rows("FIRST", first, names) + "\n" + _rows("FOLLOW", follow, names),
+        "# Por producción: no-terminal, ids de la parte derecha, ids a apilar y texto\n"
+        + _rows("LHS", table.lhs) + "\n" + _rows("RHS", table.rhs, table.rule_text)
+        + "\n" + _rows("PUSH", table.push) + "\n" + _rows("RULE_TEXT", table.rule_text),
+    ])
+    digest = hashlib.sha256(body.encode('utf-8')).hexdigest()
+    return (
+        "# ll1_tables.py\n"
+        f"# Generado por grammar_compiler.py a partir de {grammar_name}: no editar a mano.\n"
+        "# Para regenerarlo: python grammar_compiler.py\n"
+        "\n"
+        '"""\n'
+        "Tabla LL(1) del parser compilada a enteros (ver ll1_table.CompiledTable.load).\n"
+        "Todo son literales constantes: el .pyc los guarda ya construidos y\n"
+        "cargarlos no crea ningún dict.\n"
+        '"""\n'
+        "\n"
+        "# Hash del contenido de la tabla (cache.grammar_hash)\n"
+        f"TABLE_HASH = {digest!r}\n"
+        "\n"
+        f"{body}\n"
+    )
+
+
+def compile_grammar(path: str) -> Tuple[Grammar, CompiledTable, List[Conflict]]:
+    """Lee `path`, construye la tabla y la compila; GrammarError si el BNF no es válido."""
+    with open(path, encoding='utf-8') as f:
+        grammar = parse_bnf(f.read(), os.path.basename(path))
+    table, conflicts = build_table(grammar)
+    return grammar, CompiledTable(table, grammar.start, EPSILON), conflicts
+
+
+def print_first_follow(grammar: Grammar, out=sys.stdout) -> None:
+    nullable, first, follow = first_follow(grammar.productions, grammar.start)
+    width = max(len(nt) for nt in grammar.nonterminals)
+    for nt in grammar.nonterminals:
+        print(f"{nt:<{width}}  {'ε ' if nt in nullable else '  '}"
+              f"FIRST = {{{', '.join(t.name for t in first[nt])}}}", file=out)
+        print(f"{'':<{width}}    FOLLOW = {{{', '.join(t.name for t in follow[nt])}}}", file=out)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('grammar', nargs='?', default=DEFAULT_GRAMMAR,
+                    help='gramática BNF (por defecto: grammar.bnf)')
+    ap.add_argument('-o', '--output', default=DEFAULT_OUTPUT,
+                    help='módulo a generar (por defecto: ll1_tables.py)')
+    ap.add_argument('--check', action='store_true',
+                    help='no escribir; código 1 si el módulo no está al día')
+    ap.add_argument('--first-follow', action='store_true',
+                    help='mostrar NULLABLE, FIRST y FOLLOW de cada no-terminal')
+    args = ap.parse_args(argv)
+
+    try:
+        grammar, table, conflicts = compile_grammar(args.grammar)
+    except (OSError, GrammarError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.first_follow:
+        print_first_follow(grammar)
+    for nt in unreachable(grammar):
+        print(f"Aviso: el no-terminal {nt} no es alcanzable desde {grammar.start}", file=sys.stderr)
+    if conflicts:
+        for conflict in conflicts:
+            print(conflict, file=sys.stderr)
+        print(f"Error: la gramática no es LL(1) ({len(conflicts)} conflictos); "
+              f"no se genera {os.path.basename(args.output)}", file=sys.stderr)
+        return 1
+
+    text = render_module(table, grammar.start, os.path.basename(args.grammar))
+    try:
+        with open(args.output, encoding='utf-8', newline='') as f:
+            current = f.read()
+    except FileNotFoundError:
+        current = None
+
+    entries = sum(code >= 0 for row in table.rows if row is not None for code in row)
+    summary = (f"{len(table.nonterminals)} no-terminales, {len(grammar.productions)} producciones, "
+               f"{entries} entradas en la tabla")
+    if args.check:
+        if current != text:
+            print(f"{args.output} no está al día con {args.grammar}; "
+                  f"regenerar con `python grammar_compiler.py`", file=sys.stderr)
+            return 1
+        print(f"{os.path.basename(args.output)} al día: {summary}")
+        return 0
+    if current != text:
+        with open(args.output, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(text)
+    print(f"{os.path.basename(args.output)}: {summary}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
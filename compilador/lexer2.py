@@ -7,8 +7,10 @@ Convierte el texto fuente en tokens, detecta errores léxicos
 y, al finalizar, informa del resultado.
 """
 
+import argparse
+import re
 import sys
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from enums import (
     TokenType,    # enum de tipos de token
@@ -18,39 +20,61 @@ from enums import (
     compound_ops, # mapeo de operadores de dos caracteres a TokenType
     VIDEO_FUNCS   # mapeo de nombres @función a TokenType
 )
+from source import SourceFile
+import profiling
+import tracing
 
 class Lexer:
     """Recorre el texto y genera la lista de tokens, acumulando errores."""
 
-    def __init__(self, text: str) -> None:
-        # Texto fuente completo
-        self.text = text
+    def __init__(self, text: Union[str, SourceFile]) -> None:
+        # Fuente completo: este motor avanza carácter a carácter sobre un str,
+        # así que un SourceFile binario (p.ej. mapeado en memoria) se
+        # decodifica entero en una copia. RegexLexer recorre los bytes sin copiarlos.
+        if isinstance(text, SourceFile):
+            self.source = text if text.is_text else SourceFile(text.text, text.path)
+        else:
+            self.source = SourceFile(text)
+        self.text = self.source.data
         # Posición actual en la cadena
         self.pos = 0
-        # Contadores de línea y columna para mensajes
-        self.line = 1
-        self.column = 1
         # Lista de errores léxicos (mensajes)
         self.errors: List[str] = []
+        # Veces que este lexer ha recorrido el fuente (iter_tokens/tokenize)
+        self.runs = 0
+
+    # Línea y columna ya no se actualizan en cada carácter: se calculan a
+    # partir de self.pos sólo cuando alguien las consulta.
+    @property
+    def line(self) -> int:
+        return self._position(self.pos)[0]
+
+    @property
+    def column(self) -> int:
+        return self._position(self.pos)[1]
+
+    def _position(self, offset: int) -> Tuple[int, int]:
+        """(línea, columna) de un desplazamiento de self.text."""
+        return self.source.position(offset)
+
+    def _at(self, offset: int) -> str:
+        """Ubicación para mensajes de error: 'line L, column C'."""
+        ln, col = self._position(offset)
+        return f"line {ln}, column {col}"
+
+    def _token(self, tok_type: TokenType, lex: str, offset: int) -> Token:
+        """Token con posición diferida (desplazamiento en el fuente)."""
+        return Token(tok_type, lex, offset=offset, source=self.source)
 
     def _peek(self) -> str:
         """Devuelve el carácter en self.pos (o cadena vacía si EOF)."""
         return self.text[self.pos] if self.pos < len(self.text) else ''
 
     def _advance(self) -> str:
-        """
-        Avanza una posición:
-         - Actualiza línea/columna si ve '\n'.
-         - Devuelve el carácter consumido.
-        """
+        """Avanza una posición y devuelve el carácter consumido."""
         ch = self._peek()
         if ch:
             self.pos += 1
-            if ch == '\n':
-                self.line += 1
-                self.column = 1
-            else:
-                self.column += 1
         return ch
 
     def _skip_whitespace(self) -> None:
@@ -63,7 +87,7 @@ class Lexer:
         Reconoce un literal numérico (int o float).
         Maneja un único punto decimal y reporta números mal formados.
         """
-        start_pos, ln, col = self.pos, self.line, self.column
+        start_pos = self.pos
         has_dot = False
 
         # Consumir dígitos y, a lo más, un punto
@@ -77,7 +101,7 @@ class Lexer:
                     while (c := self._peek()) and (c.isdigit() or c == '.'):
                         self._advance()
                     lex = self.text[start_pos:self.pos]
-                    self.errors.append(f"Malformed number '{lex}' at line {ln}, column {col}")
+                    self.errors.append(f"Malformed number '{lex}' at {self._at(start_pos)}")
                     return None
                 has_dot = True
                 self._advance()
@@ -90,18 +114,18 @@ class Lexer:
             while (c := self._peek()) and (c.isalnum() or c == '_'):
                 self._advance()
             lex = self.text[start_pos:self.pos]
-            self.errors.append(f"Invalid identifier '{lex}' at line {ln}, column {col}")
+            self.errors.append(f"Invalid identifier '{lex}' at {self._at(start_pos)}")
             return None
 
         tok_type = TokenType.FLOAT_LITERAL if has_dot else TokenType.INT_LITERAL
-        return Token(tok_type, lex, ln, col)
+        return self._token(tok_type, lex, start_pos)
 
     def _string(self) -> Optional[Token]:
         """
         Reconoce literales de cadena encerradas en dobles comillas.
         Reporta si faltan las comillas de cierre.
         """
-        ln, col = self.line, self.column
+        quote = self.pos
         # Consume la comilla de apertura
         self._advance()
         start = self.pos
@@ -109,16 +133,16 @@ class Lexer:
         while True:
             ch = self._peek()
             if not ch:
-                self.errors.append(f"Unterminated string at line {ln}, column {col}")
+                self.errors.append(f"Unterminated string at {self._at(quote)}")
                 return None
             if ch == '"':
                 # Cierre encontrado
                 self._advance()
                 lex = self.text[start:self.pos]
-                return Token(TokenType.STRING_LITERAL, lex, ln, col)
+                return self._token(TokenType.STRING_LITERAL, lex, quote)
             if ch == '\n':
                 # String no puede contener salto de línea
-                self.errors.append(f"Unterminated string at line {ln}, column {col}")
+                self.errors.append(f"Unterminated string at {self._at(quote)}")
                 return None
             self._advance()
 
@@ -127,26 +151,26 @@ class Lexer:
         Reconoce identificadores y palabras reservadas.
         Un identificador: letra/_ seguido de letras/dígitos/_.
         """
-        start, ln, col = self.pos, self.line, self.column
+        start = self.pos
         while (ch := self._peek()) and (ch.isalnum() or ch == '_'):
             self._advance()
         lex = self.text[start:self.pos]
         # Si coincide con palabra reservada, le asigna otro TokenType
         tok_type = KEYWORDS.get(lex, TokenType.IDENTIFIER)
-        return Token(tok_type, lex, ln, col)
+        return self._token(tok_type, lex, start)
 
     def _video_function(self) -> Optional[Token]:
         """
         Reconoce funciones de video/audio prefijadas con @.
         Ej.: @resize, @flip, etc. Mapea a TokenType.VIDEO_RESIZE…
         """
-        ln, col = self.line, self.column
+        at = self.pos
         # Consumir la '@'
         self._advance()
         # Debe seguir una letra o '_'
         if not (self._peek().isalpha() or self._peek() == '_'):
             invalid = '@' + self._peek()
-            self.errors.append(f"Invalid character '{invalid}' at line {ln}, column {col}")
+            self.errors.append(f"Invalid character '{invalid}' at {self._at(at)}")
             if self._peek():
                 self._advance()
             return None
@@ -157,124 +181,323 @@ class Lexer:
         lex = '@' + self.text[start:self.pos]
         tok_type = VIDEO_FUNCS.get(lex)
         if tok_type is None:
-            self.errors.append(f"Invalid function '{lex}' at line {ln}, column {col}")
+            self.errors.append(f"Invalid function '{lex}' at {self._at(at)}")
             return None
-        return Token(tok_type, lex, ln, col)
+        return self._token(tok_type, lex, at)
 
-    def tokenize(self) -> List[Token]:
+    def _scan_token(self, tokens: List[Token]) -> None:
         """
-        Recorre todo el texto fuente y genera la lista de tokens.
-        - Detecta y acumula errores léxicos en self.errors.
-        - Al final, añade un token EOF.
+        Reconoce el lexema que empieza en self.pos (ya sin espacios)
+        y lo añade a tokens, o registra el error léxico correspondiente.
         """
-        tokens: List[Token] = []
-        while self.pos < len(self.text):
-            self._skip_whitespace()
-            if self.pos >= len(self.text):
-                break
+        ch = self._peek()
+        start = self.pos
 
-            ch = self._peek()
-            ln, col = self.line, self.column
-
-            # 1) Comentarios // …
-            if ch == '/' and self.text.startswith('//', self.pos):
-                while self._peek() and self._peek() != '\n':
-                    self._advance()
-                continue
-
-            # 2) Comentarios mal formados /* … */
-            if ch == '/' and self.text.startswith('/*', self.pos):
-                self.errors.append(f"Malformed comment at line {ln}, column {col}")
-                # saltar '/*'
+        # 1) Comentarios // …
+        if ch == '/' and self.text.startswith('//', self.pos):
+            while self._peek() and self._peek() != '\n':
+                self._advance()
+            return
+
+        # 2) Comentarios mal formados /* … */
+        if ch == '/' and self.text.startswith('/*', self.pos):
+            self.errors.append(f"Malformed comment at {self._at(start)}")
+            # saltar '/*'
+            self._advance(); self._advance()
+            # hasta '*/' o EOF
+            while self._peek() and not self.text.startswith('*/', self.pos):
+                self._advance()
+            if self.text.startswith('*/', self.pos):
                 self._advance(); self._advance()
-                # hasta '*/' o EOF
-                while self._peek() and not self.text.startswith('*/', self.pos):
-                    self._advance()
-                if self.text.startswith('*/', self.pos):
-                    self._advance(); self._advance()
-                continue
-
-            # 3) Literales numéricas
-            if ch.isdigit():
-                tok = self._number()
-                if tok:
-                    tokens.append(tok)
-                continue
+            return
 
-            # 4) Literales de cadena
-            if ch == '"':
-                tok = self._string()
-                if tok:
-                    tokens.append(tok)
-                continue
-
-            # 5) Identificadores o keywords
-            if ch.isalpha() or ch == '_':
-                tok = self._identifier()
+        # 3) Literales numéricas
+        if ch.isdigit():
+            tok = self._number()
+            if tok:
                 tokens.append(tok)
-                continue
-
-            # 6) Funciones de video/audio con '@'
-            if ch == '@':
-                tok = self._video_function()
-                if tok:
-                    tokens.append(tok)
-                continue
-
-            # 7) Operadores de dos caracteres (==, !=, <=, >=, &&, ||, etc.)
-            two = self.text[self.pos:self.pos+2]
-            if two in compound_ops:
-                self._advance(); self._advance()
-                tokens.append(Token(compound_ops[two], two, ln, col))
-                continue
+            return
 
-            # 8) Símbolos simples (p.ej. ; , ( ) { } + - * / < > = : …)
-            if ch in symbols:
-                self._advance()
-                tokens.append(Token(symbols[ch], ch, ln, col))
-                continue
+        # 4) Literales de cadena
+        if ch == '"':
+            tok = self._string()
+            if tok:
+                tokens.append(tok)
+            return
+
+        # 5) Identificadores o keywords
+        if ch.isalpha() or ch == '_':
+            tok = self._identifier()
+            tokens.append(tok)
+            return
+
+        # 6) Funciones de video/audio con '@'
+        if ch == '@':
+            tok = self._video_function()
+            if tok:
+                tokens.append(tok)
+            return
+
+        # 7) Operadores de dos caracteres (==, !=, <=, >=, &&, ||, etc.)
+        two = self.text[self.pos:self.pos+2]
+        if two in compound_ops:
+            self._advance(); self._advance()
+            tokens.append(self._token(compound_ops[two], two, start))
+            return
 
-            # 9) Carácter inválido
-            self.errors.append(f"Invalid character '{ch}' at line {ln}, column {col}")
+        # 8) Símbolos simples (p.ej. ; , ( ) { } + - * / < > = : …)
+        if ch in symbols:
             self._advance()
+            tokens.append(self._token(symbols[ch], ch, start))
+            return
+
+        # 9) Carácter inválido
+        self.errors.append(f"Invalid character '{ch}' at {self._at(start)}")
+        self._advance()
+
+    def iter_tokens(self) -> Iterator[Token]:
+        """
+        Generador de tokens: reconoce el siguiente lexema sólo cuando se
+        pide, de modo que nunca se materializa la lista completa.
+        - Los errores léxicos se acumulan en self.errors a medida que avanza.
+        - El último token emitido es EOF.
+        """
+        self.runs += 1
+        pending: List[Token] = []
+        while self.pos < len(self.text):
+            self._skip_whitespace()
+            if self.pos >= len(self.text):
+                break
+            self._scan_token(pending)
+            if pending:
+                yield from pending
+                pending.clear()
 
         # Añadir token EOF al final
-        tokens.append(Token(TokenType.EOF, '', self.line, self.column))
+        yield self._token(TokenType.EOF, '', self.pos)
+
+    def tokenize(self) -> List[Token]:
+        """
+        Recorre todo el texto fuente y genera la lista de tokens.
+        - Detecta y acumula errores léxicos en self.errors.
+        - Al final, añade un token EOF.
+        """
+        with profiling.phase('Lexer.tokenize'):
+            tokens = list(self.iter_tokens())
+        profiling.count_tokens(len(tokens))
+        trace = tracing.LEXER
+        if trace.info:
+            trace.write(f"{len(tokens)} tokens, {len(self.errors)} errores léxicos")
+        if trace.debug:
+            for tok in tokens:
+                trace.write(str(tok))
         return tokens
 
 
+def _alternatives(lexemes) -> str:
+    """Alternativa regex de lexemas literales, los más largos primero."""
+    return '|'.join(re.escape(lx) for lx in sorted(lexemes, key=len, reverse=True))
+
+
+# Tabla lexema (bytes) → (TokenType, lexema) para todo lo que el patrón
+# maestro reconoce literalmente: símbolos, operadores compuestos, palabras
+# reservadas y funciones @.
+_LITERAL_TOKENS = {
+    lex.encode('ascii'): (tok_type, lex)
+    for lex, tok_type in {**symbols, **compound_ops, **KEYWORDS, **VIDEO_FUNCS}.items()
+}
+
+# Patrón maestro sobre los bytes UTF-8 del fuente: un grupo con nombre por
+# clase de lexema. El orden de las alternativas reproduce el orden de
+# decisión de Lexer._scan_token. Los casos raros (números mal formados,
+# letras o dígitos no ASCII, '@' suelto…) caen en OTHER y se delegan al
+# reconocedor carácter a carácter, de modo que tokens y mensajes de error
+# son idénticos a los de Lexer.
+_NOT_WORD = r"(?![\w\x80-\xff])"
+MASTER_PATTERN = re.compile(
+    (
+        r"(?P<WS>[ \t\r\n]+)"
+        r"|(?P<COMMENT>//[^\n]*)"
+        r"|(?P<BAD_COMMENT>/\*.*?(?:\*/|\Z))"
+        r"|(?P<NUMBER>[0-9]+(?:\.[0-9]*)?)(?![.\w\x80-\xff])"
+        r'|(?P<STRING>"[^"\n]*")'
+        r'|(?P<BAD_STRING>"[^"\n]*)'
+        rf"|(?P<IDENT>[A-Za-z_]\w*){_NOT_WORD}"
+        rf"|(?P<FUNC>(?:{_alternatives(VIDEO_FUNCS)})){_NOT_WORD}"
+        rf"|(?P<OP>{_alternatives(symbols.keys() | compound_ops.keys())})"
+        r"|(?P<OTHER>.)"
+    ).encode('ascii'),
+    re.DOTALL,
+)
+
+
+class RegexLexer(Lexer):
+    """
+    Motor alternativo de Lexer: recorre los bytes del fuente (p.ej. un
+    SourceFile mapeado en memoria) con MASTER_PATTERN en lugar de avanzar
+    carácter a carácter. Los tokens guardan el desplazamiento en bytes y la
+    línea/columna se resuelven después con SourceFile.position.
+    """
+
+    def __init__(self, text: Union[str, SourceFile]) -> None:
+        if isinstance(text, SourceFile):
+            self.source = SourceFile.from_text(text.data, text.path) if text.is_text else text
+        else:
+            self.source = SourceFile.from_text(text)
+        self.text = self.source.data
+        self.pos = 0
+        self.errors: List[str] = []
+        self.runs = 0
+
+    def iter_tokens(self) -> Iterator[Token]:
+        self.runs += 1
+        data = self.text
+        source = self.source
+        end = len(data)
+        finditer = MASTER_PATTERN.finditer
+        literal_tokens = _LITERAL_TOKENS
+        errors = self.errors
+        # Identificadores ya decodificados: cada nombre repetido comparte str
+        names: Dict[bytes, str] = {}
+        pos = self.pos
+
+        while pos < end:
+            for m in finditer(data, pos):
+                kind = m.lastgroup
+                start, pos = m.span()
+
+                if kind == 'WS' or kind == 'COMMENT':
+                    continue
+                if kind == 'IDENT':
+                    lex = m.group()
+                    hit = literal_tokens.get(lex)
+                    if hit is None:
+                        value = names.get(lex)
+                        if value is None:
+                            value = names[lex] = lex.decode('ascii')
+                        yield Token(TokenType.IDENTIFIER, value, offset=start, source=source)
+                    else:
+                        yield Token(hit[0], hit[1], offset=start, source=source)
+                elif kind == 'OP' or kind == 'FUNC':
+                    tok_type, value = literal_tokens[m.group()]
+                    yield Token(tok_type, value, offset=start, source=source)
+                elif kind == 'NUMBER':
+                    lex = m.group()
+                    tok_type = TokenType.FLOAT_LITERAL if b'.' in lex else TokenType.INT_LITERAL
+                    yield Token(tok_type, lex.decode('ascii'), offset=start, source=source)
+                elif kind == 'STRING':
+                    value = str(data[start + 1:pos], 'utf-8')
+                    yield Token(TokenType.STRING_LITERAL, value, offset=start, source=source)
+                elif kind == 'BAD_COMMENT':
+                    errors.append(f"Malformed comment at {self._at(start)}")
+                elif kind == 'BAD_STRING':
+                    errors.append(f"Unterminated string at {self._at(start)}")
+                else:
+                    # OTHER: delegar en el reconocedor carácter a carácter y
+                    # reanudar el recorrido con el patrón tras el lexema
+                    if tracing.LEXER.debug:
+                        tracing.LEXER.write(f"lexema no reconocido por el patrón en {self._at(start)}: "
+                                            "se usa el reconocedor carácter a carácter")
+                    window = _LineLexer(source, start, errors)
+                    pending: List[Token] = []
+                    window._scan_token(pending)
+                    yield from pending
+                    pos = window.byte_offset(window.pos)
+                    break
+
+        self.pos = pos
+        yield Token(TokenType.EOF, '', offset=pos, source=source)
+
+
+class _LineLexer(Lexer):
+    """
+    Reconocedor carácter a carácter sobre la línea (decodificada) que empieza
+    en el byte `start` de un SourceFile binario. Lo usa RegexLexer para los
+    lexemas que su patrón no resuelve; traduce sus posiciones a bytes del
+    fuente original y comparte la lista de errores.
+    """
+
+    def __init__(self, source: SourceFile, start: int, errors: List[str]) -> None:
+        data = source.data
+        end = data.find(b'\n', start)
+        end = len(data) if end < 0 else end + 1
+        super().__init__(str(data[start:end], 'utf-8'))
+        self.errors = errors
+        self.parent = source
+        self.base = start
+
+    def byte_offset(self, offset: int) -> int:
+        return self.base + len(self.text[:offset].encode('utf-8'))
+
+    def _position(self, offset: int) -> Tuple[int, int]:
+        return self.parent.position(self.byte_offset(offset))
+
+    def _token(self, tok_type: TokenType, lex: str, offset: int) -> Token:
+        return Token(tok_type, lex, offset=self.byte_offset(offset), source=self.parent)
+
+
+# Motores de análisis léxico seleccionables con --lexer
+LEXER_ENGINES = {
+    'char': Lexer,
+    'regex': RegexLexer,
+}
+
+
+def make_lexer(text: Union[str, SourceFile], engine: str = 'char') -> Lexer:
+    """Crea el lexer del motor indicado ('char' o 'regex')."""
+    return LEXER_ENGINES[engine](text)
+
+
+def report_tokens(tokens: List[Token], errors: List[str], listing: bool = True) -> int:
+    """
+    Muestra la lista de tokens (si `listing`) y los errores léxicos.
+    Devuelve el código de salida de la fase (0 = sin errores).
+    """
+    # Mostrar todos los tokens (incluye EOF)
+    if listing:
+        print("--- TOKENS ---")
+        for t in tokens:
+            if t.type != TokenType.EOF:
+                print(t)
+        print("EOF")
+
+    # Informar resultado del análisis léxico
+    if report_errors(errors):
+        return 1
+    print("\nAnálisis léxico completado sin errores")
+    return 0
+
+
+def report_errors(errors: List[str]) -> int:
+    """Muestra los errores léxicos, si los hay. Devuelve 1 si hubo errores."""
+    if not errors:
+        return 0
+    print("\n--- ERRORES LÉXICOS ---")
+    for err in errors:
+        print(err)
+    return 1
+
+
 def main() -> None:
     """Punto de entrada cuando se ejecuta 'python lexer2.py archivo'."""
-    if len(sys.argv) != 2:
-        print("Uso: python lexer2.py <archivo.txt>")
-        sys.exit(1)
+    ap = argparse.ArgumentParser(prog='lexer2.py', description='Análisis léxico de un archivo fuente.')
+    ap.add_argument('path', metavar='archivo.txt')
+    ap.add_argument('--lexer', choices=sorted(LEXER_ENGINES), default='char',
+                    help="motor del lexer (por defecto: char)")
+    args = ap.parse_args()
 
-    path = sys.argv[1]
+    path = args.path
     try:
-        src = open(path, encoding='utf-8').read()
+        src = SourceFile.open(path)
     except FileNotFoundError:
         print(f"Error: no existe '{path}'")
         sys.exit(1)
 
-    lexer = Lexer(src)
-    tokens = lexer.tokenize()
-
-    # Mostrar todos los tokens (incluye EOF)
-    print("--- TOKENS ---")
-    for t in tokens:
-        if t.type != TokenType.EOF:
-            print(t)
-    print("EOF")
-
-    # Informar resultado del análisis léxico
-    if lexer.errors:
-        print("\n--- ERRORES LÉXICOS ---")
-        for err in lexer.errors:
-            print(err)
-        sys.exit(1)
-    else:
-        print("\nAnálisis léxico completado sin errores")
-        sys.exit(0)
+    with src:
+        lexer = make_lexer(src, args.lexer)
+        tokens = lexer.tokenize()
+        code = report_tokens(tokens, lexer.errors)
+    sys.exit(code)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,268 @@
+# ll1_table.py
+
+"""
+Tabla LL(1) compilada a enteros, para que el bucle del parser trabaje sólo
+con ints y tuplas.
+
+Identificadores de símbolo:
+  - terminal:     su código TokenType.value (1..N)
+  - no-terminal:  nt_base + k, con nt_base = N + 1
+
+Las producciones se numeran; `rows[k][código]` es el número de producción
+a aplicar para el no-terminal k con ese lookahead (-1 si no hay entrada).
+EPSILON se filtra de antemano, y para cada producción se guardan ya
+invertidos los ids a apilar. bind() asocia acciones semánticas a las
+producciones de cada no-terminal.
+
+Una CompiledTable se obtiene de dos formas:
+  - CompiledTable(tabla, inicial, epsilon): compila una tabla en formato
+    {no-terminal: {TokenType: [símbolos]}}; es lo que hace
+    grammar_compiler.py con la tabla que genera desde grammar.bnf;
+  - CompiledTable.load(ll1_tables): adopta las constantes del módulo que
+    generó grammar_compiler.py, sin construir nada. Es la del parser.
+
+first_follow() calcula NULLABLE, FIRST y FOLLOW de una lista de
+producciones. El parser sólo los usa para recuperarse de errores
+sintácticos: la tabla cargada los trae calculados y la compilada los
+calcula la primera vez que hacen falta.
+"""
+
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple, Union
+
+from enums import TokenType
+
+Symbol = Union[TokenType, str]
+Production = Tuple[Hashable, Tuple[Hashable, ...]]
+# Conjunto ordenado: las claves de un dict, en orden de inserción
+OrderedSet = Dict[Hashable, None]
+
+
+def first_follow(productions: Sequence[Production], start: Hashable
+                 ) -> Tuple[Set[Hashable], Dict[Hashable, OrderedSet], Dict[Hashable, OrderedSet]]:
+    """
+    (NULLABLE, FIRST, FOLLOW) de una gramática dada como [(lhs, rhs)], con
+    las partes derechas ya sin ε. Son no-terminales los símbolos que
+    aparecen como lhs; FIRST y FOLLOW sólo contienen terminales. FOLLOW
+    del símbolo inicial empieza vacío (el fin de entrada es un terminal
+    explícito de la gramática).
+
+    FIRST y FOLLOW son conjuntos ordenados (dicts) en el orden de la
+    gramática: primero lo que aporta la primera alternativa (o la primera
+    aparición del no-terminal), y así sucesivamente. El resultado no
+    depende del hash de los símbolos ni del orden del punto fijo.
+    """
+    nonterminals = {lhs for lhs, _ in productions}
+    nullable: Set[Hashable] = set()
+    first: Dict[Hashable, Set[Hashable]] = {nt: set() for nt in nonterminals}
+    follow: Dict[Hashable, Set[Hashable]] = {nt: set() for nt in nonterminals}
+    follow[start] = set()
+
+    changed = True
+    while changed:
+        changed = False
+        for lhs, rhs in productions:
+            target = first[lhs]
+            size = len(target)
+            for sym in rhs:
+                if sym not in nonterminals:
+                    target.add(sym)
+                    break
+                target |= first[sym]
+                if sym not in nullable:
+                    break
+            else:
+                if lhs not in nullable:
+                    nullable.add(lhs)
+                    changed = True
+            changed = changed or len(target) != size
+
+    changed = True
+    while changed:
+        changed = False
+        for lhs, rhs in productions:
+            # Lo que puede seguir al símbolo actual, de derecha a izquierda
+            trailer = set(follow[lhs])
+            for sym in reversed(rhs):
+                if sym not in nonterminals:
+                    trailer = {sym}
+                    continue
+                size = len(follow[sym])
+                follow[sym] |= trailer
+                changed = changed or len(follow[sym]) != size
+                trailer = trailer | first[sym] if sym in nullable else set(first[sym])
+
+    # Orden: recorrido en profundidad de la gramática. Un ciclo corta el
+    # recorrido, así que al terminar cada no-terminal se completa con lo
+    # que falte del punto fijo, en orden de aparición en las producciones.
+    position: Dict[Hashable, int] = {}
+    for lhs, rhs in productions:
+        for sym in rhs:
+            position.setdefault(sym, len(position))
+
+    def ordered(sets: Dict[Hashable, Set[Hashable]], walk) -> Dict[Hashable, OrderedSet]:
+        result: Dict[Hashable, OrderedSet] = {}
+
+        def visit(nt: Hashable) -> OrderedSet:
+            if nt not in result:
+                out = result[nt] = {}
+                walk(nt, out, visit)
+                out |= dict.fromkeys(sorted(sets[nt] - out.keys(), key=position.__getitem__))
+            return result[nt]
+
+        for nt in sets:
+            visit(nt)
+        return result
+
+    def prefix(rhs, out: OrderedSet, visit) -> bool:
+        """Añade FIRST(rhs) a `out`; True si rhs puede derivar ε."""
+        for sym in rhs:
+            if sym not in nonterminals:
+                out[sym] = None
+                return False
+            out |= visit(sym)
+            if sym not in nullable:
+                return False
+        return True
+
+    def walk_first(nt, out, visit) -> None:
+        for lhs, rhs in productions:
+            if lhs == nt:
+                prefix(rhs, out, visit)
+
+    ordered_first = ordered(first, walk_first)
+
+    def walk_follow(nt, out, visit) -> None:
+        for lhs, rhs in productions:
+            for i, sym in enumerate(rhs):
+                if sym == nt and prefix(rhs[i + 1:], out, ordered_first.__getitem__):
+                    out |= visit(lhs)
+
+    return nullable, ordered_first, ordered(follow, walk_follow)
+
+
+class CompiledTable:
+    """Tabla LL(1) densa indexada por enteros."""
+
+    def __init__(self, parsing_table: Dict[str, Dict[Symbol, list]],
+                 start_symbol: str, epsilon: str) -> None:
+        self.nt_base = max(t.value for t in TokenType) + 1
+
+        # No-terminales: primero los que tienen fila, después los que sólo
+        # aparecen en alguna parte derecha (su fila queda en None).
+        self.nonterminals: List[str] = list(parsing_table)
+        for row in parsing_table.values():
+            for prod in row.values():
+                for sym in prod:
+                    if isinstance(sym, str) and sym != epsilon and sym not in parsing_table \
+                            and sym not in self.nonterminals:
+                        self.nonterminals.append(sym)
+        nt_id = {nt: self.nt_base + k for k, nt in enumerate(self.nonterminals)}
+        self.start = nt_id[start_symbol]
+
+        # Producciones: ids de la parte derecha (sin ε), ids a apilar
+        # (invertidos) y texto de la regla para la traza paso a paso.
+        self.rhs: List[Tuple[int, ...]] = []
+        self.push: List[Tuple[int, ...]] = []
+        self.rule_text: List[str] = []
+        self.lhs: List[str] = []
+        self.rows: List[Optional[Tuple[int, ...]]] = []
+        # Lookaheads de cada no-terminal para los mensajes de error
+        self.expected_text: List[str] = []
+        width = self.nt_base
+        for nt in self.nonterminals:
+            row = parsing_table.get(nt)
+            if row is None:
+                self.rows.append(None)
+                self.expected_text.append('')
+                continue
+            dense = [-1] * width
+            # La misma producción en varios lookaheads se numera una vez
+            numbered: Dict[Tuple[Symbol, ...], int] = {}
+            for lookahead, prod in row.items():
+                prod = tuple(prod)
+                if prod in numbered:
+                    dense[lookahead.value] = numbered[prod]
+                    continue
+                rhs = tuple(s.value if isinstance(s, TokenType) else nt_id[s] for s in prod if s != epsilon)
+                dense[lookahead.value] = numbered[prod] = len(self.rhs)
+                self.rhs.append(rhs)
+                self.push.append(rhs[::-1])
+                shown = ' '.join('ε' if s == epsilon else (s.name if isinstance(s, TokenType) else s)
+                                 for s in prod)
+                self.rule_text.append(f"{nt:<15} -> {shown}")
+                self.lhs.append(nt)
+            self.rows.append(tuple(dense))
+            self.expected_text.append(', '.join(t.name for t in row))
+        self._symbols = None
+        self._sets = None
+
+    @classmethod
+    def load(cls, data) -> 'CompiledTable':
+        """
+        Tabla a partir de las constantes de un módulo generado por
+        grammar_compiler.py (ll1_tables). No copia ni convierte nada: los
+        códigos de token tienen que ser los del TokenType actual.
+        """
+        if data.TOKENS != tuple(t.name for t in TokenType):
+            raise RuntimeError(f"{data.__name__} no corresponde a los TokenType de enums.py; "
+                               f"hay que regenerarlo con `python grammar_compiler.py`")
+        table = cls.__new__(cls)
+        table.nt_base = data.NT_BASE
+        table.nonterminals = data.NONTERMINALS
+        table.start = data.START
+        table.rhs = data.RHS
+        table.push = data.PUSH
+        table.rule_text = data.RULE_TEXT
+        table.lhs = data.LHS
+        table.rows = data.ROWS
+        table.expected_text = data.EXPECTED
+        table._symbols = None
+        table._sets = (data.FIRST, data.FOLLOW)
+        return table
+
+    @property
+    def symbols(self) -> Tuple[Tuple[Symbol, ...], ...]:
+        """Parte derecha de cada producción con TokenType y nombres (para el árbol de parseo)."""
+        if self._symbols is None:
+            nt_base, nonterminals = self.nt_base, self.nonterminals
+            self._symbols = tuple(
+                tuple(TokenType(s) if s < nt_base else nonterminals[s - nt_base] for s in rhs)
+                for rhs in self.rhs
+            )
+        return self._symbols
+
+    def bind(self, actions: Dict[str, Callable]) -> Tuple[Optional[Callable], ...]:
+        """Acción semántica de cada producción (None si su no-terminal no tiene)."""
+        unknown = set(actions) - set(self.nonterminals)
+        if unknown:
+            raise KeyError(f"Acciones para no-terminales inexistentes: {', '.join(sorted(unknown))}")
+        return tuple(actions.get(nt) for nt in self.lhs)
+
+    def first_follow(self) -> Tuple[Tuple[Sequence[int], ...], Tuple[Sequence[int], ...]]:
+        """(FIRST, FOLLOW) de cada no-terminal (por índice, como `rows`) en códigos de token."""
+        if self._sets is None:
+            nt_id = {nt: self.nt_base + k for k, nt in enumerate(self.nonterminals)}
+            productions = [(nt_id[nt], rhs) for nt, rhs in zip(self.lhs, self.rhs)]
+            _, first, follow = first_follow(productions, self.start)
+            self._sets = tuple(
+                tuple(tuple(sets.get(self.nt_base + k, ())) for k in range(len(self.nonterminals)))
+                for sets in (first, follow)
+            )
+        return self._sets
+
+    def accepts(self, sym_id: int, code: int) -> bool:
+        """¿Puede `sym_id` (en la cima de la pila) continuar con el lookahead `code`?"""
+        if sym_id < self.nt_base:
+            return sym_id == code
+        row = self.rows[sym_id - self.nt_base]
+        return row is not None and row[code] >= 0
+
+    def name(self, sym_id: int) -> str:
+        """Nombre legible de un id de símbolo."""
+        if sym_id >= self.nt_base:
+            return self.nonterminals[sym_id - self.nt_base]
+        return TokenType(sym_id).name
+
+    def expected(self, sym_id: int) -> str:
+        """Lookaheads válidos de un no-terminal, en el orden de su fila."""
+        return self.expected_text[sym_id - self.nt_base]
@@ -0,0 +1,538 @@
+# ll1_tables.py
+# Generado por grammar_compiler.py a partir de grammar.bnf: no editar a mano.
+# Para regenerarlo: python grammar_compiler.py
+
+"""
+Tabla LL(1) del parser compilada a enteros (ver ll1_table.CompiledTable.load).
+Todo son literales constantes: el .pyc los guarda ya construidos y
+cargarlos no crea ningún dict.
+"""
+
+# Hash del contenido de la tabla (cache.grammar_hash)
+TABLE_HASH = '8ae62f17e13156a076903ba3c65c1471988c4898f8d51100823412b134d2730a'
+
+TOKENS = ('MAIN', 'IF', 'ELSE', 'WHILE', 'EXPORT', 'AS', 'INT_TYPE', 'FLOAT_TYPE', 'STRING_TYPE', 'VIDEO_TYPE', 'AUDIO_TYPE', 'INT_LITERAL', 'FLOAT_LITERAL', 'STRING_LITERAL', 'IDENTIFIER', 'NOT', 'AND', 'OR', 'ASSIGN', 'PLUS', 'MINUS', 'MULT', 'DIV', 'EQ', 'NEQ', 'LT', 'GT', 'LE', 'GE', 'LPAREN', 'RPAREN', 'LBRACE', 'RBRACE', 'LBRACKET', 'RBRACKET', 'COMMA', 'SEMICOLON', 'COLON', 'VIDEO_RESIZE', 'VIDEO_FLIP', 'VIDEO_VELOCIDAD', 'VIDEO_FADEIN', 'VIDEO_FADEOUT', 'VIDEO_SILENCIO', 'VIDEO_QUITAR_AUDIO', 'VIDEO_AGREGAR_MUSICA', 'VIDEO_CONCATENAR', 'VIDEO_CORTAR', 'EOF', 'ERROR')
+
+START_SYMBOL = 'Program'
+NT_BASE = 51
+START = 51
+
+NONTERMINALS = (
+    'Program',
+    'Block',
+    'StmtList',
+    'Stmt',
+    'IfStmt',
+    'ElseOpt',
+    'WhileStmt',
+    'VarDecl',
+    'VarInitOpt',
+    'Type',
+    'Assignment',
+    'Expr',
+    'OrExpr',
+    "OrExpr'",
+    'AndExpr',
+    "AndExpr'",
+    'EqualityExpr',
+    "EqualityExpr'",
+    'RelExpr',
+    "RelExpr'",
+    'AddExpr',
+    "AddExpr'",
+    'Term',
+    "Term'",
+    'Factor',
+    'FunctionCall',
+    'ResizeArgs',
+    'FlipArgs',
+    'VelocidadArgs',
+    'FadeInArgs',
+    'FadeOutArgs',
+    'EmptyArgs',
+    'AgregarMusicaArgs',
+    'ConcatenarArgs',
+    'CortarArgs',
+    'Number',
+    'ExportStmt',
+)
+
+# Por no-terminal: producción para cada código de lookahead (-1: error)
+ROWS = (
+    (-1, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # Program
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # Block
+    (-1, -1, 2, -1, 2, 2, -1, 2, 2, 2, 2, 2, -1, -1, -1, 2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 3, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # StmtList
+    (-1, -1, 7, -1, 8, 5, -1, 4, 4, 4, 4, 4, -1, -1, -1, 6, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # Stmt
+    (-1, -1, 9, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # IfStmt
+    (-1, -1, 11, 10, 11, 11, -1, 11, 11, 11, 11, 11, -1, -1, -1, 11, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 11, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # ElseOpt
+    (-1, -1, -1, -1, 12, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # WhileStmt
+    (-1, -1, -1, -1, -1, -1, -1, 13, 13, 13, 13, 13, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # VarDecl
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 14, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 15, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # VarInitOpt
+    (-1, -1, -1, -1, -1, -1, -1, 16, 17, 18, 19, 20, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # Type
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 21, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # Assignment
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 22, 22, 22, 22, 22, -1, -1, -1, -1, 22, -1, -1, -1, -1, -1, -1, -1, -1, 22, -1, -1, -1, -1, -1, -1, -1, -1, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, -1, -1),  # Expr
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 23, 23, 23, 23, 23, -1, -1, -1, -1, 23, -1, -1, -1, -1, -1, -1, -1, -1, 23, -1, -1, -1, -1, -1, -1, -1, -1, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, -1, -1),  # OrExpr
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 24, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 25, -1, -1, -1, -1, -1, 25, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # OrExpr'
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 26, 26, 26, 26, 26, -1, -1, -1, -1, 26, -1, -1, -1, -1, -1, -1, -1, -1, 26, -1, -1, -1, -1, -1, -1, -1, -1, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, -1, -1),  # AndExpr
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 27, 28, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # AndExpr'
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 29, 29, 29, 29, 29, -1, -1, -1, -1, 29, -1, -1, -1, -1, -1, -1, -1, -1, 29, -1, -1, -1, -1, -1, -1, -1, -1, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, -1, -1),  # EqualityExpr
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 32, 32, -1, -1, -1, -1, -1, 30, 31, -1, -1, -1, -1, -1, 32, -1, -1, -1, -1, -1, 32, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # EqualityExpr'
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 33, 33, 33, 33, 33, -1, -1, -1, -1, 33, -1, -1, -1, -1, -1, -1, -1, -1, 33, -1, -1, -1, -1, -1, -1, -1, -1, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, -1, -1),  # RelExpr
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 38, 38, -1, -1, -1, -1, -1, 38, 38, 34, 36, 35, 37, -1, 38, -1, -1, -1, -1, -1, 38, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # RelExpr'
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 39, 39, 39, 39, 39, -1, -1, -1, -1, 39, -1, -1, -1, -1, -1, -1, -1, -1, 39, -1, -1, -1, -1, -1, -1, -1, -1, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, -1, -1),  # AddExpr
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 42, 42, -1, 40, 41, -1, -1, 42, 42, 42, 42, 42, 42, -1, 42, -1, -1, -1, -1, -1, 42, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # AddExpr'
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 43, 43, 43, 43, 43, -1, -1, -1, -1, 43, -1, -1, -1, -1, -1, -1, -1, -1, 43, -1, -1, -1, -1, -1, -1, -1, -1, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, -1, -1),  # Term
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 46, 46, -1, 46, 46, 44, 45, 46, 46, 46, 46, 46, 46, -1, 46, -1, -1, -1, -1, -1, 46, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # Term'
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 48, 49, 50, 47, 52, -1, -1, -1, -1, 53, -1, -1, -1, -1, -1, -1, -1, -1, 51, -1, -1, -1, -1, -1, -1, -1, -1, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, -1, -1),  # Factor
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, -1, -1),  # FunctionCall
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 65, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # ResizeArgs
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 66, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # FlipArgs
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 67, 67, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # VelocidadArgs
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 68, 68, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # FadeInArgs
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 69, 69, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # FadeOutArgs
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 70, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # EmptyArgs
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 71, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # AgregarMusicaArgs
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 72, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # ConcatenarArgs
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 73, 73, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # CortarArgs
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 74, 75, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # Number
+    (-1, -1, -1, -1, -1, 76, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # ExportStmt
+)
+
+# Por no-terminal: lookaheads válidos, para "Se esperaba uno de: ..."
+EXPECTED = (
+    'MAIN',
+    'LBRACE',
+    'INT_TYPE, FLOAT_TYPE, STRING_TYPE, VIDEO_TYPE, AUDIO_TYPE, EXPORT, IDENTIFIER, IF, WHILE, RBRACE',
+    'INT_TYPE, FLOAT_TYPE, STRING_TYPE, VIDEO_TYPE, AUDIO_TYPE, EXPORT, IDENTIFIER, IF, WHILE',
+    'IF',
+    'ELSE, INT_TYPE, FLOAT_TYPE, STRING_TYPE, VIDEO_TYPE, AUDIO_TYPE, EXPORT, IDENTIFIER, IF, WHILE, RBRACE',
+    'WHILE',
+    'INT_TYPE, FLOAT_TYPE, STRING_TYPE, VIDEO_TYPE, AUDIO_TYPE',
+    'ASSIGN, SEMICOLON',
+    'INT_TYPE, FLOAT_TYPE, STRING_TYPE, VIDEO_TYPE, AUDIO_TYPE',
+    'IDENTIFIER',
+    'IDENTIFIER, INT_LITERAL, FLOAT_LITERAL, STRING_LITERAL, LPAREN, NOT, MINUS, VIDEO_RESIZE, VIDEO_FLIP, VIDEO_VELOCIDAD, VIDEO_FADEIN, VIDEO_FADEOUT, VIDEO_SILENCIO, VIDEO_QUITAR_AUDIO, VIDEO_AGREGAR_MUSICA, VIDEO_CONCATENAR, VIDEO_CORTAR',
+    'IDENTIFIER, INT_LITERAL, FLOAT_LITERAL, STRING_LITERAL, LPAREN, NOT, MINUS, VIDEO_RESIZE, VIDEO_FLIP, VIDEO_VELOCIDAD, VIDEO_FADEIN, VIDEO_FADEOUT, VIDEO_SILENCIO, VIDEO_QUITAR_AUDIO, VIDEO_AGREGAR_MUSICA, VIDEO_CONCATENAR, VIDEO_CORTAR',
+    'OR, RPAREN, SEMICOLON',
+    'IDENTIFIER, INT_LITERAL, FLOAT_LITERAL, STRING_LITERAL, LPAREN, NOT, MINUS, VIDEO_RESIZE, VIDEO_FLIP, VIDEO_VELOCIDAD, VIDEO_FADEIN, VIDEO_FADEOUT, VIDEO_SILENCIO, VIDEO_QUITAR_AUDIO, VIDEO_AGREGAR_MUSICA, VIDEO_CONCATENAR, VIDEO_CORTAR',
+    'AND, OR, RPAREN, SEMICOLON',
+    'IDENTIFIER, INT_LITERAL, FLOAT_LITERAL, STRING_LITERAL, LPAREN, NOT, MINUS, VIDEO_RESIZE, VIDEO_FLIP, VIDEO_VELOCIDAD, VIDEO_FADEIN, VIDEO_FADEOUT, VIDEO_SILENCIO, VIDEO_QUITAR_AUDIO, VIDEO_AGREGAR_MUSICA, VIDEO_CONCATENAR, VIDEO_CORTAR',
+    'EQ, NEQ, AND, OR, RPAREN, SEMICOLON',
+    'IDENTIFIER, INT_LITERAL, FLOAT_LITERAL, STRING_LITERAL, LPAREN, NOT, MINUS, VIDEO_RESIZE, VIDEO_FLIP, VIDEO_VELOCIDAD, VIDEO_FADEIN, VIDEO_FADEOUT, VIDEO_SILENCIO, VIDEO_QUITAR_AUDIO, VIDEO_AGREGAR_MUSICA, VIDEO_CONCATENAR, VIDEO_CORTAR',
+    'LT, LE, GT, GE, EQ, NEQ, AND, OR, RPAREN, SEMICOLON',
+    'IDENTIFIER, INT_LITERAL, FLOAT_LITERAL, STRING_LITERAL, LPAREN, NOT, MINUS, VIDEO_RESIZE, VIDEO_FLIP, VIDEO_VELOCIDAD, VIDEO_FADEIN, VIDEO_FADEOUT, VIDEO_SILENCIO, VIDEO_QUITAR_AUDIO, VIDEO_AGREGAR_MUSICA, VIDEO_CONCATENAR, VIDEO_CORTAR',
+    'PLUS, MINUS, LT, LE, GT, GE, EQ, NEQ, AND, OR, RPAREN, SEMICOLON',
+    'IDENTIFIER, INT_LITERAL, FLOAT_LITERAL, STRING_LITERAL, LPAREN, NOT, MINUS, VIDEO_RESIZE, VIDEO_FLIP, VIDEO_VELOCIDAD, VIDEO_FADEIN, VIDEO_FADEOUT, VIDEO_SILENCIO, VIDEO_QUITAR_AUDIO, VIDEO_AGREGAR_MUSICA, VIDEO_CONCATENAR, VIDEO_CORTAR',
+    'MULT, DIV, PLUS, MINUS, LT, LE, GT, GE, EQ, NEQ, AND, OR, RPAREN, SEMICOLON',
+    'IDENTIFIER, INT_LITERAL, FLOAT_LITERAL, STRING_LITERAL, LPAREN, NOT, MINUS, VIDEO_RESIZE, VIDEO_FLIP, VIDEO_VELOCIDAD, VIDEO_FADEIN, VIDEO_FADEOUT, VIDEO_SILENCIO, VIDEO_QUITAR_AUDIO, VIDEO_AGREGAR_MUSICA, VIDEO_CONCATENAR, VIDEO_CORTAR',
+    'VIDEO_RESIZE, VIDEO_FLIP, VIDEO_VELOCIDAD, VIDEO_FADEIN, VIDEO_FADEOUT, VIDEO_SILENCIO, VIDEO_QUITAR_AUDIO, VIDEO_AGREGAR_MUSICA, VIDEO_CONCATENAR, VIDEO_CORTAR',
+    'IDENTIFIER',
+    'STRING_LITERAL',
+    'INT_LITERAL, FLOAT_LITERAL',
+    'INT_LITERAL, FLOAT_LITERAL',
+    'INT_LITERAL, FLOAT_LITERAL',
+    'RBRACKET',
+    'STRING_LITERAL',
+    'IDENTIFIER',
+    'INT_LITERAL, FLOAT_LITERAL',
+    'INT_LITERAL, FLOAT_LITERAL',
+    'EXPORT',
+)
+
+# Por no-terminal: FIRST y FOLLOW en códigos de token (recuperación de errores)
+FIRST = (
+    (1,),  # Program
+    (32,),  # Block
+    (7, 8, 9, 10, 11, 5, 15, 2, 4),  # StmtList
+    (7, 8, 9, 10, 11, 5, 15, 2, 4),  # Stmt
+    (2,),  # IfStmt
+    (3,),  # ElseOpt
+    (4,),  # WhileStmt
+    (7, 8, 9, 10, 11),  # VarDecl
+    (19,),  # VarInitOpt
+    (7, 8, 9, 10, 11),  # Type
+    (15,),  # Assignment
+    (15, 12, 13, 14, 30, 16, 21, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48),  # Expr
+    (15, 12, 13, 14, 30, 16, 21, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48),  # OrExpr
+    (18,),  # OrExpr'
+    (15, 12, 13, 14, 30, 16, 21, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48),  # AndExpr
+    (17,),  # AndExpr'
+    (15, 12, 13, 14, 30, 16, 21, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48),  # EqualityExpr
+    (24, 25),  # EqualityExpr'
+    (15, 12, 13, 14, 30, 16, 21, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48),  # RelExpr
+    (26, 28, 27, 29),  # RelExpr'
+    (15, 12, 13, 14, 30, 16, 21, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48),  # AddExpr
+    (20, 21),  # AddExpr'
+    (15, 12, 13, 14, 30, 16, 21, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48),  # Term
+    (22, 23),  # Term'
+    (15, 12, 13, 14, 30, 16, 21, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48),  # Factor
+    (39, 40, 41, 42, 43, 44, 45, 46, 47, 48),  # FunctionCall
+    (15,),  # ResizeArgs
+    (14,),  # FlipArgs
+    (12, 13),  # VelocidadArgs
+    (12, 13),  # FadeInArgs
+    (12, 13),  # FadeOutArgs
+    (),  # EmptyArgs
+    (14,),  # AgregarMusicaArgs
+    (15,),  # ConcatenarArgs
+    (12, 13),  # CortarArgs
+    (12, 13),  # Number
+    (5,),  # ExportStmt
+)
+FOLLOW = (
+    (),  # Program
+    (49, 3, 7, 8, 9, 10, 11, 5, 15, 2, 4, 33),  # Block
+    (33,),  # StmtList
+    (7, 8, 9, 10, 11, 5, 15, 2, 4, 33),  # Stmt
+    (7, 8, 9, 10, 11, 5, 15, 2, 4, 33),  # IfStmt
+    (7, 8, 9, 10, 11, 5, 15, 2, 4, 33),  # ElseOpt
+    (7, 8, 9, 10, 11, 5, 15, 2, 4, 33),  # WhileStmt
+    (37,),  # VarDecl
+    (37,),  # VarInitOpt
+    (38,),  # Type
+    (37,),  # Assignment
+    (31, 37),  # Expr
+    (31, 37),  # OrExpr
+    (31, 37),  # OrExpr'
+    (18, 31, 37),  # AndExpr
+    (18, 31, 37),  # AndExpr'
+    (17, 18, 31, 37),  # EqualityExpr
+    (17, 18, 31, 37),  # EqualityExpr'
+    (24, 25, 17, 18, 31, 37),  # RelExpr
+    (24, 25, 17, 18, 31, 37),  # RelExpr'
+    (26, 28, 27, 29, 24, 25, 17, 18, 31, 37),  # AddExpr
+    (26, 28, 27, 29, 24, 25, 17, 18, 31, 37),  # AddExpr'
+    (20, 21, 26, 28, 27, 29, 24, 25, 17, 18, 31, 37),  # Term
+    (20, 21, 26, 28, 27, 29, 24, 25, 17, 18, 31, 37),  # Term'
+    (22, 23, 20, 21, 26, 28, 27, 29, 24, 25, 17, 18, 31, 37),  # Factor
+    (22, 23, 20, 21, 26, 28, 27, 29, 24, 25, 17, 18, 31, 37),  # FunctionCall
+    (35,),  # ResizeArgs
+    (35,),  # FlipArgs
+    (35,),  # VelocidadArgs
+    (35,),  # FadeInArgs
+    (35,),  # FadeOutArgs
+    (35,),  # EmptyArgs
+    (35,),  # AgregarMusicaArgs
+    (35,),  # ConcatenarArgs
+    (35,),  # CortarArgs
+    (35, 36),  # Number
+    (37,),  # ExportStmt
+)
+
+# Por producción: no-terminal, ids de la parte derecha, ids a apilar y texto
+LHS = (
+    'Program',
+    'Block',
+    'StmtList',
+    'StmtList',
+    'Stmt',
+    'Stmt',
+    'Stmt',
+    'Stmt',
+    'Stmt',
+    'IfStmt',
+    'ElseOpt',
+    'ElseOpt',
+    'WhileStmt',
+    'VarDecl',
+    'VarInitOpt',
+    'VarInitOpt',
+    'Type',
+    'Type',
+    'Type',
+    'Type',
+    'Type',
+    'Assignment',
+    'Expr',
+    'OrExpr',
+    "OrExpr'",
+    "OrExpr'",
+    'AndExpr',
+    "AndExpr'",
+    "AndExpr'",
+    'EqualityExpr',
+    "EqualityExpr'",
+    "EqualityExpr'",
+    "EqualityExpr'",
+    'RelExpr',
+    "RelExpr'",
+    "RelExpr'",
+    "RelExpr'",
+    "RelExpr'",
+    "RelExpr'",
+    'AddExpr',
+    "AddExpr'",
+    "AddExpr'",
+    "AddExpr'",
+    'Term',
+    "Term'",
+    "Term'",
+    "Term'",
+    'Factor',
+    'Factor',
+    'Factor',
+    'Factor',
+    'Factor',
+    'Factor',
+    'Factor',
+    'Factor',
+    'FunctionCall',
+    'FunctionCall',
+    'FunctionCall',
+    'FunctionCall',
+    'FunctionCall',
+    'FunctionCall',
+    'FunctionCall',
+    'FunctionCall',
+    'FunctionCall',
+    'FunctionCall',
+    'ResizeArgs',
+    'FlipArgs',
+    'VelocidadArgs',
+    'FadeInArgs',
+    'FadeOutArgs',
+    'EmptyArgs',
+    'AgregarMusicaArgs',
+    'ConcatenarArgs',
+    'CortarArgs',
+    'Number',
+    'Number',
+    'ExportStmt',
+)
+RHS = (
+    (1, 52, 49),  # Program         -> MAIN Block EOF
+    (32, 53, 33),  # Block           -> LBRACE StmtList RBRACE
+    (54, 53),  # StmtList        -> Stmt StmtList
+    (),  # StmtList        -> ε
+    (58, 37),  # Stmt            -> VarDecl SEMICOLON
+    (87, 37),  # Stmt            -> ExportStmt SEMICOLON
+    (61, 37),  # Stmt            -> Assignment SEMICOLON
+    (55,),  # Stmt            -> IfStmt
+    (57,),  # Stmt            -> WhileStmt
+    (2, 30, 62, 31, 52, 56),  # IfStmt          -> IF LPAREN Expr RPAREN Block ElseOpt
+    (3, 52),  # ElseOpt         -> ELSE Block
+    (),  # ElseOpt         -> ε
+    (4, 30, 62, 31, 52),  # WhileStmt       -> WHILE LPAREN Expr RPAREN Block
+    (60, 38, 15, 59),  # VarDecl         -> Type COLON IDENTIFIER VarInitOpt
+    (19, 62),  # VarInitOpt      -> ASSIGN Expr
+    (),  # VarInitOpt      -> ε
+    (7,),  # Type            -> INT_TYPE
+    (8,),  # Type            -> FLOAT_TYPE
+    (9,),  # Type            -> STRING_TYPE
+    (10,),  # Type            -> VIDEO_TYPE
+    (11,),  # Type            -> AUDIO_TYPE
+    (15, 19, 62),  # Assignment      -> IDENTIFIER ASSIGN Expr
+    (63,),  # Expr            -> OrExpr
+    (65, 64),  # OrExpr          -> AndExpr OrExpr'
+    (18, 65, 64),  # OrExpr'         -> OR AndExpr OrExpr'
+    (),  # OrExpr'         -> ε
+    (67, 66),  # AndExpr         -> EqualityExpr AndExpr'
+    (17, 67, 66),  # AndExpr'        -> AND EqualityExpr AndExpr'
+    (),  # AndExpr'        -> ε
+    (69, 68),  # EqualityExpr    -> RelExpr EqualityExpr'
+    (24, 69, 68),  # EqualityExpr'   -> EQ RelExpr EqualityExpr'
+    (25, 69, 68),  # EqualityExpr'   -> NEQ RelExpr EqualityExpr'
+    (),  # EqualityExpr'   -> ε
+    (71, 70),  # RelExpr         -> AddExpr RelExpr'
+    (26, 71, 70),  # RelExpr'        -> LT AddExpr RelExpr'
+    (28, 71, 70),  # RelExpr'        -> LE AddExpr RelExpr'
+    (27, 71, 70),  # RelExpr'        -> GT AddExpr RelExpr'
+    (29, 71, 70),  # RelExpr'        -> GE AddExpr RelExpr'
+    (),  # RelExpr'        -> ε
+    (73, 72),  # AddExpr         -> Term AddExpr'
+    (20, 73, 72),  # AddExpr'        -> PLUS Term AddExpr'
+    (21, 73, 72),  # AddExpr'        -> MINUS Term AddExpr'
+    (),  # AddExpr'        -> ε
+    (75, 74),  # Term            -> Factor Term'
+    (22, 75, 74),  # Term'           -> MULT Factor Term'
+    (23, 75, 74),  # Term'           -> DIV Factor Term'
+    (),  # Term'           -> ε
+    (15,),  # Factor          -> IDENTIFIER
+    (12,),  # Factor          -> INT_LITERAL
+    (13,),  # Factor          -> FLOAT_LITERAL
+    (14,),  # Factor          -> STRING_LITERAL
+    (30, 62, 31),  # Factor          -> LPAREN Expr RPAREN
+    (16, 75),  # Factor          -> NOT Factor
+    (21, 75),  # Factor          -> MINUS Factor
+    (76,),  # Factor          -> FunctionCall
+    (39, 34, 77, 35),  # FunctionCall    -> VIDEO_RESIZE LBRACKET ResizeArgs RBRACKET
+    (40, 34, 78, 35),  # FunctionCall    -> VIDEO_FLIP LBRACKET FlipArgs RBRACKET
+    (41, 34, 79, 35),  # FunctionCall    -> VIDEO_VELOCIDAD LBRACKET VelocidadArgs RBRACKET
+    (42, 34, 80, 35),  # FunctionCall    -> VIDEO_FADEIN LBRACKET FadeInArgs RBRACKET
+    (43, 34, 81, 35),  # FunctionCall    -> VIDEO_FADEOUT LBRACKET FadeOutArgs RBRACKET
+    (44, 34, 82, 35),  # FunctionCall    -> VIDEO_SILENCIO LBRACKET EmptyArgs RBRACKET
+    (45, 34, 82, 35),  # FunctionCall    -> VIDEO_QUITAR_AUDIO LBRACKET EmptyArgs RBRACKET
+    (46, 34, 83, 35),  # FunctionCall    -> VIDEO_AGREGAR_MUSICA LBRACKET AgregarMusicaArgs RBRACKET
+    (47, 34, 84, 35),  # FunctionCall    -> VIDEO_CONCATENAR LBRACKET ConcatenarArgs RBRACKET
+    (48, 34, 85, 35),  # FunctionCall    -> VIDEO_CORTAR LBRACKET CortarArgs RBRACKET
+    (15, 36, 12, 36, 12),  # ResizeArgs      -> IDENTIFIER COMMA INT_LITERAL COMMA INT_LITERAL
+    (14,),  # FlipArgs        -> STRING_LITERAL
+    (86,),  # VelocidadArgs   -> Number
+    (86,),  # FadeInArgs      -> Number
+    (86,),  # FadeOutArgs     -> Number
+    (),  # EmptyArgs       -> ε
+    (14,),  # AgregarMusicaArgs -> STRING_LITERAL
+    (15, 36, 15),  # ConcatenarArgs  -> IDENTIFIER COMMA IDENTIFIER
+    (86, 36, 86),  # CortarArgs      -> Number COMMA Number
+    (12,),  # Number          -> INT_LITERAL
+    (13,),  # Number          -> FLOAT_LITERAL
+    (5, 15, 6, 14),  # ExportStmt      -> EXPORT IDENTIFIER AS STRING_LITERAL
+)
+PUSH = (
+    (49, 52, 1),
+    (33, 53, 32),
+    (53, 54),
+    (),
+    (37, 58),
+    (37, 87),
+    (37, 61),
+    (55,),
+    (57,),
+    (56, 52, 31, 62, 30, 2),
+    (52, 3),
+    (),
+    (52, 31, 62, 30, 4),
+    (59, 15, 38, 60),
+    (62, 19),
+    (),
+    (7,),
+    (8,),
+    (9,),
+    (10,),
+    (11,),
+    (62, 19, 15),
+    (63,),
+    (64, 65),
+    (64, 65, 18),
+    (),
+    (66, 67),
+    (66, 67, 17),
+    (),
+    (68, 69),
+    (68, 69, 24),
+    (68, 69, 25),
+    (),
+    (70, 71),
+    (70, 71, 26),
+    (70, 71, 28),
+    (70, 71, 27),
+    (70, 71, 29),
+    (),
+    (72, 73),
+    (72, 73, 20),
+    (72, 73, 21),
+    (),
+    (74, 75),
+    (74, 75, 22),
+    (74, 75, 23),
+    (),
+    (15,),
+    (12,),
+    (13,),
+    (14,),
+    (31, 62, 30),
+    (75, 16),
+    (75, 21),
+    (76,),
+    (35, 77, 34, 39),
+    (35, 78, 34, 40),
+    (35, 79, 34, 41),
+    (35, 80, 34, 42),
+    (35, 81, 34, 43),
+    (35, 82, 34, 44),
+    (35, 82, 34, 45),
+    (35, 83, 34, 46),
+    (35, 84, 34, 47),
+    (35, 85, 34, 48),
+    (12, 36, 12, 36, 15),
+    (14,),
+    (86,),
+    (86,),
+    (86,),
+    (),
+    (14,),
+    (15, 36, 15),
+    (86, 36, 86),
+    (12,),
+    (13,),
+    (14, 6, 15, 5),
+)
+RULE_TEXT = (
+    'Program         -> MAIN Block EOF',
+    'Block           -> LBRACE StmtList RBRACE',
+    'StmtList        -> Stmt StmtList',
+    'StmtList        -> ε',
+    'Stmt            -> VarDecl SEMICOLON',
+    'Stmt            -> ExportStmt SEMICOLON',
+    'Stmt            -> Assignment SEMICOLON',
+    'Stmt            -> IfStmt',
+    'Stmt            -> WhileStmt',
+    'IfStmt          -> IF LPAREN Expr RPAREN Block ElseOpt',
+    'ElseOpt         -> ELSE Block',
+    'ElseOpt         -> ε',
+    'WhileStmt       -> WHILE LPAREN Expr RPAREN Block',
+    'VarDecl         -> Type COLON IDENTIFIER VarInitOpt',
+    'VarInitOpt      -> ASSIGN Expr',
+    'VarInitOpt      -> ε',
+    'Type            -> INT_TYPE',
+    'Type            -> FLOAT_TYPE',
+    'Type            -> STRING_TYPE',
+    'Type            -> VIDEO_TYPE',
+    'Type            -> AUDIO_TYPE',
+    'Assignment      -> IDENTIFIER ASSIGN Expr',
+    'Expr            -> OrExpr',
+    "OrExpr          -> AndExpr OrExpr'",
+    "OrExpr'         -> OR AndExpr OrExpr'",
+    "OrExpr'         -> ε",
+    "AndExpr         -> EqualityExpr AndExpr'",
+    "AndExpr'        -> AND EqualityExpr AndExpr'",
+    "AndExpr'        -> ε",
+    "EqualityExpr    -> RelExpr EqualityExpr'",
+    "EqualityExpr'   -> EQ RelExpr EqualityExpr'",
+    "EqualityExpr'   -> NEQ RelExpr EqualityExpr'",
+    "EqualityExpr'   -> ε",
+    "RelExpr         -> AddExpr RelExpr'",
+    "RelExpr'        -> LT AddExpr RelExpr'",
+    "RelExpr'        -> LE AddExpr RelExpr'",
+    "RelExpr'        -> GT AddExpr RelExpr'",
+    "RelExpr'        -> GE AddExpr RelExpr'",
+    "RelExpr'        -> ε",
+    "AddExpr         -> Term AddExpr'",
+    "AddExpr'        -> PLUS Term AddExpr'",
+    "AddExpr'        -> MINUS Term AddExpr'",
+    "AddExpr'        -> ε",
+    "Term            -> Factor Term'",
+    "Term'           -> MULT Factor Term'",
+    "Term'           -> DIV Factor Term'",
+    "Term'           -> ε",
+    'Factor          -> IDENTIFIER',
+    'Factor          -> INT_LITERAL',
+    'Factor          -> FLOAT_LITERAL',
+    'Factor          -> STRING_LITERAL',
+    'Factor          -> LPAREN Expr RPAREN',
+    'Factor          -> NOT Factor',
+    'Factor          -> MINUS Factor',
+    'Factor          -> FunctionCall',
+    'FunctionCall    -> VIDEO_RESIZE LBRACKET ResizeArgs RBRACKET',
+    'FunctionCall    -> VIDEO_FLIP LBRACKET FlipArgs RBRACKET',
+    'FunctionCall    -> VIDEO_VELOCIDAD LBRACKET VelocidadArgs RBRACKET',
+    'FunctionCall    -> VIDEO_FADEIN LBRACKET FadeInArgs RBRACKET',
+    'FunctionCall    -> VIDEO_FADEOUT LBRACKET FadeOutArgs RBRACKET',
+    'FunctionCall    -> VIDEO_SILENCIO LBRACKET EmptyArgs RBRACKET',
+    'FunctionCall    -> VIDEO_QUITAR_AUDIO LBRACKET EmptyArgs RBRACKET',
+    'FunctionCall    -> VIDEO_AGREGAR_MUSICA LBRACKET AgregarMusicaArgs RBRACKET',
+    'FunctionCall    -> VIDEO_CONCATENAR LBRACKET ConcatenarArgs RBRACKET',
+    'FunctionCall    -> VIDEO_CORTAR LBRACKET CortarArgs RBRACKET',
+    'ResizeArgs      -> IDENTIFIER COMMA INT_LITERAL COMMA INT_LITERAL',
+    'FlipArgs        -> STRING_LITERAL',
+    'VelocidadArgs   -> Number',
+    'FadeInArgs      -> Number',
+    'FadeOutArgs     -> Number',
+    'EmptyArgs       -> ε',
+    'AgregarMusicaArgs -> STRING_LITERAL',
+    'ConcatenarArgs  -> IDENTIFIER COMMA IDENTIFIER',
+    'CortarArgs      -> Number COMMA Number',
+    'Number          -> INT_LITERAL',
+    'Number          -> FLOAT_LITERAL',
+    'ExportStmt      -> EXPORT IDENTIFIER AS STRING_LITERAL',
+)
@@ -2,17 +2,42 @@
 
 """
 Fase 1: Construcción y visualización del árbol de análisis sintáctico (parse tree).
-- Imprime en terminal cada paso de MATCH / EXPAND / RULE con formato tabulado.
+- Con la traza 'parser' a nivel trace (tracing.py, `--debug parser` en el
+  driver) escribe cada paso de MATCH / EXPAND / RULE con formato tabulado.
 - Muestra EPSILON (ε) cuando la producción la contiene.
-- Al final genera `parsetree.png` con la estructura completa.
+- Con --emit-parse-tree genera `parsetree.png` con la estructura completa.
+  graphviz sólo se importa entonces (visualize_parse_tree).
 """
 
+import argparse
 import sys
-from collections import deque
-from enums import TokenType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from enums import TokenType, Token
 from lexer2 import Lexer
-from grammar_def2 import PARSING_TABLE, EPSILON, START_SYMBOL
-from graphviz import Digraph
+from source import SourceFile
+from tokenbuf import TOKEN_FIELDS, TokenBuffer
+from ll1_table import CompiledTable
+import ll1_tables
+import profiling
+import tracing
+from visitor import TreeWalker, preorder
+
+
+# Tabla LL(1) generada desde grammar.bnf por grammar_compiler.py; cargarla no
+# construye nada, sólo adopta las tuplas constantes de ll1_tables
+LL1 = CompiledTable.load(ll1_tables)
+START_SYMBOL = ll1_tables.START_SYMBOL
+# Marca en la pila de símbolos: fin de una producción con acción semántica
+ACTION = -1
+# Tokens en los que se resincroniza tras un error sintáctico: los que
+# cierran una sentencia o un bloque, y las palabras clave que sólo pueden
+# empezar una sentencia o un bloque (p.ej. tras un ';' que falta)
+SYNC_CODES = frozenset(t.value for t in (
+    TokenType.SEMICOLON, TokenType.RBRACE, TokenType.EOF,
+    TokenType.LBRACE, TokenType.IF, TokenType.ELSE, TokenType.WHILE, TokenType.EXPORT,
+    TokenType.INT_TYPE, TokenType.FLOAT_TYPE, TokenType.STRING_TYPE,
+    TokenType.VIDEO_TYPE, TokenType.AUDIO_TYPE,
+))
 
 
 class ParseNode:
@@ -25,113 +50,339 @@ class ParseNode:
     def __repr__(self):
         return f"ParseNode({self.symbol}, children={len(self.children)})"
 
+
+class BufferLeaf(ParseNode):
+    """
+    Hoja terminal de un parse tree construido sobre un TokenBuffer: guarda
+    sólo el índice del token emparejado; el objeto Token se crea la primera
+    vez que alguien consulta `token`.
+    """
+    def __init__(self, symbol, buffer: TokenBuffer):
+        self.buffer = buffer
+        self.index  = -1          # índice en buffer (-1: aún sin emparejar)
+        super().__init__(symbol)
+
+    @property
+    def token(self):
+        if self._token is None and self.index >= 0:
+            self._token = self.buffer.token(self.index)
+        return self._token
+
+    @token.setter
+    def token(self, tok):
+        self._token = tok
+
+
 class TableDrivenParser:
     """Parser LL(1) con salida paso a paso legible y tabulada."""
-    def __init__(self, src: str):
-        # Inicializa el lexer y lista de tokens
-        self.lexer  = Lexer(src)
-        self.tokens = self.lexer.tokenize()
+    def __init__(self, src: Optional[str] = None,
+                 tokens: Optional[Iterable[Token]] = None,
+                 stream: bool = False, recover: bool = True):
+        """
+        - src:    texto fuente; se tokeniza aquí sólo si no se pasan tokens.
+        - tokens: secuencia ya construida (lista de Lexer.tokenize) o un
+                  iterador de tokens; en ese caso el lexer no vuelve a
+                  ejecutarse y el lookahead se extrae bajo demanda.
+        - stream: si se tokeniza aquí, usar Lexer.iter_tokens() en lugar de
+                  construir la lista completa; los errores léxicos siguen
+                  acumulándose en self.lexer.errors durante el parse.
+        - recover: tras un error sintáctico, recuperarse y seguir (ver
+                  _recover) para informar de todos los errores de una vez;
+                  con False el parse se detiene en el primero.
+        Con un TokenBuffer como `tokens` el parser avanza por índice y lee
+        el tipo del lookahead de la columna de códigos: sólo se crean
+        objetos Token para mensajes y trazas.
+        """
+        self.lexer  = None
+        self.recover = recover
+        # Mensajes de los errores sintácticos del último parse, en orden
+        self.errors: List[str] = []
+        self._error_pos = -1
+        if tokens is None:
+            self.lexer = Lexer(src)
+            tokens = self.lexer.iter_tokens() if stream else self.lexer.tokenize()
         self.pos    = 0
-        self.current= self.tokens[0]
+        if isinstance(tokens, TokenBuffer):
+            self.tokens  = self.buffer = tokens
+            self._stream = None
+            self._current = None
+            self.current_code = tokens.code(0)
+            return
+        # Sólo se conserva la lista si el llamador la construyó
+        self.tokens = tokens if isinstance(tokens, Sequence) else None
+        self.buffer = None
+        self._stream = iter(tokens)
+        self._current = next(self._stream)
+        self.current_code = self._current.type.value
+
+    @property
+    def current(self) -> Token:
+        """Token de lookahead (sobre un TokenBuffer se materializa al pedirlo)."""
+        if self._current is None:
+            return self.buffer.token(self.pos)
+        return self._current
 
     def advance(self):
-        """Avanza al siguiente token en la lista."""
+        """Avanza al siguiente token; al agotarse el flujo se queda en el último (EOF)."""
+        if self.buffer is not None:
+            if self.pos + 1 < len(self.buffer):
+                self.pos += 1
+                self.current_code = self.buffer.code(self.pos)
+            return
         self.pos += 1
-        if self.pos < len(self.tokens):
-            self.current = self.tokens[self.pos]
+        self._current = next(self._stream, self._current)
+        self.current_code = self._current.type.value
 
-    def parse(self, verbose: bool = True) -> ParseNode:
+    @property
+    def token_access(self):
+        """Accesores (type/value/position/token) para los valores terminales
+        que reciben las acciones semánticas: índices o Tokens."""
+        return TOKEN_FIELDS if self.buffer is None else self.buffer
+
+    def parse(self, verbose: bool = False, build_tree: bool = True) -> ParseNode:
         """
         Construye el parse tree:
-          - Si verbose=True, muestra:
+          - Si verbose=True o la traza 'parser' está a nivel trace, escribe
+            en la traza cada paso:
               [MATCH] <línea,columna>  Terminal esperado … Token actual …
               [EXPAND] <no-terminal>    Lookahead …
               [RULE]   Regla elegida (incluye ε)
+          - Si build_tree=False sólo se valida la entrada: no se crean nodos
+            y la memoria queda acotada por la pila del parser (útil junto
+            con stream=True). Devuelve la raíz sin hijos.
+        La pila de símbolos y la tabla (LL1, generada desde grammar.bnf)
+        son enteros; los nodos del árbol se apilan en paralelo.
+        Si hubo errores sintácticos se lanza al final un SyntaxError con
+        todos ellos, uno por línea (están también en self.errors).
+        """
+        root, _ = self._run(verbose, build_tree, None)
+        return root
+
+    def parse_actions(self, actions: Dict[str, Callable], verbose: bool = False):
         """
+        Parse dirigido por acciones semánticas, sin construir el parse tree.
+
+        `actions` asocia a un no-terminal una función que se ejecuta al
+        completar cualquiera de sus producciones. Recibe la lista de valores
+        producidos dentro de ella, en orden: cada terminal aporta su Token
+        (o su índice si se parsea un TokenBuffer; ver token_access) y cada
+        no-terminal con acción aporta lo que devolvió. Los no-terminales sin
+        acción son transparentes: sus valores pasan tal cual al que los
+        engloba. Devuelve el valor de la última acción completada (la del
+        símbolo inicial si tiene). Tras el primer error sintáctico ya no
+        se ejecutan acciones: el parse sólo sigue para buscar más errores.
+        """
+        _, value = self._run(verbose, False, actions)
+        return value
+
+    def _run(self, verbose: bool, build_tree: bool,
+             actions: Optional[Dict[str, Callable]]) -> Tuple[ParseNode, Any]:
+        table   = LL1
+        nt_base = table.nt_base
+        rows    = table.rows
+        push    = table.push
+        symbols = table.symbols if build_tree else None
         root  = ParseNode(START_SYMBOL)
-        stack = deque([root])
+        stack = [table.start]
+        nodes = [root] if build_tree else None
+        buf   = self.buffer
+        # Acciones: al expandir se apila ACTION bajo la parte derecha y en
+        # `pending` la acción con la altura de `values`; al desapilar ACTION
+        # se reducen los valores producidos desde entonces.
+        prod_actions = table.bind(actions) if actions is not None else None
+        values  = []
+        pending = []
+        self.errors = []
+        self._error_pos = -1
 
-        if verbose:
-            print("=== Inicio del parser LL(1) paso a paso ===\n")
+        # Traza paso a paso: sin ella no se formatea nada dentro del bucle
+        steps = verbose or tracing.PARSER.trace
+        write = tracing.PARSER.write
+        if steps:
+            write("=== Inicio del parser LL(1) paso a paso ===")
 
         while stack:
-            node = stack.pop()
-            sym  = node.symbol
-
-            # ——— Caso terminal ———
-            if isinstance(sym, TokenType):
-                if verbose:
-                    print(f"[MATCH]    Línea {self.current.line:>3}, Col {self.current.column:>3}  "
-                          f"Terminal esperado: {sym.name:<15}  "
-                          f"Token actual: {self.current.type.name:<15} ('{self.current.value}')")
-                if sym == self.current.type:
-                    node.token = self.current
+            sym = stack.pop()
+            if build_tree:
+                node = nodes.pop()
+
+            # ——— Caso terminal (o fin de una producción con acción) ———
+            if sym < nt_base:
+                if sym == ACTION:
+                    action, mark = pending.pop()
+                    args = values[mark:]
+                    del values[mark:]
+                    values.append(action(args))
+                    continue
+                if steps:
+                    cur = self.current
+                    write(f"[MATCH]    Línea {cur.line:>3}, Col {cur.column:>3}  "
+                          f"Terminal esperado: {table.name(sym):<15}  "
+                          f"Token actual: {cur.type.name:<15} ('{cur.value}')")
+                if sym == self.current_code:
+                    if build_tree:
+                        if buf is None:
+                            node.token = self.current
+                        else:
+                            node.index = self.pos
+                    if prod_actions is not None:
+                        values.append(self.current if buf is None else self.pos)
                     self.advance()
                 else:
                     ln, col = self.current.line, self.current.column
-                    raise SyntaxError(
+                    self._recover(
                         f"Error sintáctico en línea {ln}, columna {col}: "
-                        f"se esperaba '{sym.name}', vino '{self.current.type.name}'"
+                        f"se esperaba '{table.name(sym)}', vino '{self.current.type.name}'",
+                        sym, node if build_tree else None, stack, nodes
                     )
+                    prod_actions = None
                 continue
 
             # ——— Caso no-terminal ———
-            if verbose:
-                print(f"[EXPAND]   No-terminal: {sym:<15}  Lookahead: {self.current.type.name:<15} ('{self.current.value}')")
-            row = PARSING_TABLE.get(sym)
+            if steps:
+                cur = self.current
+                write(f"[EXPAND]   No-terminal: {table.name(sym):<15}  Lookahead: {cur.type.name:<15} ('{cur.value}')")
+            row = rows[sym - nt_base]
             if row is None:
-                raise SyntaxError(f"No existe fila LL(1) para el no-terminal: {sym}")
+                raise SyntaxError(f"No existe fila LL(1) para el no-terminal: {table.name(sym)}")
 
-            prod = row.get(self.current.type)
-            if prod is None:
-                esperados = ', '.join(
-                    (t.name if isinstance(t, TokenType) else t)
-                    for t in row.keys()
-                )
+            prod = row[self.current_code]
+            if prod < 0:
                 ln, col = self.current.line, self.current.column
-                raise SyntaxError(
+                self._recover(
                     f"Error sintáctico en línea {ln}, columna {col}: "
-                    f"token inesperado '{self.current.type.name}'. Se esperaba uno de: {esperados}"
+                    f"token inesperado '{self.current.type.name}'. Se esperaba uno de: {table.expected(sym)}",
+                    sym, node if build_tree else None, stack, nodes
                 )
+                prod_actions = None
+                continue
+
+            if steps:
+                write(f"[RULE]     {table.rule_text[prod]}")
+
+            if prod_actions is not None:
+                action = prod_actions[prod]
+                if action is not None:
+                    stack.append(ACTION)
+                    pending.append((action, len(values)))
+                    if build_tree:
+                        nodes.append(None)
 
-            # Formatear la parte derecha mostrando ε
-            rhs = []
-            for p in prod:
-                if p == EPSILON:
-                    rhs.append('ε')
+            # Apilar la parte derecha (sin ε) en orden inverso
+            stack.extend(push[prod])
+            if build_tree:
+                if buf is None:
+                    children = [ParseNode(p) for p in symbols[prod]]
                 else:
-                    rhs.append(p.name if isinstance(p, TokenType) else p)
+                    children = [BufferLeaf(p, buf) if isinstance(p, TokenType) else ParseNode(p)
+                                for p in symbols[prod]]
+                node.children = children
+                nodes.extend(reversed(children))
 
-            if verbose:
-                print(f"[RULE]     {sym:<15} -> {' '.join(rhs)}\n")
+        if steps:
+            write("=== Fin del parser paso a paso ===")
+        if self.errors:
+            raise SyntaxError("\n".join(self.errors))
+        return root, (values[-1] if values else None)
 
-            # Crear nodos hijos (omitimos EPSILON en el árbol)
-            node.children = [ParseNode(p) for p in prod if p != EPSILON]
-            # Apilar en orden inverso
-            for child in reversed(node.children):
-                stack.append(child)
+    def _recover(self, message: str, sym: int, node: Optional[ParseNode],
+                 stack: List[int], nodes: Optional[List[ParseNode]]) -> None:
+        """
+        Recuperación en modo pánico tras un error en `sym` (ya desapilado,
+        con su nodo `node` si se construye el árbol). Sólo se ejecuta en
+        caso de error: el bucle de _run no comprueba nada más.
 
-        if verbose:
-            print("=== Fin del parser paso a paso ===\n")
-        return root
+          1. Nivel de frase: se descartan tokens hasta uno de FIRST(sym)
+             (o el propio terminal), con el que `sym` sigue, o de
+             FOLLOW(sym) que acepte lo que hay debajo en la pila (FOLLOW
+             no distingue contextos), con el que se da `sym` por vacío.
+             Si falta un terminal y lo que hay debajo acepta el
+             lookahead, se da por insertado.
+          2. Si se llega antes a un token de SYNC_CODES (';', '}', EOF o
+             una palabra clave de sentencia), se desapila hasta el símbolo
+             más cercano a la cima que lo acepte; si ninguno lo acepta (un
+             ';' dentro de una condición), se descarta y se prueba con el
+             siguiente.
 
-def visualize_parse_tree(root: ParseNode, outname: str = 'parsetree'):
-    """
-    Dibuja con Graphviz el parse tree completo y guarda `outname.png`.
-    Cada nodo muestra el símbolo; las hojas también el valor del token.
-    """
-    dot = Digraph('ParseTree', format='png')
-    def visit(n: ParseNode, parent_id=None):
+        Un segundo error sobre el mismo token no se informa (sería una
+        consecuencia del anterior) y ese token se descarta, para avanzar
+        siempre. Sin `recover` lanza el SyntaxError directamente.
+        """
+        if not self.recover:
+            raise SyntaxError(message)
+        table = LL1
+        eof = TokenType.EOF.value
+        if self.pos != self._error_pos:
+            self.errors.append(message)
+        elif self.current_code != eof:
+            self.advance()
+        self._error_pos = self.pos
+        if tracing.PARSER.trace:
+            tracing.PARSER.write(f"[RECOVER]  {message}")
+
+        # Tras un error ya no se ejecutan acciones semánticas
+        if ACTION in stack:
+            keep = [i for i, s in enumerate(stack) if s != ACTION]
+            stack[:] = [stack[i] for i in keep]
+            if nodes is not None:
+                nodes[:] = [nodes[i] for i in keep]
+
+        def resume(sym, node):
+            stack.append(sym)
+            if nodes is not None:
+                nodes.append(node)
+
+        # 1) Nivel de frase (con FIRST y no con la fila: la tabla tiene
+        # entradas ε para lookaheads que no están en FOLLOW)
+        first, follow = table.first_follow()
+        while True:
+            code = self.current_code
+            if sym >= table.nt_base:
+                if code in first[sym - table.nt_base]:
+                    return resume(sym, node)
+                if code in follow[sym - table.nt_base] and (not stack or table.accepts(stack[-1], code)):
+                    return
+            elif sym == code:
+                return resume(sym, node)
+            elif stack and table.accepts(stack[-1], code):
+                return
+            if code in SYNC_CODES:
+                break
+            self.advance()
+
+        # 2) Sincronización: desapilar hasta quien acepte el token
+        while True:
+            code = self.current_code
+            for i in range(len(stack) - 1, -1, -1):
+                if table.accepts(stack[i], code):
+                    del stack[i + 1:]
+                    if nodes is not None:
+                        del nodes[i + 1:]
+                    return
+            if code == eof:
+                stack.clear()
+                if nodes is not None:
+                    nodes.clear()
+                return
+            self.advance()
+
+class _ParseTreeGraph(TreeWalker):
+    """Vuelca el parse tree en un Digraph; el contexto de cada nodo es el uid de su padre."""
+
+    def __init__(self, dot):
+        self.dot = dot
+
+    def enter(self, n: ParseNode, parent_id):
         uid   = str(id(n))
         label = str(n.symbol)
         if n.token:
             label += f"\n{n.token.value}"
-        
+
         # Node styling based on symbol type
         style = 'filled'
         fillcolor = "#f4ecd8"  # default color
         penwidth = '1.0'  # default border width
-        
+
         # Control flow and loop styling
         if isinstance(n.symbol, TokenType):
             if n.symbol in (TokenType.IF, TokenType.ELSE):
@@ -139,47 +390,80 @@ def visualize_parse_tree(root: ParseNode, outname: str = 'parsetree'):
             elif n.symbol == TokenType.WHILE:
                 fillcolor = "#d9a6ff"  # Loop color
                 penwidth = '2.0'  # Bold border for loops
-        
-        dot.node(uid, label, style=style, fillcolor=fillcolor, penwidth=penwidth)
-        
+
+        self.dot.node(uid, label, style=style, fillcolor=fillcolor, penwidth=penwidth)
+
         if parent_id:
-            dot.edge(parent_id, uid)
-        for ch in n.children:
-            visit(ch, uid)
+            self.dot.edge(parent_id, uid)
+        return uid
+
+
+def visualize_parse_tree(root: ParseNode, outname: str = 'parsetree'):
+    """
+    Dibuja con Graphviz el parse tree completo y guarda `outname.png`.
+    Cada nodo muestra el símbolo; las hojas también el valor del token.
+    """
+    from graphviz import Digraph
+
+    dot = Digraph('ParseTree', format='png')
+    _ParseTreeGraph(dot).walk(root)
 
-    visit(root)
-    
     # dot.attr(bgcolor='#f4ecd8') #light sepia
     dot.attr(bgcolor='#7d540d') #dark yellow
-    
+
     dot.render(outname, cleanup=True)
     print(f"Parse tree visualizado en {outname}.png")
 
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Uso: python parse_tree.py <archivo_fuente>")
-        sys.exit(1)
-
-    src = open(sys.argv[1], encoding='utf-8').read()
-
-    # 0) Análisis léxico previo
-    lexer = Lexer(src)
-    _ = lexer.tokenize()
-    if lexer.errors:
-        print("Errores léxicos detectados, abortando parser:")
-        for e in lexer.errors:
-            print("  -", e)
-        sys.exit(1)
-
-    # 1) Parse LL(1) paso a paso
-    parser = TableDrivenParser(src)
+def run_parser(parser: TableDrivenParser,
+               actions: Optional[Dict[str, Callable]] = None,
+               visualize: bool = False) -> Tuple[Any, int]:
+    """
+    Ejecuta el parse LL(1) y, con `visualize`, dibuja el árbol generado.
+    Con `actions` no se construye el parse tree: se devuelve el valor de
+    las acciones semánticas (p.ej. el AST) y no hay visualización.
+    Devuelve (parse tree o valor, código de salida de la fase).
+    """
+    # 1) Parse LL(1) (paso a paso con la traza 'parser' a nivel trace)
     try:
-        pt_root = parser.parse(verbose=True)
+        with profiling.phase('TableDrivenParser.parse') as stats:
+            if actions is not None:
+                result = parser.parse_actions(actions)
+            else:
+                result = parser.parse()
     except Exception as e:
         print(e)
-        sys.exit(1)
+        return None, 1
+    if stats is not None:
+        profiling.count_tokens(parser.pos + 1)
+        if actions is None:
+            stats.nodes = sum(1 for _ in preorder(result))
 
     # 2) Visualizar árbol generado
-    visualize_parse_tree(pt_root)
+    if visualize and actions is None:
+        with profiling.phase('visualize_parse_tree'):
+            visualize_parse_tree(result)
     print("Análisis sintáctico completado sin errores.")
+    return result, 0
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(prog='parser2.py', description='Análisis sintáctico de un archivo fuente.')
+    ap.add_argument('fuente', metavar='archivo_fuente')
+    ap.add_argument('--emit-parse-tree', action='store_true', help="dibujar el parse tree en parsetree.png")
+    args = ap.parse_args()
+
+    tracing.configure('parser')
+
+    with SourceFile.open(args.fuente) as src:
+        # 0) Análisis léxico previo (los tokens se reutilizan en el parser)
+        lexer = Lexer(src)
+        tokens = lexer.tokenize()
+        if lexer.errors:
+            print("Errores léxicos detectados, abortando parser:")
+            for e in lexer.errors:
+                print("  -", e)
+            sys.exit(1)
+
+        _, code = run_parser(TableDrivenParser(tokens=tokens), visualize=args.emit_parse_tree)
+    sys.exit(code)
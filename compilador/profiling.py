@@ -0,0 +1,202 @@
+# profiling.py
+
+"""
+Medición por fases de una compilación (opción --profile del driver).
+
+Cada fase instrumentada se envuelve en `profiling.phase(nombre)`. Sin un
+Profiler activo (lo normal) es un context manager vacío y compartido, y
+devuelve None, así que no mide nada ni cuenta nodos:
+
+    with profiling.phase('build_ast') as stats:
+        ast = build_ast(pt)
+    if stats is not None:
+        stats.nodes = count_nodes(ast)
+
+Con un Profiler activo (start()), cada fase registra:
+  - tiempo de pared (perf_counter) y de CPU (process_time)
+  - pico de memoria de tracemalloc sobre la memoria viva al empezar la
+    fase (tracemalloc está activo durante todo el perfil y ralentiza
+    también los tiempos medidos)
+  - tokens/s (tokens del programa entre el tiempo de la fase) y nodos/s
+    (nodos producidos o recorridos por la fase, si los informa)
+
+El informe se escribe como tabla (table()) y como JSON (to_dict()).
+
+Con un TraceRecorder activo (trace_events, --trace) cada fase emite
+además su span. Si sólo está activo el recorder, phase() devuelve None
+igual que sin profiler.
+
+El Profiler activo es una variable de contexto (contextvars), no una
+global del módulo: start() lo activa para el hilo que lo llama, y
+api.compile_source() compila en un contexto nuevo, sin medir nada.
+tracemalloc sí es de todo el proceso: el pico de memoria de una fase
+incluye lo que asignen a la vez otros hilos.
+"""
+
+import datetime
+import json
+import platform
+import time
+import tracemalloc
+from contextvars import ContextVar
+from typing import List, Optional
+
+import trace_events
+
+# Profiler activo en el contexto actual (None: medición desactivada)
+_ACTIVE: 'ContextVar[Optional[Profiler]]' = ContextVar('profiler', default=None)
+
+
+class PhaseStats:
+    """Medidas de una fase."""
+
+    __slots__ = ('name', 'wall', 'cpu', 'peak', 'nodes')
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak = 0
+        self.nodes: Optional[int] = None
+
+
+class _Phase:
+    """Context manager de una fase medida por un Profiler y/o trazada como span."""
+
+    __slots__ = ('profiler', 'stats', 'span', 'wall0', 'cpu0', 'mem0')
+
+    def __init__(self, profiler: Optional['Profiler'], name: str) -> None:
+        self.profiler = profiler
+        self.stats = PhaseStats(name) if profiler is not None else None
+        self.span = trace_events.span(name, 'phase')
+
+    def __enter__(self) -> Optional[PhaseStats]:
+        self.span.__enter__()
+        if self.profiler is not None:
+            self.mem0 = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            self.cpu0 = time.process_time()
+            self.wall0 = time.perf_counter()
+        return self.stats
+
+    def __exit__(self, *exc) -> bool:
+        stats = self.stats
+        if stats is not None:
+            stats.wall = time.perf_counter() - self.wall0
+            stats.cpu = time.process_time() - self.cpu0
+            stats.peak = max(0, tracemalloc.get_traced_memory()[1] - self.mem0)
+            self.profiler.phases.append(stats)
+        self.span.__exit__(*exc)
+        return False
+
+
+class _NoPhase:
+    """Fase sin profiler: no mide nada."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+def active() -> Optional['Profiler']:
+    """Profiler activo en el contexto actual, o None."""
+    return _ACTIVE.get()
+
+
+def phase(name: str):
+    """Context manager que mide la fase `name` si hay un Profiler activo
+    (y la traza si hay un TraceRecorder activo)."""
+    profiler = _ACTIVE.get()
+    if profiler is None and trace_events.active() is None:
+        return _NO_PHASE
+    return _Phase(profiler, name)
+
+
+def count_tokens(n: int) -> None:
+    """Informa del número de tokens del programa (lo hacen lexer y parser)."""
+    profiler = _ACTIVE.get()
+    if profiler is not None:
+        profiler.tokens = max(profiler.tokens, n)
+
+
+class Profiler:
+    """Fases medidas durante una compilación, en orden de ejecución."""
+
+    def __init__(self, source: str = '') -> None:
+        self.source = source
+        self.tokens = 0
+        self.phases: List[PhaseStats] = []
+
+    def rows(self) -> List[dict]:
+        rows = []
+        for p in self.phases:
+            rows.append({
+                'phase': p.name,
+                'wall_s': p.wall,
+                'cpu_s': p.cpu,
+                'peak_bytes': p.peak,
+                'tokens_per_s': self.tokens / p.wall if p.wall and self.tokens else None,
+                'nodes': p.nodes,
+                'nodes_per_s': p.nodes / p.wall if p.wall and p.nodes is not None else None,
+            })
+        return rows
+
+    def to_dict(self) -> dict:
+        return {
+            'source': self.source,
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'tokens': self.tokens,
+            'phases': self.rows(),
+            'total_wall_s': sum(p.wall for p in self.phases),
+            'total_cpu_s': sum(p.cpu for p in self.phases),
+        }
+
+    def write_json(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write('\n')
+
+    def table(self) -> str:
+        def rate(value):
+            return f"{value:14,.0f}" if value is not None else f"{'-':>14}"
+
+        lines = [
+            f"Perfil de compilación: {self.source} ({self.tokens:,} tokens)",
+            f"  {'fase':<24} {'pared':>11} {'CPU':>11} {'pico':>11} {'tokens/s':>14} {'nodos':>9} {'nodos/s':>14}",
+        ]
+        for row in self.rows():
+            nodes = f"{row['nodes']:9,}" if row['nodes'] is not None else f"{'-':>9}"
+            lines.append(
+                f"  {row['phase']:<24} {row['wall_s'] * 1e3:9.2f}ms {row['cpu_s'] * 1e3:9.2f}ms "
+                f"{row['peak_bytes'] / 1024:9.1f}KB {rate(row['tokens_per_s'])} {nodes} {rate(row['nodes_per_s'])}"
+            )
+        wall = sum(p.wall for p in self.phases)
+        cpu = sum(p.cpu for p in self.phases)
+        lines.append(f"  {'total':<24} {wall * 1e3:9.2f}ms {cpu * 1e3:9.2f}ms")
+        return '\n'.join(lines)
+
+
+def start(source: str = '') -> Profiler:
+    """Activa un Profiler nuevo en el contexto actual (y tracemalloc) y lo devuelve."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    profiler = Profiler(source)
+    _ACTIVE.set(profiler)
+    return profiler
+
+
+def stop() -> Optional[Profiler]:
+    """Desactiva el Profiler activo y tracemalloc; devuelve el Profiler."""
+    profiler = _ACTIVE.get()
+    _ACTIVE.set(None)
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    return profiler
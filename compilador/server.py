@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# server.py
+
+"""
+Servidor de compilación persistente.
+
+Arranca una vez, con el compilador ya importado (tabla LL(1) compilada,
+traductor) y calentado con una compilación de prueba, y atiende
+peticiones en un socket Unix o en un puerto TCP de localhost. Así cada
+compilación se ahorra el arranque del intérprete y los imports; client.py
+es el cliente mínimo (no importa el compilador).
+
+Protocolo: una línea JSON por petición y otra por respuesta; una conexión
+puede enviar varias peticiones seguidas.
+
+  {"op": "compile", "source": "main { ... }", "name": "a.vid"}
+      -> {"ok": true, "code": "...", "diagnostics": [...], "cached": false,
+          "seconds": 0.004}
+  {"op": "ping"}      -> {"ok": true}
+  {"op": "shutdown"}  -> {"ok": true}, y el servidor termina
+
+Cada petición se compila con api.compile_source(). `diagnostics` son
+sus Diagnostic como objetos {"phase", "severity", "message"} (errores
+léxicos, sintácticos y semánticos, avisos del traductor). Si la
+compilación falla, `code` es null. Las compilaciones correctas pasan por
+la caché en disco (cache.py), salvo con --no-cache.
+
+Cada conexión se atiende en su propio hilo: compile_source() es
+reentrante.
+
+Uso: python server.py [--socket RUTA | --port N] [--lexer char|regex]
+                      [--no-cache] [--cache-dir DIR]
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import time
+from typing import Optional
+
+from api import Diagnostic, compile_source
+from cache import CompileCache
+from lexer2 import LEXER_ENGINES
+
+HOST = '127.0.0.1'
+WARMUP_SOURCE = 'main { int: a = 1 + 2 * 3; if (a > 0) { a = a - 1; } }\n'
+
+
+def default_socket() -> str:
+    return os.environ.get('VID_SERVER_SOCKET') or f"/tmp/compilador-vid-{os.getuid()}.sock"
+
+
+class CompileService:
+    """Compila peticiones con el compilador ya cargado en este proceso."""
+
+    def __init__(self, lexer_engine: str = 'char', cache: Optional[CompileCache] = None) -> None:
+        self.lexer_engine = lexer_engine
+        self.cache = cache
+
+    def compile(self, text: str, name: str = '<texto>') -> dict:
+        t0 = time.perf_counter()
+        key = self.cache.key(text) if self.cache is not None else None
+        entry = self.cache.get(key) if key is not None else None
+        if entry is not None:
+            # Los avisos del traductor se guardaron con el código
+            diagnostics = [Diagnostic('traducción', 'warning', w)._asdict() for w in entry.warnings]
+            return {'ok': True, 'code': entry.code, 'diagnostics': diagnostics, 'cached': True,
+                    'seconds': time.perf_counter() - t0}
+
+        result = compile_source(text, name, self.lexer_engine)
+        diagnostics = [d._asdict() for d in result.diagnostics]
+        if result.ok and key is not None:
+            try:
+                self.cache.put(key, result.ast, result.code, [d.message for d in result.warnings])
+            except Exception as e:
+                diagnostics.append({'phase': 'caché', 'severity': 'warning',
+                                    'message': f"Aviso: no se pudo guardar en la caché: {e}"})
+        return {
+            'ok': result.ok,
+            'code': result.code,
+            'diagnostics': diagnostics,
+            'cached': False,
+            'seconds': time.perf_counter() - t0,
+        }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Una conexión: lee peticiones línea a línea hasta que el cliente cierra."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                op = request.get('op', 'compile')
+                if op == 'compile':
+                    response = self.server.service.compile(request['source'],
+                                                           request.get('name', '<texto>'))
+                elif op in ('ping', 'shutdown'):
+                    response = {'ok': True}
+                else:
+                    response = {'ok': False, 'error': f"operación desconocida: {op}"}
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                op, response = None, {'ok': False, 'error': f"petición inválida: {e}"}
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+            if op == 'shutdown':
+                # Desde el hilo de la conexión: serve_forever corre en el principal
+                self.server.shutdown()
+                return
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def remove_stale_socket(socket_path: str) -> None:
+    """
+    Borra `socket_path` si es un socket abandonado (un servidor que terminó
+    sin borrarlo). Lanza RuntimeError si otro servidor sigue escuchando en
+    él o si no es un socket.
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise RuntimeError(f"{socket_path} existe y no es un socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except ConnectionRefusedError:
+        os.remove(socket_path)
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"ya hay un servidor escuchando en {socket_path} "
+                       "(deténgalo con client.py --shutdown o use otro --socket)")
+
+
+def make_server(service: CompileService, socket_path: Optional[str] = None,
+                port: Optional[int] = None):
+    """
+    Servidor ligado a `port` en localhost o, si no, al socket Unix
+    `socket_path`. No le quita la dirección a otro servidor en marcha:
+    RuntimeError si el socket está en uso, OSError si el puerto lo está.
+    """
+    if port is not None:
+        server = _TCPServer((HOST, port), _Handler)
+    else:
+        socket_path = socket_path or default_socket()
+        remove_stale_socket(socket_path)
+        server = _UnixServer(socket_path, _Handler)
+    server.service = service
+    return server
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog='server.py', description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    where = ap.add_mutually_exclusive_group()
+    where.add_argument('--socket', metavar='RUTA',
+                       help="socket Unix (por defecto: $VID_SERVER_SOCKET o /tmp/compilador-vid-<uid>.sock)")
+    where.add_argument('--port', type=int, help=f"puerto TCP en {HOST} en lugar del socket Unix")
+    ap.add_argument('--lexer', choices=sorted(LEXER_ENGINES), default='char',
+                    help="motor del lexer (por defecto: char)")
+    ap.add_argument('--no-cache', dest='cache', action='store_false',
+                    help="no consultar ni actualizar la caché de compilaciones")
+    ap.add_argument('--cache-dir', metavar='DIR',
+                    help="directorio de la caché (por defecto: $VID_CACHE_DIR o ~/.cache/compilador-vid)")
+    args = ap.parse_args()
+
+    service = CompileService(args.lexer, CompileCache(args.cache_dir) if args.cache else None)
+    # Calentar el compilador fuera de la caché
+    CompileService(args.lexer).compile(WARMUP_SOURCE)
+
+    try:
+        server = make_server(service, args.socket, args.port)
+    except (RuntimeError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    address = f"{HOST}:{args.port}" if args.port is not None else server.server_address
+    print(f"Servidor de compilación escuchando en {address}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.port is None and os.path.exists(server.server_address):
+            os.remove(server.server_address)
+    print("Servidor detenido")
+
+
+if __name__ == "__main__":
+    main()
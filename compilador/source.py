@@ -0,0 +1,101 @@
+# source.py
+
+"""
+Carga del texto fuente para todas las fases del compilador.
+
+SourceFile mapea el archivo .vid en memoria (mmap) en lugar de copiarlo
+con open().read(). Las posiciones de los tokens se guardan como
+desplazamientos dentro del fuente; línea y columna se calculan sólo
+cuando hacen falta (mensajes de error, listados) con una búsqueda binaria
+sobre la tabla de inicios de línea.
+
+Sólo el motor regex del lexer (--lexer regex) recorre los bytes mapeados
+sin copiarlos. El motor char avanza carácter a carácter sobre un str, así
+que decodifica el archivo completo (SourceFile.text) y trabaja sobre esa
+copia; con él el mmap sólo evita la lectura con open().read().
+
+Un SourceFile abierto con open() mantiene el archivo mapeado hasta que se
+cierra (close() o `with`). Los tokens resuelven su posición con él, así
+que se cierra al terminar la compilación, una vez construido el AST.
+"""
+
+import mmap
+import re
+from bisect import bisect_right
+from typing import List, Optional, Tuple, Union
+
+
+class SourceFile:
+    """
+    Fuente del programa. `data` puede ser:
+      - bytes / mmap (UTF-8): los desplazamientos son en bytes.
+      - str: los desplazamientos son en caracteres.
+    En ambos casos las columnas se informan en caracteres, como hacía el
+    lexer original al avanzar carácter a carácter.
+    """
+
+    def __init__(self, data: Union[bytes, mmap.mmap, str], path: str = '<texto>') -> None:
+        self.path = path
+        self.data = data
+        self._text: Optional[str] = data if isinstance(data, str) else None
+        self._line_starts: Optional[List[int]] = None
+
+    @classmethod
+    def open(cls, path: str) -> 'SourceFile':
+        """Mapea `path` en memoria de sólo lectura (FileNotFoundError si no existe)."""
+        with open(path, 'rb') as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Un archivo vacío no se puede mapear
+                data = b''
+        return cls(data, path)
+
+    @classmethod
+    def from_text(cls, text: str, path: str = '<texto>') -> 'SourceFile':
+        """Fuente binario (UTF-8) construido a partir de un str en memoria."""
+        return cls(text.encode('utf-8'), path)
+
+    @property
+    def is_text(self) -> bool:
+        return isinstance(self.data, str)
+
+    @property
+    def text(self) -> str:
+        """Contenido decodificado (sólo se decodifica la primera vez)."""
+        if self._text is None:
+            self._text = str(self.data, 'utf-8')
+        return self._text
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def line_starts(self) -> List[int]:
+        """Desplazamientos donde empieza cada línea (se calcula una sola vez)."""
+        if self._line_starts is None:
+            newline = re.compile('\n' if self.is_text else b'\n')
+            self._line_starts = [0] + [m.end() for m in newline.finditer(self.data)]
+        return self._line_starts
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """Convierte un desplazamiento en (línea, columna), ambas desde 1."""
+        starts = self.line_starts
+        index = bisect_right(starts, offset) - 1
+        line_start = starts[index]
+        if self.is_text:
+            return index + 1, offset - line_start + 1
+        segment = self.data[line_start:offset]
+        if segment.isascii():
+            return index + 1, offset - line_start + 1
+        return index + 1, len(segment.decode('utf-8', errors='replace')) + 1
+
+    def close(self) -> None:
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self) -> 'SourceFile':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,136 @@
+# symbols.py
+
+"""
+Tabla de símbolos del análisis semántico con ámbitos encadenados.
+
+Los identificadores se internan: cada nombre distinto recibe un id entero
+la primera vez que aparece, y el tipo visible de cada id se guarda en una
+lista indexada por id (consulta O(1), sin recorrer la cadena de ámbitos).
+
+Los ámbitos usan enlace superficial: al declarar un nombre se apunta en
+un rastro (id, tipo anterior); push() sólo marca la posición del rastro y
+pop() deshace lo declarado desde esa marca. Abrir un ámbito es O(1) y
+cerrarlo cuesta lo que se declaró dentro, en lugar de copiar la tabla
+entera en cada bloque if/while como hacía el dict anterior.
+
+Una declaración en un bloque tapa la de fuera hasta que el bloque se
+cierra, igual que con la copia del dict.
+
+Los tipos son etiquetas internadas (INT, FLOAT, ...): el análisis
+semántico las compara por identidad y las deja anotadas en el AST.
+"""
+
+import sys
+from typing import Dict, List, Mapping, Optional, Tuple
+
+
+def type_tag(name: str) -> str:
+    """Etiqueta de tipo internada para `name` ("int", "video", ...)."""
+    return sys.intern(name)
+
+
+INT = type_tag("int")
+FLOAT = type_tag("float")
+STRING = type_tag("string")
+BOOL = type_tag("bool")
+VIDEO = type_tag("video")
+AUDIO = type_tag("audio")
+# Tipo de un identificador no declarado
+UNKNOWN = type_tag("unknown")
+
+# Operandos válidos del '-' unario y de los operadores binarios
+NUMERIC = frozenset((INT, FLOAT))
+# Tipos admitidos en condiciones y en '!'
+LOGICAL = frozenset((BOOL, INT))
+
+
+class SymbolTable:
+    """Tipos visibles por identificador, con ámbitos anidados."""
+
+    __slots__ = ('ids', 'names', 'types', 'trail', 'marks')
+
+    def __init__(self, initial: Optional[Mapping[str, str]] = None) -> None:
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        # Tipo visible de cada id (None: no declarado en ningún ámbito abierto)
+        self.types: List[Optional[str]] = []
+        # (id, tipo anterior) de cada declaración, para deshacerla en pop()
+        self.trail: List[Tuple[int, Optional[str]]] = []
+        # Longitud del rastro al abrir cada ámbito
+        self.marks: List[int] = []
+        if initial:
+            for name, var_type in initial.items():
+                self.declare(name, var_type)
+
+    @classmethod
+    def of(cls, st) -> 'SymbolTable':
+        """`st` si ya es una SymbolTable; si es un dict (o None), una tabla con su contenido."""
+        return st if isinstance(st, cls) else cls(st)
+
+    def intern(self, name: str) -> int:
+        """Id entero de `name` (se asigna la primera vez)."""
+        sym = self.ids.get(name)
+        if sym is None:
+            sym = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.types.append(None)
+        return sym
+
+    # ——— Ámbitos ———
+    @property
+    def depth(self) -> int:
+        """Ámbitos abiertos además del global."""
+        return len(self.marks)
+
+    def push(self) -> None:
+        self.marks.append(len(self.trail))
+
+    def pop(self) -> None:
+        mark = self.marks.pop()
+        trail, types = self.trail, self.types
+        while len(trail) > mark:
+            sym, previous = trail.pop()
+            types[sym] = previous
+
+    def pop_to(self, depth: int) -> None:
+        """Cierra ámbitos hasta que queden `depth` abiertos (tras una excepción)."""
+        while len(self.marks) > depth:
+            self.pop()
+
+    # ——— Declaración y consulta ———
+    def declare_id(self, sym: int, var_type: str) -> None:
+        if self.marks:
+            # En el ámbito global no hay nada que deshacer
+            self.trail.append((sym, self.types[sym]))
+        self.types[sym] = var_type
+
+    def declare(self, name: str, var_type: str) -> int:
+        sym = self.intern(name)
+        self.declare_id(sym, type_tag(var_type))
+        return sym
+
+    def lookup_id(self, sym: int) -> Optional[str]:
+        return self.types[sym]
+
+    def resolve(self, name: str) -> Tuple[Optional[int], Optional[str]]:
+        """(id, tipo) de `name`, o (None, None) si no está declarado."""
+        sym = self.ids.get(name)
+        if sym is None:
+            return None, None
+        var_type = self.types[sym]
+        return (None, None) if var_type is None else (sym, var_type)
+
+    def lookup(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Tipo visible de `name`, o `default` si no está declarado."""
+        sym = self.ids.get(name)
+        if sym is None:
+            return default
+        var_type = self.types[sym]
+        return default if var_type is None else var_type
+
+    def __contains__(self, name: str) -> bool:
+        return self.lookup(name) is not None
+
+    def visible(self) -> Dict[str, str]:
+        """{nombre: tipo} de lo visible ahora (para depurar y comparar)."""
+        return {self.names[sym]: t for sym, t in enumerate(self.types) if t is not None}
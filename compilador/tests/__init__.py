@@ -0,0 +1,12 @@
+"""
+Pruebas del compilador (pytest). Los fuentes .vid de ejemplo están aparte,
+en tests/ de la raíz del repositorio.
+
+Se ejecutan desde el directorio compilador/:
+    python -m pytest tests
+
+Las de rendimiento usan los generadores y las mediciones de benchmarks/
+con tamaños pequeños y márgenes amplios: detectan un cambio en el orden
+de crecimiento (p.ej. una fase que se vuelve cuadrática), no variaciones
+de unos pocos por ciento.
+"""
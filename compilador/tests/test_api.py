@@ -0,0 +1,48 @@
+"""
+Aislamiento de api.compile_source: la instrumentación que active quien
+llama (tracing, profiling, trace_events) no llega a la compilación, ni
+siquiera desde otro hilo.
+"""
+
+import io
+import threading
+
+import profiling
+import trace_events
+import tracing
+from api import compile_source
+from benchmarks.generate import generate_program
+
+SOURCE = generate_program(200)
+
+
+def test_compile_source_ignores_caller_instrumentation():
+    stream = io.StringIO()
+    tracing.configure('all:trace', stream)
+    profiler = profiling.start('<prueba>')
+    recorder = trace_events.start()
+    try:
+        result = compile_source(SOURCE)
+        assert result.ok
+        assert profiling.active() is profiler
+        assert trace_events.active() is recorder
+        assert tracing.TRACERS['parser'].trace
+    finally:
+        trace_events.stop()
+        profiling.stop()
+        tracing.reset()
+    assert stream.getvalue() == ''
+    assert profiler.phases == []
+    assert [e['ph'] for e in recorder.events] == ['M']
+
+
+def test_instrumentation_is_per_thread():
+    recorder = trace_events.start()
+    try:
+        thread = threading.Thread(target=lambda: trace_events.start('hilo'))
+        thread.start()
+        thread.join()
+        assert trace_events.active() is recorder
+    finally:
+        trace_events.stop()
+    assert trace_events.active() is None
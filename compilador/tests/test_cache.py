@@ -0,0 +1,41 @@
+"""
+Clave de la caché (cache.py): COMPILER_MODULES incluye todos los módulos
+del compilador que importan las fases, para que cambiar cualquiera de
+ellos invalide las entradas guardadas.
+"""
+
+import ast
+import os
+
+from cache import COMPILER_MODULES
+
+COMPILER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Importados por las fases pero sin efecto en el AST ni en el código generado
+INSTRUMENTATION = {'profiling.py', 'tracing.py'}
+
+
+def local_imports(name: str):
+    """Módulos de compilador/ que importa `name` (a cualquier nivel del archivo)."""
+    with open(os.path.join(COMPILER_DIR, name), encoding='utf-8') as f:
+        tree = ast.parse(f.read(), name)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            path = module.split('.')[0] + '.py'
+            if os.path.exists(os.path.join(COMPILER_DIR, path)):
+                yield path
+
+
+def test_compiler_modules_cover_their_imports():
+    missing = {
+        (name, imported)
+        for name in COMPILER_MODULES
+        for imported in local_imports(name)
+        if imported not in COMPILER_MODULES and imported not in INSTRUMENTATION
+    }
+    assert not missing, sorted(missing)
@@ -0,0 +1,34 @@
+"""
+Compilaciones completas de programas generados (benchmarks.generate):
+son válidos y cada compilación tokeniza el fuente una sola vez
+(benchmarks.lex_once).
+"""
+
+import pytest
+
+from api import compile_source
+from benchmarks.generate import generate_nested, generate_program
+from benchmarks.lex_once import compile_driver
+from lexer2 import LEXER_ENGINES
+
+PROGRAMS = {
+    'sentencias': generate_program(1000),
+    'otra semilla': generate_program(1000, depth=5, seed=7),
+    'anidado': generate_nested(32, declarations=10),
+}
+
+
+@pytest.mark.parametrize('name', PROGRAMS)
+def test_generated_programs_compile_cleanly(name):
+    result = compile_source(PROGRAMS[name], name)
+    assert result.ok
+    assert result.diagnostics == []
+    assert result.lexer_runs == 1
+
+
+@pytest.mark.parametrize('stream', (False, True), ids=('lista', 'stream'))
+@pytest.mark.parametrize('engine', sorted(LEXER_ENGINES))
+def test_driver_lexes_once(engine, stream, tmp_path):
+    fuente = tmp_path / 'programa.vid'
+    fuente.write_text(PROGRAMS['sentencias'], encoding='utf-8')
+    assert compile_driver(str(fuente), str(tmp_path / 'output.py'), engine, stream) == 1
@@ -0,0 +1,18 @@
+"""
+Presupuesto de importación (benchmarks.import_time): cada módulo de
+entrada se importa en un intérprete nuevo dentro de BUDGET_MS y sin
+cargar graphviz.
+"""
+
+import pytest
+
+from benchmarks.import_time import BUDGET_MS, best_run, forbidden_imports, total_us
+
+MODULES = ('ejecutar_compilador', 'parser2', 'ast_semantic', 'api', 'server')
+
+
+@pytest.mark.parametrize('module', MODULES)
+def test_import_within_budget(module):
+    entries = best_run(module, repeat=3)
+    assert total_us(entries, module) / 1e3 <= BUDGET_MS
+    assert forbidden_imports(entries) == []
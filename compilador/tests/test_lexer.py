@@ -0,0 +1,55 @@
+"""
+Motores del lexer (benchmarks.bench_lexer): 'char' y 'regex' dan los
+mismos tokens y los mismos errores.
+"""
+
+import glob
+import os
+
+import pytest
+
+from benchmarks.bench_lexer import build_source
+from lexer2 import make_lexer
+from source import SourceFile
+
+COMPILER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = sorted(glob.glob(os.path.join(os.path.dirname(COMPILER_DIR), 'tests', '*.vid'))) + [
+    os.path.join(COMPILER_DIR, 'prueba2.txt'),
+    os.path.join(COMPILER_DIR, 'prueba_video_params.txt'),
+]
+
+# Un caso de cada error léxico; en la línea 3 hay texto no ASCII antes del error
+ERRORS = '''main {
+    string: título = "añadir";
+    int: año = 1.2.3;
+    int: b = 12abc;
+    string: c = "sin cerrar
+    /* comentario mal formado */
+    video: d = @noexiste[];
+    e = @ 1;
+    f = $;
+}
+'''
+
+
+def assert_same_tokens(source) -> None:
+    char, regex = make_lexer(source, 'char'), make_lexer(source, 'regex')
+    assert regex.tokenize() == char.tokenize()
+    assert regex.errors == char.errors
+
+
+@pytest.mark.parametrize('path', FIXTURES, ids=os.path.basename)
+def test_engines_agree_on_fixtures(path):
+    with SourceFile.open(path) as source:
+        assert_same_tokens(source)
+
+
+def test_engines_agree_on_errors():
+    lexer = make_lexer(ERRORS, 'char')
+    lexer.tokenize()
+    assert len(lexer.errors) == 7
+    assert_same_tokens(SourceFile.from_text(ERRORS))
+
+
+def test_engines_agree_on_large_source():
+    assert_same_tokens(build_source(0.25))
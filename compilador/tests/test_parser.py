@@ -0,0 +1,44 @@
+"""
+Recuperación de errores del parser (benchmarks.bench_recovery): un solo
+parse informa de los errores introducidos, y sin errores la recuperación
+no cuesta nada.
+"""
+
+from typing import List
+
+from benchmarks.bench_recovery import inject_errors
+from benchmarks.bench_suite import best_time
+from benchmarks.generate import generate_program
+from lexer2 import make_lexer
+from parser2 import TableDrivenParser
+
+SOURCE = generate_program(2000)
+
+
+def syntax_errors(src: str, recover: bool = True) -> List[str]:
+    """Mensajes de error del parse de `src` (uno por línea de la excepción, como api.py)."""
+    parser = TableDrivenParser(tokens=make_lexer(src, 'regex').tokenize(), recover=recover)
+    try:
+        parser.parse(build_tree=False)
+    except SyntaxError as e:
+        return str(e).split("\n")
+    return []
+
+
+def test_recovery_reports_every_error():
+    assert syntax_errors(SOURCE) == []
+    bad = inject_errors(SOURCE, 30)
+    assert len(syntax_errors(bad)) == 30
+    assert len(syntax_errors(bad, recover=False)) == 1
+
+
+def test_recovery_is_free_without_errors():
+    tokens = make_lexer(SOURCE, 'regex').tokenize()
+
+    def parse(recover):
+        secs, _ = best_time(lambda: TableDrivenParser(tokens=tokens, recover=recover).parse(build_tree=False),
+                            repeat=5, min_time=0.05)
+        return secs
+
+    plain, recovering = parse(False), parse(True)
+    assert recovering <= 1.3 * plain, f"{plain * 1e3:.1f} ms -> {recovering * 1e3:.1f} ms"
@@ -0,0 +1,95 @@
+"""
+Crecimiento del coste con el tamaño del programa: la versión pequeña de
+benchmarks.scaling, bench_expr, bench_statements y bench_scopes.
+
+Cada serie ajusta el exponente k de t ~ n^k y lo compara con el de
+n log n más MARGIN.
+"""
+
+import gc
+import sys
+
+import pytest
+
+from ast_semantic import parse_ast
+from benchmarks.bench_expr import SHAPES, exponent
+from benchmarks.bench_statements import build_program
+from benchmarks.bench_suite import best_time
+from benchmarks.generate import generate_nested, generate_program
+from benchmarks.scaling import measure_series, nlogn_exponent
+from lexer2 import make_lexer
+from parser2 import TableDrivenParser
+from symbols import SymbolTable
+
+# A estos tamaños el ruido mueve el exponente ajustado unas 0.15 por
+# encima del de n log n; una fase cuadrática daría cerca de 2. Sólo se
+# ajusta la serie completa: el exponente de la cola (benchmarks.scaling)
+# es demasiado ruidoso con tan pocos puntos.
+MARGIN = 0.35
+REPEAT = 3
+MIN_TIME = 0.02
+
+
+def assert_scaling(series: dict) -> None:
+    """Falla si algún exponente de `series` ({nombre: [(n, segundos)]}) supera el límite."""
+    sizes = [n for n, _ in next(iter(series.values()))]
+    limit = nlogn_exponent(sizes) + MARGIN
+    exponents = {name: round(exponent(points), 2) for name, points in series.items()}
+    assert all(k <= limit for k in exponents.values()), f"límite {limit:.2f}: {exponents}"
+
+
+def parse_time(src: str) -> float:
+    """Mejor tiempo del parse con acciones (AST) de `src`, ya tokenizado."""
+    tokens = make_lexer(src, 'regex').tokenize()
+    secs, _ = best_time(lambda: parse_ast(TableDrivenParser(tokens=tokens)), REPEAT, MIN_TIME)
+    return secs
+
+
+def test_phases_scale_with_statements():
+    sizes = (500, 1000, 2000, 4000)
+    assert_scaling(measure_series([(n, generate_program(n)) for n in sizes], REPEAT, MIN_TIME))
+
+
+def test_phases_scale_with_nesting():
+    depths = (8, 16, 32, 64)
+    assert_scaling(measure_series([(d, generate_nested(d)) for d in depths], REPEAT, MIN_TIME))
+
+
+@pytest.mark.parametrize('shape', sorted(SHAPES))
+def test_expressions_scale_linearly(shape):
+    top = 8000 if shape == 'plana' else 400
+    make = SHAPES[shape]
+    # Cada nivel de paréntesis son dos llamadas del parser de expresiones
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 10 * top))
+    try:
+        points = [(n, parse_time(f"main {{ int: x = {make(n)}; }}"))
+                  for n in (top // 8, top // 4, top // 2, top)]
+    finally:
+        sys.setrecursionlimit(limit)
+    assert_scaling({shape: points})
+
+
+def test_statement_lists_scale_linearly():
+    points = [(n, parse_time(build_program(n))) for n in (1000, 2000, 4000, 8000)]
+    assert_scaling({'parse_ast': points})
+
+
+def test_scopes_do_not_copy_visible_names():
+    """Abrir y cerrar un ámbito cuesta lo mismo con 10 que con 20000 nombres visibles."""
+    def blocks(table):
+        for _ in range(1000):
+            table.push()
+            table.declare('x', 'int')
+            table.pop()
+
+    times = []
+    gc.disable()
+    try:
+        for n in (10, 20000):
+            table = SymbolTable({f"v{i}": 'int' for i in range(n)})
+            secs, _ = best_time(lambda: blocks(table), REPEAT, MIN_TIME)
+            times.append(secs)
+    finally:
+        gc.enable()
+    assert times[1] <= 3 * times[0], f"{times[0] * 1e3:.2f} ms -> {times[1] * 1e3:.2f} ms"
@@ -0,0 +1,50 @@
+"""
+Arranque del servidor de compilación (server.py) sobre un socket Unix que
+ya existe: un socket abandonado se reemplaza, uno en uso no.
+"""
+
+import socket
+import threading
+
+import pytest
+
+from server import CompileService, make_server
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / 'vid.sock')
+
+
+def test_replaces_stale_socket(socket_path):
+    # Un socket ligado y cerrado sin borrarlo: nadie lo escucha
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+    server = make_server(CompileService(), socket_path)
+    server.server_close()
+
+
+def test_refuses_socket_in_use(socket_path):
+    first = make_server(CompileService(), socket_path)
+    thread = threading.Thread(target=first.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(RuntimeError, match='ya hay un servidor escuchando'):
+            make_server(CompileService(), socket_path)
+        # El primero sigue atendiendo en su socket
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(b'{"op": "ping"}\n')
+            assert client.makefile('rb').readline() == b'{"ok": true}\n'
+    finally:
+        first.shutdown()
+        first.server_close()
+        thread.join()
+
+
+def test_refuses_path_that_is_not_a_socket(socket_path):
+    with open(socket_path, 'w') as f:
+        f.write('no es un socket')
+    with pytest.raises(RuntimeError, match='no es un socket'):
+        make_server(CompileService(), socket_path)
@@ -0,0 +1,152 @@
+# tokenbuf.py
+
+"""
+Almacenamiento compacto de tokens (struct-of-arrays).
+
+Una lista de Token crea un objeto Python por lexema; en un guion grande eso
+son millones de objetos pequeños. TokenBuffer guarda la misma información
+en columnas `array` paralelas:
+
+    types    código del TokenType (TokenType.value)
+    starts   desplazamiento del valor en el fuente
+    lengths  longitud del valor en el fuente
+
+Ni el valor ni la posición de cada token se guardan: el valor se extrae
+del fuente y la línea/columna se calcula con SourceFile.position sólo
+cuando se piden, igual que en un Token con `offset`. Los consumidores
+(TableDrivenParser, _ExprParser) acceden por índice con type(i), value(i)
+y position(i) sin construir objetos Token; token(i) materializa uno cuando
+hace falta (mensajes, listados).
+"""
+
+from array import array
+from typing import Iterable, Iterator, Tuple
+
+from enums import TokenType, Token
+from source import SourceFile
+
+
+# Código entero → TokenType (los valores de TokenType empiezan en 1)
+_BY_CODE: Tuple[TokenType, ...] = (None,) + tuple(TokenType)
+assert all(t.value == i for i, t in enumerate(_BY_CODE) if t is not None)
+_STRING_LITERAL = TokenType.STRING_LITERAL.value
+
+
+class TokenBuffer:
+    """Secuencia de tokens en columnas; se indexa como una lista de Token."""
+
+    def __init__(self, source: SourceFile) -> None:
+        self.source = source
+        self.types = array('B')
+        self.starts = array('q')
+        self.lengths = array('I')
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[Token], source: SourceFile) -> 'TokenBuffer':
+        """
+        Vuelca un flujo de tokens (p.ej. Lexer.iter_tokens()) en columnas.
+        Cada Token se descarta en cuanto se ha copiado, de modo que nunca
+        coexisten todos en memoria. Los tokens deben venir de `source`.
+        """
+        buf = cls(source)
+        types, starts, lengths = buf.types, buf.starts, buf.lengths
+        binary = not source.is_text
+        string_literal = TokenType.STRING_LITERAL
+        for tok in tokens:
+            value = tok.value
+            start = tok.offset
+            # El valor de un literal de cadena empieza tras la comilla
+            if tok.type is string_literal:
+                start += 1
+            size = len(value)
+            if binary and not value.isascii():
+                size = len(value.encode('utf-8'))
+            types.append(tok.type.value)
+            starts.append(start)
+            lengths.append(size)
+        return buf
+
+    @classmethod
+    def from_lexer(cls, lexer) -> 'TokenBuffer':
+        """Tokeniza con `lexer` directamente al buffer (errores en lexer.errors)."""
+        return cls.from_tokens(lexer.iter_tokens(), lexer.source)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    # ——— Accesores por índice (no crean objetos Token) ———
+
+    def code(self, i: int) -> int:
+        return self.types[i]
+
+    def type(self, i: int) -> TokenType:
+        return _BY_CODE[self.types[i]]
+
+    def value(self, i: int) -> str:
+        start = self.starts[i]
+        lexeme = self.source.data[start:start + self.lengths[i]]
+        return lexeme if isinstance(lexeme, str) else str(lexeme, 'utf-8')
+
+    def offset(self, i: int) -> int:
+        """Desplazamiento del token i en el fuente (el de Token.offset)."""
+        # El valor de un literal de cadena empieza tras la comilla
+        return self.starts[i] - (self.types[i] == _STRING_LITERAL)
+
+    def position(self, i: int) -> Tuple[int, int]:
+        return self.source.position(self.offset(i))
+
+    def line(self, i: int) -> int:
+        return self.position(i)[0]
+
+    def column(self, i: int) -> int:
+        return self.position(i)[1]
+
+    # ——— Compatibilidad con List[Token] ———
+
+    def token(self, i: int) -> Token:
+        """Materializa el token i (su posición se resuelve al consultarla)."""
+        return Token(self.type(i), self.value(i), offset=self.offset(i), source=self.source)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.token(k) for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('TokenBuffer index out of range')
+        return self.token(i)
+
+    def __iter__(self) -> Iterator[Token]:
+        for i in range(len(self)):
+            yield self.token(i)
+
+    def nbytes(self) -> int:
+        """Memoria ocupada por las columnas (sin contar el fuente)."""
+        return sum(col.itemsize * len(col) for col in
+                   (self.types, self.starts, self.lengths))
+
+
+class _TokenFields:
+    """
+    Mismos accesores que TokenBuffer, pero sobre objetos Token: permite que
+    un consumidor trabaje igual con índices de un buffer o con tokens.
+    """
+
+    @staticmethod
+    def type(tok: Token) -> TokenType:
+        return tok.type
+
+    @staticmethod
+    def value(tok: Token) -> str:
+        return tok.value
+
+    @staticmethod
+    def position(tok: Token) -> Tuple[int, int]:
+        return tok.line, tok.column
+
+    @staticmethod
+    def token(tok: Token) -> Token:
+        return tok
+
+
+TOKEN_FIELDS = _TokenFields()
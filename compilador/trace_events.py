@@ -0,0 +1,175 @@
+# trace_events.py
+
+"""
+Eventos de traza en formato Chrome Trace Event (opción --trace del driver),
+para abrirlos en chrome://tracing, Perfetto u otro visor compatible.
+
+Cada span es un evento completo ("ph": "X") con inicio y duración en
+microsegundos. Los instantes son de reloj de pared (época Unix), de modo
+que los eventos de la compilación y los del script moviepy generado
+(translator con trace_render) caen en la misma línea de tiempo, cada uno
+con su pid.
+
+Sin un TraceRecorder activo, span() devuelve un context manager vacío y
+compartido: no se toma ninguna marca de tiempo.
+
+Las fases de profiling.phase() emiten también su span. Además se emite
+uno por sentencia de primer nivel en el chequeo semántico y uno por
+sentencia en la traducción.
+
+El recorder activo es una variable de contexto (contextvars), como el
+Profiler: start() lo activa para el hilo que lo llama, y
+api.compile_source() compila en un contexto nuevo, sin trazas.
+"""
+
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+# Recorder activo en el contexto actual (None: trazas desactivadas)
+_ACTIVE: 'ContextVar[Optional[TraceRecorder]]' = ContextVar('trace_recorder', default=None)
+
+
+class TraceRecorder:
+    """Acumula los eventos de un proceso y los escribe como JSON."""
+
+    def __init__(self, process_name: str = 'compilador') -> None:
+        self.pid = os.getpid()
+        # Desfase entre perf_counter (preciso) y el reloj de pared
+        self.offset_ns = time.time_ns() - time.perf_counter_ns()
+        self.events: List[dict] = [{
+            'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+            'args': {'name': process_name},
+        }]
+
+    def now(self) -> int:
+        """Instante actual en ns del reloj de pared."""
+        return time.perf_counter_ns() + self.offset_ns
+
+    def complete(self, name: str, cat: str, start_ns: int, end_ns: int,
+                 args: Optional[dict] = None) -> None:
+        event = {
+            'name': name, 'cat': cat, 'ph': 'X',
+            'ts': start_ns / 1000, 'dur': (end_ns - start_ns) / 1000,
+            'pid': self.pid, 'tid': threading.get_native_id(),
+        }
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def write(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+            f.write('\n')
+
+
+class _Span:
+    """Context manager de un span registrado en un TraceRecorder."""
+
+    __slots__ = ('recorder', 'name', 'cat', 'args', 'start')
+
+    def __init__(self, recorder: TraceRecorder, name: str, cat: str, args: Optional[dict]) -> None:
+        self.recorder = recorder
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self) -> '_Span':
+        self.start = self.recorder.now()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.recorder.complete(self.name, self.cat, self.start, self.recorder.now(), self.args)
+        return False
+
+
+class _NoSpan:
+    """Span sin recorder: no registra nada."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def active() -> Optional[TraceRecorder]:
+    """TraceRecorder activo en el contexto actual, o None."""
+    return _ACTIVE.get()
+
+
+def span(name: str, cat: str = 'compiler', args: Optional[dict] = None):
+    """Context manager que registra el span `name` si hay un TraceRecorder activo."""
+    recorder = _ACTIVE.get()
+    if recorder is None:
+        return _NO_SPAN
+    return _Span(recorder, name, cat, args)
+
+
+def statement_span(stmt, cat: str):
+    """Span de una sentencia del AST (nombre de su clase y línea en args)."""
+    recorder = _ACTIVE.get()
+    if recorder is None:
+        return _NO_SPAN
+    return _Span(recorder, type(stmt).__name__, cat, {'line': getattr(stmt, 'line', None)})
+
+
+def start(process_name: str = 'compilador') -> TraceRecorder:
+    """Activa un TraceRecorder nuevo en el contexto actual y lo devuelve."""
+    recorder = TraceRecorder(process_name)
+    _ACTIVE.set(recorder)
+    return recorder
+
+
+def stop() -> Optional[TraceRecorder]:
+    """Desactiva el TraceRecorder activo y lo devuelve."""
+    recorder = _ACTIVE.get()
+    _ACTIVE.set(None)
+    return recorder
+
+
+# Prólogo del script generado con trace_render: mismo formato de evento,
+# y al salir los spans se añaden al archivo de traza de la compilación.
+RENDER_PRELUDE = '''\
+import atexit as _atexit
+import json as _json
+import os as _os
+import time as _time
+
+_TRACE_FILE = {path!r}
+_TRACE_EVENTS = [{{"name": "process_name", "ph": "M", "pid": _os.getpid(), "tid": 0,
+                  "args": {{"name": "render"}}}}]
+
+
+class _span:
+    def __init__(self, name, cat):
+        self.name, self.cat = name, cat
+
+    def __enter__(self):
+        self.start = _time.time_ns()
+
+    def __exit__(self, *exc):
+        _TRACE_EVENTS.append({{"name": self.name, "cat": self.cat, "ph": "X",
+                              "ts": self.start / 1000, "dur": (_time.time_ns() - self.start) / 1000,
+                              "pid": _os.getpid(), "tid": 0}})
+        return False
+
+
+@_atexit.register
+def _trace_flush():
+    trace = {{"traceEvents": [], "displayTimeUnit": "ms"}}
+    if _os.path.exists(_TRACE_FILE):
+        with open(_TRACE_FILE, encoding="utf-8") as f:
+            trace = _json.load(f)
+    trace["traceEvents"].extend(_TRACE_EVENTS)
+    with open(_TRACE_FILE, "w", encoding="utf-8") as f:
+        _json.dump(trace, f)
+'''
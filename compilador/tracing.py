@@ -0,0 +1,127 @@
+# tracing.py
+
+"""
+Trazas de depuración por categoría y nivel.
+
+Cada fase del compilador tiene su Tracer (lexer, parser, ast, translator).
+Todos empiezan desactivados. Con el tracer apagado, un punto de traza sólo
+cuesta consultar su nivel. Ni el mensaje ni los datos que necesita se
+calculan:
+
+    if tracing.AST.debug:
+        tracing.AST.write(f"... {detalle_caro()}")
+
+En bucles calientes se copia el booleano a una variable local antes del
+bucle. Niveles, de menos a más detallado:
+
+  info   resumen de cada fase
+  debug  un evento por elemento (token, llamada a función, sentencia)
+  trace  un evento por paso interno (MATCH/EXPAND/RULE del parser)
+
+La salida va a sys.stderr (consultado al escribir) con el prefijo
+[categoría]. configure() interpreta la opción --debug del driver.
+
+El nivel y el destino de cada categoría son variables de contexto
+(contextvars), no atributos globales: configure() activa las trazas para
+el hilo que lo llama, y api.compile_source() compila en un contexto
+nuevo, sin trazas.
+"""
+
+import sys
+from contextvars import ContextVar
+from typing import Dict, Optional, TextIO, Tuple
+
+OFF, INFO, DEBUG, TRACE = 0, 1, 2, 3
+LEVELS = {'info': INFO, 'debug': DEBUG, 'trace': TRACE}
+CATEGORIES = ('lexer', 'parser', 'ast', 'translator')
+
+# (nivel, destino) de las categorías activas en el contexto actual; se
+# reemplaza entero al cambiar, nunca se modifica el dict
+_SETTINGS: 'ContextVar[Dict[str, Tuple[int, Optional[TextIO]]]]' = ContextVar('tracing', default={})
+_DISABLED = (OFF, None)
+
+
+class Tracer:
+    """
+    Trazas de una categoría; `info`/`debug`/`trace` dicen qué niveles están
+    activos en el contexto actual.
+    """
+
+    __slots__ = ('category',)
+
+    def __init__(self, category: str) -> None:
+        self.category = category
+
+    @property
+    def level(self) -> int:
+        return _SETTINGS.get().get(self.category, _DISABLED)[0]
+
+    @property
+    def stream(self) -> Optional[TextIO]:
+        return _SETTINGS.get().get(self.category, _DISABLED)[1]
+
+    @property
+    def info(self) -> bool:
+        return self.level >= INFO
+
+    @property
+    def debug(self) -> bool:
+        return self.level >= DEBUG
+
+    @property
+    def trace(self) -> bool:
+        return self.level >= TRACE
+
+    def set_level(self, level: int, stream: Optional[TextIO] = None) -> None:
+        """Nivel (y destino, si se da) de la categoría en el contexto actual."""
+        settings = dict(_SETTINGS.get())
+        settings[self.category] = (level, stream or self.stream)
+        _SETTINGS.set(settings)
+
+    def enabled(self, level: int) -> bool:
+        return self.level >= level
+
+    def log(self, level: int, msg: str, *args) -> None:
+        """Escribe `msg % args` si el nivel está activo; sin él no se formatea nada."""
+        if self.level >= level:
+            self.write(msg % args if args else msg)
+
+    def write(self, msg: str) -> None:
+        """Escribe una línea de traza sin comprobar el nivel."""
+        print(f"[{self.category}] {msg}", file=self.stream or sys.stderr)
+
+
+TRACERS: Dict[str, Tracer] = {category: Tracer(category) for category in CATEGORIES}
+LEXER = TRACERS['lexer']
+PARSER = TRACERS['parser']
+AST = TRACERS['ast']
+TRANSLATOR = TRACERS['translator']
+
+
+def configure(spec: str, stream: Optional[TextIO] = None) -> None:
+    """
+    Activa categorías a partir de una especificación 'cat[:nivel],...'. Por
+    ejemplo 'parser', 'lexer:info,ast:debug' o 'all:debug'. Sin nivel se
+    activa todo ('trace'). 'all' equivale a todas las categorías. Lanza
+    ValueError con categorías o niveles desconocidos.
+    """
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        category, _, level_name = item.partition(':')
+        level_name = level_name or 'trace'
+        if level_name not in LEVELS:
+            raise ValueError(f"nivel de traza desconocido '{level_name}' "
+                             f"(válidos: {', '.join(LEVELS)})")
+        if category == 'all':
+            selected = list(TRACERS.values())
+        elif category in TRACERS:
+            selected = [TRACERS[category]]
+        else:
+            raise ValueError(f"categoría de traza desconocida '{category}' "
+                             f"(válidas: {', '.join(CATEGORIES)}, all)")
+        for tracer in selected:
+            tracer.set_level(LEVELS[level_name], stream)
+
+
+def reset() -> None:
+    """Desactiva todas las categorías en el contexto actual."""
+    _SETTINGS.set({})
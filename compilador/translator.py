@@ -16,17 +16,26 @@ from ast_semantic import (
     IfStmt,
     Literal,
     Program,
+    UnaryOp,
     VarDecl,
     VideoFuncCall,
     WhileStmt,
+    count_nodes,
 )
+import profiling
+import trace_events
+import tracing
 
 
 class Translator:
-    def __init__(self):
+    def __init__(self, trace_render=None):
         self.output = []
         self.indent_level = 0
-        self.symbol_table = {}  # Add symbol table to track variable types
+        # Archivo de traza Chrome al que el script generado añade sus spans
+        # de carga, efectos y escritura (None: script sin instrumentar)
+        self.trace_render = trace_render
+        # Avisos de la traducción, en orden; no se imprimen aquí
+        self.warnings = []
         
     def indent(self):
         self.indent_level += 1
@@ -36,6 +45,19 @@ class Translator:
         
     def write(self, line):
         self.output.append("    " * self.indent_level + line)
+
+    def warn(self, message):
+        self.warnings.append(message)
+
+    def write_traced(self, name, cat, line):
+        """Escribe `line`; con trace_render, dentro de un span del script generado."""
+        if self.trace_render is None:
+            self.write(line)
+            return
+        self.write(f"with _span({name!r}, {cat!r}):")
+        self.indent()
+        self.write(line)
+        self.dedent()
         
     def translate(self, ast):
         # Escribir imports necesarios
@@ -43,27 +65,37 @@ class Translator:
         self.write("from moviepy.video.fx.all import *")
         self.write("from moviepy.audio.fx.all import *")
         self.write("")
+        if self.trace_render is not None:
+            self.output.extend(trace_events.RENDER_PRELUDE.format(path=self.trace_render).splitlines())
+            self.write("")
         
         # Traducir el programa
         if isinstance(ast, Program):
             for stmt in ast.statements:
                 self.translate_statement(stmt)
-                
+
+        if tracing.TRANSLATOR.info:
+            tracing.TRANSLATOR.write(f"{len(self.output)} líneas de Python generadas")
         return "\n".join(self.output)
     
     def translate_statement(self, stmt):
+        if tracing.TRANSLATOR.debug:
+            tracing.TRANSLATOR.write(f"{type(stmt).__name__} en línea {stmt.line} (nivel {self.indent_level})")
+        with trace_events.statement_span(stmt, "translate"):
+            self._translate_statement(stmt)
+
+    def _translate_statement(self, stmt):
         if isinstance(stmt, VarDecl):
             self.translate_var_decl(stmt)
-            # Store variable type in symbol table
-            self.symbol_table[stmt.name] = stmt.var_type
         elif isinstance(stmt, Assignment):
             if isinstance(stmt.expr, VideoFuncCall):
                 # For video functions, we need to handle the first argument if it's the video itself
                 func_str = self.translate_video_func(stmt.expr, stmt.name)
+                span_name = f"{stmt.expr.func} {stmt.name}"
                 if stmt.expr.func == "@concatenar":
-                    self.write(f"{stmt.name} = {func_str}")
+                    self.write_traced(span_name, "render.effect", f"{stmt.name} = {func_str}")
                 else:
-                    self.write(f"{stmt.name} = {stmt.name}{func_str}")
+                    self.write_traced(span_name, "render.effect", f"{stmt.name} = {stmt.name}{func_str}")
             else:
                 # Regular assignment
                 expr = self.translate_expr(stmt.expr)
@@ -80,21 +112,24 @@ class Translator:
         
         # Manejar tipos especiales
         if decl.var_type == "video":
-            self.write(f"{decl.name} = VideoFileClip({init_expr})")
+            self.write_traced(f"VideoFileClip {decl.name}", "render.load",
+                              f"{decl.name} = VideoFileClip({init_expr})")
         elif decl.var_type == "audio":
-            self.write(f"{decl.name} = AudioFileClip({init_expr})")
+            self.write_traced(f"AudioFileClip {decl.name}", "render.load",
+                              f"{decl.name} = AudioFileClip({init_expr})")
         else:
             self.write(f"{decl.name} = {init_expr}")
             
     def translate_export(self, export):
         # Asegurarse de que el nombre del archivo tenga comillas
         out_file = export.out_file.strip('"')  # Remover comillas existentes
-        # Check variable type in symbol table
-        var_type = self.symbol_table.get(export.name)
-        if var_type == "audio":
-            self.write(f'{export.name}.write_audiofile("{out_file}")')
+        # Tipo de la variable, anotado por el análisis semántico
+        if export.type == "audio":
+            self.write_traced(f"write_audiofile {out_file}", "render.write",
+                              f'{export.name}.write_audiofile("{out_file}")')
         else:
-            self.write(f'{export.name}.write_videofile("{out_file}")')
+            self.write_traced(f"write_videofile {out_file}", "render.write",
+                              f'{export.name}.write_videofile("{out_file}")')
         
     def translate_if(self, if_stmt):
         condition = self.translate_expr(if_stmt.condition)
@@ -127,6 +162,11 @@ class Translator:
             left = self.translate_expr(expr.left)
             right = self.translate_expr(expr.right)
             return f"({left} {expr.op} {right})"
+        elif isinstance(expr, UnaryOp):
+            operand = self.translate_expr(expr.operand)
+            if expr.op == "-":
+                return f"(-{operand})"
+            return f"(not {operand})"
         elif isinstance(expr, Literal):
             # Asegurarse de que los strings tengan comillas correctamente
             if expr.lit_type == "string":
@@ -140,7 +180,7 @@ class Translator:
             try:
                 return self.translate_video_func(expr, None)
             except Exception as e:
-                print(f"Error al traducir función de video: {str(e)}")
+                self.warn(f"Error al traducir función de video: {str(e)}")
                 return str(expr)
         return str(expr)
     
@@ -151,16 +191,9 @@ class Translator:
             func: VideoFuncCall node
             target_var: Optional name of the target variable (for methods that operate on video objects)
         """
-        # Helper to validate and format arguments
-        def format_arg(arg, expected_type=None):
-            translated = self.translate_expr(arg)
-            if isinstance(arg, Identifier) and expected_type:
-                var_type = self.symbol_table.get(arg.name)
-                if var_type != expected_type:
-                    raise TypeError(f"Expected {expected_type} argument but got {var_type}")
-            if isinstance(arg, str) and (arg.startswith('"') or arg.endswith('"')):
-                return f'"{arg.strip('"')}"'
-            return str(translated)
+        # Helper to format arguments
+        def format_arg(arg):
+            return str(self.translate_expr(arg))
 
         # Mapeo de funciones de video a moviepy con validación de argumentos
         video_funcs = {
@@ -247,10 +280,10 @@ class Translator:
             # Validate argument count after potential target var removal
             total_args = len(args)
             if total_args < func_info['min_args']:
-                print(f"Warning: {func.func} called with too few arguments at line {func.line}")
+                self.warn(f"Warning: {func.func} called with too few arguments at line {func.line}")
                 return func_info['default']
             if total_args > func_info['max_args']:
-                print(f"Warning: {func.func} called with too many arguments at line {func.line}")
+                self.warn(f"Warning: {func.func} called with too many arguments at line {func.line}")
                 args = args[:func_info['max_args']]
 
             formatted_args = [format_arg(arg) for arg in args]
@@ -258,9 +291,55 @@ class Translator:
             return result
             
         except Exception as e:
-            print(f"Error al traducir función {func.func} en línea {func.line}: {str(e)}")
+            self.warn(f"Error al traducir función {func.func} en línea {func.line}: {str(e)}")
             return func_info['default']
 
+def _write_error_stub(output_file, error):
+    """Informa del error y deja un archivo de salida con el mensaje como comentario."""
+    print(f"Error durante la traducción: {str(error)}")
+    # Crear un archivo de salida incluso si hay error, con un mensaje de error como comentario
+    try:
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(f"# Error durante la traducción: {str(error)}\n")
+            f.write("# El código generado puede estar incompleto\n\n")
+            f.write("print('Error: El código no se pudo generar correctamente')\n")
+    except:
+        pass
+
+
+def translate_to_file(ast, output_file, trace_render=None, warnings=None):
+    """
+    Traduce el AST y escribe el código Python en output_file. Con
+    `trace_render` (ruta de una traza Chrome) el script generado añade a
+    ese archivo sus spans de carga, efectos y escritura al terminar.
+    Los avisos se imprimen y, si se pasa una lista `warnings`, se añaden
+    a ella. Devuelve el código de salida de la fase (0 = sin errores).
+    """
+    translator = Translator(trace_render)
+    try:
+        # Traducir a Python
+        try:
+            with profiling.phase('Translator.translate') as stats:
+                python_code = translator.translate(ast)
+        finally:
+            for warning in translator.warnings:
+                print(warning)
+            if warnings is not None:
+                warnings.extend(translator.warnings)
+        if stats is not None:
+            stats.nodes = count_nodes(ast)
+
+        # Escribir el código Python generado
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(python_code)
+
+        print(f"Código Python generado en {output_file}")
+        return 0
+    except Exception as e:
+        _write_error_stub(output_file, e)
+        return 1
+
+
 def main():
     if len(sys.argv) != 3:
         print("Uso: python translator.py <archivo_fuente> <archivo_salida>")
@@ -274,39 +353,25 @@ def main():
         from ast_semantic import TableDrivenParser, build_ast
         
         # Parsear el archivo fuente
-        with open(source, encoding="utf-8") as f:
-            source_code = f.read()
-            
-        parser = TableDrivenParser(source_code)
-        parse_tree = parser.parse()
-        
-        # Construir el AST
-        ast = build_ast(parse_tree)
-        
-        # Traducir a Python
-        translator = Translator()
-        python_code = translator.translate(ast)
-        
-        # Escribir el código Python generado
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(python_code)
-            
-        print(f"Código Python generado en {output_file}")
+        from source import SourceFile
+        with SourceFile.open(source) as source_code:
+            parser = TableDrivenParser(source_code)
+            parse_tree = parser.parse()
+
+            # Construir el AST y anotarlo (tipos de las variables exportadas)
+            ast = build_ast(parse_tree)
+            ast.check_semantic()
         
     except FileNotFoundError:
         print(f"Error: No se pudo encontrar el archivo {source}")
         sys.exit(1)
     except Exception as e:
-        print(f"Error durante la traducción: {str(e)}")
-        # Crear un archivo de salida incluso si hay error, con un mensaje de error como comentario
-        try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(f"# Error durante la traducción: {str(e)}\n")
-                f.write("# El código generado puede estar incompleto\n\n")
-                f.write("print('Error: El código no se pudo generar correctamente')\n")
-        except:
-            pass
+        _write_error_stub(output_file, e)
         sys.exit(1)
 
+    code = translate_to_file(ast, output_file)
+    if code != 0:
+        sys.exit(code)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,100 @@
+# visitor.py
+
+"""
+Recorridos iterativos de árboles (parse tree y AST) con pila explícita.
+
+Un parse tree LL(1) tiene una docena de niveles por cada nivel de
+precedencia de una expresión, y las listas de sentencias se encadenan
+por la derecha, así que recorrerlo con una llamada de Python por nodo
+agota el límite de recursión con entradas medianas. Aquí la pila de
+llamadas se sustituye por una lista de Frames (con __slots__).
+
+  preorder(root)     genera los nodos en preorden
+  TreeWalker.walk()  recorrido en profundidad con enter() al bajar, que
+                     pasa un contexto a los hijos, y leave() al subir,
+                     que recibe los resultados de los hijos
+"""
+
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+
+def preorder(root, children: Optional[Callable[[Any], Sequence]] = None) -> Iterator:
+    """Nodos del árbol en preorden, de izquierda a derecha. Sin `children`
+    se usa el atributo `children` de cada nodo (parse tree)."""
+    pending = [root]
+    if children is None:
+        while pending:
+            node = pending.pop()
+            yield node
+            pending.extend(reversed(node.children))
+    else:
+        while pending:
+            node = pending.pop()
+            yield node
+            pending.extend(reversed(children(node)))
+
+
+class Frame:
+    """Un nodo en la pila de TreeWalker.walk."""
+
+    __slots__ = ("node", "context", "children", "index", "results")
+
+    def __init__(self, node, context) -> None:
+        self.node = node
+        self.context = context
+        self.children: Optional[Sequence] = None
+        self.index = 0
+        self.results: List[Any] = []
+
+
+class TreeWalker:
+    """
+    Recorrido en profundidad sin recursión. Las subclases redefinen:
+
+      children(node)                 hijos a recorrer, en orden
+      enter(node, context)           al llegar al nodo; devuelve el
+                                     contexto que reciben sus hijos
+      leave(node, context, results)  tras recorrer los hijos, con sus
+                                     resultados en orden; devuelve el
+                                     resultado del nodo
+
+    walk(root, context) devuelve el resultado de la raíz. Las excepciones
+    de enter/leave abortan el recorrido como lo harían en uno recursivo.
+    """
+
+    def children(self, node) -> Sequence:
+        return node.children
+
+    def enter(self, node, context):
+        return context
+
+    def leave(self, node, context, results):
+        return None
+
+    def walk(self, root, context=None):
+        stack = [Frame(root, context)]
+        result = None
+        while stack:
+            frame = stack[-1]
+            children = frame.children
+            if children is None:
+                frame.context = self.enter(frame.node, frame.context)
+                children = frame.children = self.children(frame.node)
+            if frame.index < len(children):
+                child = children[frame.index]
+                frame.index += 1
+                context = self.enter(child, frame.context)
+                grandchildren = self.children(child)
+                if not grandchildren:
+                    # Hoja: sin Frame, se sube directamente
+                    frame.results.append(self.leave(child, context, []))
+                    continue
+                child_frame = Frame(child, context)
+                child_frame.children = grandchildren
+                stack.append(child_frame)
+                continue
+            stack.pop()
+            result = self.leave(frame.node, frame.context, frame.results)
+            if stack:
+                stack[-1].results.append(result)
+        return result